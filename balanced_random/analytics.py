@@ -0,0 +1,267 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Statistics of the state of a network from its spikes, computed over flat
+arrays of neuron ids and spike times without looping over neurons.
+
+Each statistic is computed over a window of time, such as one of the phases
+of the input of the balanced random network; see
+:py:func:`phase_statistics`.
+"""
+
+from collections import namedtuple
+import numpy
+
+#: The statistics of one window of time.  The rates (Hz), ISI CVs and Fano
+#: factors are per neuron, NaN where a neuron has too few spikes; the
+#: correlation is the mean over pairs of sampled neurons and the synchrony
+#: is Golomb's chi over all neurons
+WindowStatistics = namedtuple("WindowStatistics", [
+    "start", "end", "mean_rate", "rates", "cv_isi", "fano_factor",
+    "correlation", "synchrony"])
+
+#: The largest number of neuron-bin counts held densely
+_MAX_DENSE = 2 ** 25
+
+
+def in_window(ids, times, start, end):
+    """ The spikes in a window of time
+
+    :param ~numpy.ndarray ids: The neuron of each spike
+    :param ~numpy.ndarray times: The time of each spike in ms
+    :param float start: The start of the window in ms
+    :param float end: The end of the window in ms, not included
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    selected = (times >= start) & (times < end)
+    return ids[selected], times[selected]
+
+
+def rates(ids, n_neurons, duration):
+    """ The rate of each neuron
+
+    :param ~numpy.ndarray ids: The neuron of each spike in the window
+    :param int n_neurons: The number of neurons
+    :param float duration: The length of the window in ms
+    :rtype: ~numpy.ndarray
+    """
+    return numpy.bincount(ids, minlength=n_neurons) * (1000.0 / duration)
+
+
+def cv_isi(ids, times, n_neurons):
+    """ The coefficient of variation of the inter-spike intervals of each
+        neuron, NaN for neurons with fewer than two intervals
+
+    :param ~numpy.ndarray ids: The neuron of each spike
+    :param ~numpy.ndarray times: The time of each spike
+    :param int n_neurons: The number of neurons
+    :rtype: ~numpy.ndarray
+    """
+    # Sort by neuron then time, unless already sorted that way
+    key = ids * (float(times.max(initial=0.0)) + 1.0) + times
+    if len(key) and numpy.any(key[1:] < key[:-1]):
+        order = numpy.argsort(key, kind="stable")
+        ids, times = ids[order], times[order]
+    same = ids[1:] == ids[:-1]
+    isi = numpy.diff(times)[same]
+    isi_ids = ids[1:][same]
+    count = numpy.bincount(isi_ids, minlength=n_neurons)
+    total = numpy.bincount(isi_ids, isi, minlength=n_neurons)
+    square = numpy.bincount(isi_ids, isi * isi, minlength=n_neurons)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        std = numpy.sqrt(numpy.maximum(square / count - mean * mean, 0.0))
+        return numpy.where(count >= 2, std / mean, numpy.nan)
+
+
+def _count_moments(ids, bins, n_neurons, n_bins):
+    """ The sum over bins of the spike count and of its square per neuron
+    """
+    key = ids.astype("int64") * n_bins + bins
+    if n_neurons * n_bins <= _MAX_DENSE:
+        counts = numpy.bincount(key, minlength=n_neurons * n_bins)
+        key = numpy.flatnonzero(counts)
+        counts = counts[key]
+    else:
+        key, counts = numpy.unique(key, return_counts=True)
+    neuron = key // n_bins
+    return (numpy.bincount(neuron, counts, minlength=n_neurons),
+            numpy.bincount(neuron, counts * counts.astype("float64"),
+                           minlength=n_neurons))
+
+
+def fano_factor(ids, times, n_neurons, start, end, bin_ms=100.0):
+    """ The Fano factor of the spike counts in bins of each neuron, NaN for
+        silent neurons
+
+    :param ~numpy.ndarray ids: The neuron of each spike in the window
+    :param ~numpy.ndarray times: The time of each spike in the window
+    :param int n_neurons: The number of neurons
+    :param float start: The start of the window in ms
+    :param float end: The end of the window in ms
+    :param float bin_ms: The length of the bins in ms
+    :rtype: ~numpy.ndarray
+    """
+    n_bins = max(int((end - start) // bin_ms), 1)
+    bins = numpy.minimum(((times - start) // bin_ms).astype("int64"),
+                         n_bins - 1)
+    total, square = _count_moments(ids, bins, n_neurons, n_bins)
+    mean = total / n_bins
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        return (square / n_bins - mean * mean) / mean
+
+
+def synchrony(ids, times, n_neurons, start, end, bin_ms=5.0):
+    """ Golomb's synchrony measure chi: the standard deviation of the binned
+        population activity over the root mean square of the standard
+        deviations of the binned activity of each neuron; about
+        1 / sqrt(n_neurons) when asynchronous and 1 when fully synchronous
+
+    :param ~numpy.ndarray ids: The neuron of each spike in the window
+    :param ~numpy.ndarray times: The time of each spike in the window
+    :param int n_neurons: The number of neurons
+    :param float start: The start of the window in ms
+    :param float end: The end of the window in ms
+    :param float bin_ms: The length of the bins in ms
+    :rtype: float
+    """
+    n_bins = max(int((end - start) // bin_ms), 1)
+    bins = numpy.minimum(((times - start) // bin_ms).astype("int64"),
+                         n_bins - 1)
+    population = numpy.bincount(bins, minlength=n_bins) / n_neurons
+    total, square = _count_moments(ids, bins, n_neurons, n_bins)
+    mean = total / n_bins
+    neuron_variance = numpy.mean(square / n_bins - mean * mean)
+    if neuron_variance <= 0:
+        return float("nan")
+    return float(numpy.sqrt(numpy.var(population) / neuron_variance))
+
+
+def mean_correlation(ids, times, n_neurons, start, end, bin_ms=5.0,
+                     max_neurons=200, seed=None):
+    """ The mean Pearson correlation of the binned spike counts of pairs of
+        neurons, estimated from a random sample of the active neurons
+
+    :param ~numpy.ndarray ids: The neuron of each spike in the window
+    :param ~numpy.ndarray times: The time of each spike in the window
+    :param int n_neurons: The number of neurons
+    :param float start: The start of the window in ms
+    :param float end: The end of the window in ms
+    :param float bin_ms: The length of the bins in ms
+    :param int max_neurons: The most neurons to sample
+    :param int seed: The seed of the sample
+    :rtype: float
+    """
+    n_bins = max(int((end - start) // bin_ms), 1)
+    active = numpy.flatnonzero(numpy.bincount(ids, minlength=n_neurons))
+    if len(active) < 2:
+        return float("nan")
+    if len(active) > max_neurons:
+        active = numpy.sort(numpy.random.RandomState(seed).choice(
+            active, max_neurons, replace=False))
+    row = numpy.full(n_neurons, -1)
+    row[active] = numpy.arange(len(active))
+    sampled = row[ids] >= 0
+    bins = numpy.minimum(
+        ((times[sampled] - start) // bin_ms).astype("int64"), n_bins - 1)
+    counts = numpy.zeros((len(active), n_bins))
+    numpy.add.at(counts, (row[ids[sampled]], bins), 1.0)
+    counts -= counts.mean(axis=1, keepdims=True)
+    norms = numpy.sqrt(numpy.einsum("ij,ij->i", counts, counts))
+    valid = norms > 0
+    counts = counts[valid] / norms[valid, None]
+    n_valid = len(counts)
+    if n_valid < 2:
+        return float("nan")
+    # The sum of all pairwise correlations from the norm of the sum
+    summed = counts.sum(axis=0)
+    total = numpy.dot(summed, summed) - n_valid
+    return float(total / (n_valid * (n_valid - 1)))
+
+
+def window_statistics(ids, times, n_neurons, start, end, count_bin_ms=100.0,
+                      sync_bin_ms=5.0, max_correlated=200, seed=None):
+    """ All the statistics of the spikes in a window of time
+
+    :param ~numpy.ndarray ids: The neuron of each spike
+    :param ~numpy.ndarray times: The time of each spike in ms
+    :param int n_neurons: The number of neurons
+    :param float start: The start of the window in ms
+    :param float end: The end of the window in ms
+    :param float count_bin_ms: The bin length for the Fano factors
+    :param float sync_bin_ms:
+        The bin length for the correlations and synchrony
+    :param int max_correlated: The most neurons to sample for correlations
+    :param int seed: The seed of the sample
+    :rtype: WindowStatistics
+    """
+    ids, times = in_window(numpy.asarray(ids, dtype="int64"),
+                           numpy.asarray(times, dtype="float64"), start, end)
+    neuron_rates = rates(ids, n_neurons, end - start)
+    return WindowStatistics(
+        start, end, float(neuron_rates.mean()), neuron_rates,
+        cv_isi(ids, times, n_neurons),
+        fano_factor(ids, times, n_neurons, start, end, count_bin_ms),
+        mean_correlation(ids, times, n_neurons, start, end, sync_bin_ms,
+                         max_correlated, seed),
+        synchrony(ids, times, n_neurons, start, end, sync_bin_ms))
+
+
+def phase_statistics(spikes, n_neurons, phases, **kwargs):
+    """ The statistics of each phase of a run
+
+    :param ~numpy.ndarray spikes: The (id, time) of each spike
+    :param int n_neurons: The number of neurons
+    :param phases:
+        The run time in ms of each phase, optionally with other values
+        after it, such as the input rate of the phase
+    :param kwargs: Passed on to :py:func:`window_statistics`
+    :rtype: list(WindowStatistics)
+    """
+    spikes = numpy.asarray(spikes)
+    results = list()
+    end = 0.0
+    for phase in phases:
+        run_time = phase[0] if numpy.ndim(phase) else phase
+        start, end = end, end + run_time
+        results.append(window_statistics(
+            spikes[:, 0], spikes[:, 1], n_neurons, start, end, **kwargs))
+    return results
+
+
+def format_statistics(statistics, labels=None):
+    """ Format the summary of some windows as a text table
+
+    :param list(WindowStatistics) statistics: The statistics
+    :param list(str) labels: A label for each window
+    :rtype: str
+    """
+    if labels is None:
+        labels = ["{:g}-{:g} ms".format(s.start, s.end) for s in statistics]
+    lines = ["{:>16} {:>9} {:>8} {:>8} {:>11} {:>9}".format(
+        "window", "rate (Hz)", "CV ISI", "Fano", "correlation",
+        "synchrony")]
+    for label, s in zip(labels, statistics):
+        lines.append(
+            "{:>16} {:9.3f} {:8.3f} {:8.3f} {:11.4f} {:9.4f}".format(
+                label, s.mean_rate, _nan_mean(s.cv_isi),
+                _nan_mean(s.fano_factor), s.correlation, s.synchrony))
+    return "\n".join(lines)
+
+
+def _nan_mean(values):
+    values = values[~numpy.isnan(values)]
+    return float(values.mean()) if len(values) else float("nan")
@@ -0,0 +1,197 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The balanced random network, built from its parameters so that it can be
+run by the example script and by parameter sweeps.
+"""
+
+from collections import namedtuple
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+
+#: The populations of the network
+BalancedNetwork = namedtuple("BalancedNetwork", [
+    "pop_input", "pop_exc", "pop_inh", "stim_exc", "stim_inh"])
+
+#: The run time in ms and the rate of the input in Hz of each phase
+PHASES = ((1000, 0.0), (1000, 50.0), (1000, 10.0), (1000, 20.0))
+
+
+def build_network(sim, n_neurons=500, weight_exc=0.1, weight_inh=None,
+                  weight_input=0.001, stim_rate=1000.0, input_max_rate=50.0,
+                  p_connect=0.1, seed=0, cache=None, splitters=None,
+                  in_degree=None, input_phases=None):
+    """ Create the populations and projections of the network
+
+    :param sim: The simulator, already set up
+    :param int n_neurons: The number of neurons, 80% excitatory
+    :param float weight_exc: The mean excitatory weight
+    :param float weight_inh:
+        The mean inhibitory weight, negative; by default -5 * weight_exc
+    :param float weight_input: The mean weight from the input
+    :param float stim_rate: The rate of the background stimulation in Hz
+    :param float input_max_rate: The highest rate the input will have in Hz
+    :param float p_connect: The probability of recurrent connections
+    :param int seed:
+        The seed of the connectivity, weights, delays and initial voltages;
+        the Poisson sources use this seed and the two after it
+    :param ConnectionCache cache:
+        Where to keep the random connections, generated on the host, so
+        that they are only generated once for each seed; by default the
+        simulator generates them each time
+    :param splitters:
+        A function of the cell class of each population giving the splitter
+        to place it with, or None for the default of the simulator
+    :param int in_degree:
+        If given, each neuron has this many recurrent connections, 80% from
+        excitatory and 20% from inhibitory neurons, and at most this many
+        from the input, instead of connecting with p_connect
+    :param input_phases:
+        The run time in ms and rate in Hz of each phase of the input, to
+        schedule in the source so that all the phases run as one; by
+        default the input is off until its rate is set
+    :rtype: BalancedNetwork
+    """
+    n_exc = int(round(n_neurons * 0.8))
+    n_inh = int(round(n_neurons * 0.2))
+    if weight_inh is None:
+        weight_inh = -5.0 * weight_exc
+    if in_degree is not None and cache is not None:
+        raise ValueError(
+            "The connection cache only holds connections made with "
+            "p_connect")
+    rng = NumpyRNG(seed)
+
+    def additional(cellclass, parameters):
+        splitter = None if splitters is None else splitters(cellclass)
+        if splitter is not None:
+            parameters = dict(parameters, splitter=splitter)
+        return parameters
+
+    def connect(pre, post, connector, synapse, receptor_type, p_conn):
+        if cache is not None:
+            # The weights and delays are in the list
+            connector = sim.FromListConnector(cache.random_connections(
+                pre.size, post.size, p_conn, synapse.weight, synapse.delay,
+                rng))
+            synapse = sim.StaticSynapse()
+        sim.Projection(pre, post, connector, synapse,
+                       receptor_type=receptor_type)
+
+    input_source = sim.SpikeSourcePoisson(rate=0.0)
+    if input_phases is not None:
+        input_source = sim.SpikeSourcePoisson(**rate_schedule(input_phases))
+    pop_input = sim.Population(100, input_source,
+                               additional_parameters=additional(
+                                   sim.SpikeSourcePoisson, {
+                                       "max_rate": input_max_rate,
+                                       "seed": seed}),
+                               label="Input")
+
+    pop_exc = sim.Population(
+        n_exc, sim.IF_curr_exp, label="Excitatory",
+        additional_parameters=additional(sim.IF_curr_exp, {}))
+    pop_inh = sim.Population(
+        n_inh, sim.IF_curr_exp, label="Inhibitory",
+        additional_parameters=additional(sim.IF_curr_exp, {}))
+    stim_exc = sim.Population(
+        n_exc, sim.SpikeSourcePoisson(rate=stim_rate), label="Stim_Exc",
+        additional_parameters=additional(
+            sim.SpikeSourcePoisson, {"seed": seed + 1}))
+    stim_inh = sim.Population(
+        n_inh, sim.SpikeSourcePoisson(rate=stim_rate), label="Stim_Inh",
+        additional_parameters=additional(
+            sim.SpikeSourcePoisson, {"seed": seed + 2}))
+
+    delays_exc = RandomDistribution(
+        "normal_clipped", mu=1.5, sigma=0.75, low=1.0, high=1.6, rng=rng)
+    weights_exc = RandomDistribution(
+        "normal_clipped", mu=weight_exc, sigma=0.1, low=0, high=numpy.inf,
+        rng=rng)
+    if in_degree is None:
+        conn_exc = sim.FixedProbabilityConnector(p_connect, rng=rng)
+    else:
+        conn_exc = sim.FixedNumberPreConnector(
+            min(n_exc, int(round(in_degree * 0.8))), rng=rng)
+    synapse_exc = sim.StaticSynapse(weight=weights_exc, delay=delays_exc)
+    delays_inh = RandomDistribution(
+        "normal_clipped", mu=0.75, sigma=0.375, low=1.0, high=1.6, rng=rng)
+    weights_inh = RandomDistribution(
+        "normal_clipped", mu=weight_inh, sigma=0.1, low=-numpy.inf, high=0,
+        rng=rng)
+    if in_degree is None:
+        conn_inh = sim.FixedProbabilityConnector(p_connect, rng=rng)
+    else:
+        conn_inh = sim.FixedNumberPreConnector(
+            min(n_inh, int(round(in_degree * 0.2))), rng=rng)
+    synapse_inh = sim.StaticSynapse(weight=weights_inh, delay=delays_inh)
+    connect(pop_exc, pop_exc, conn_exc, synapse_exc, "excitatory", p_connect)
+    connect(pop_exc, pop_inh, conn_exc, synapse_exc, "excitatory", p_connect)
+    connect(pop_inh, pop_inh, conn_inh, synapse_inh, "inhibitory", p_connect)
+    connect(pop_inh, pop_exc, conn_inh, synapse_inh, "inhibitory", p_connect)
+
+    conn_stim = sim.OneToOneConnector()
+    synapse_stim = sim.StaticSynapse(weight=weight_exc, delay=1.0)
+    sim.Projection(
+        stim_exc, pop_exc, conn_stim, synapse_stim,
+        receptor_type="excitatory")
+    sim.Projection(
+        stim_inh, pop_inh, conn_stim, synapse_stim,
+        receptor_type="excitatory")
+
+    delays_input = RandomDistribution(
+        "normal_clipped", mu=1.5, sigma=0.75, low=1.0, high=1.6, rng=rng)
+    weights_input = RandomDistribution(
+        "normal_clipped", mu=weight_input, sigma=0.01, low=0, high=numpy.inf,
+        rng=rng)
+    conn_input = sim.AllToAllConnector()
+    if in_degree is not None:
+        conn_input = sim.FixedNumberPreConnector(
+            min(pop_input.size, in_degree), rng=rng)
+    connect(pop_input, pop_exc, conn_input,
+            sim.StaticSynapse(weight=weights_input, delay=delays_input),
+            "excitatory", 1.0)
+
+    pop_exc.initialize(
+        v=RandomDistribution("uniform", low=-65.0, high=-55.0, rng=rng))
+    pop_inh.initialize(
+        v=RandomDistribution("uniform", low=-65.0, high=-55.0, rng=rng))
+
+    return BalancedNetwork(pop_input, pop_exc, pop_inh, stim_exc, stim_inh)
+
+
+def rate_schedule(phases=PHASES):
+    """ The parameters of a SpikeSourcePoisson that goes through the phases
+
+    :param phases: The run time in ms and rate in Hz of each phase
+    :rtype: dict(str, list(float))
+    """
+    starts = numpy.cumsum([0.0] + [run_time for run_time, _ in phases[:-1]])
+    return {"rates": [float(rate) for _, rate in phases],
+            "starts": starts.tolist(),
+            "durations": [float(run_time) for run_time, _ in phases]}
+
+
+def run_phases(sim, network, phases=PHASES):
+    """ Run each phase with the input at its rate
+
+    :param sim: The simulator
+    :param BalancedNetwork network: The network
+    :param phases: The run time in ms and input rate in Hz of each phase
+    """
+    for run_time, rate in phases:
+        network.pop_input.set(rate=rate)
+        sim.run(run_time)
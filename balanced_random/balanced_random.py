@@ -14,102 +14,38 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import matplotlib.pyplot as pylab
-import numpy
-from pyNN.random import RandomDistribution
-from pyNN.utility.plotting import Figure, Panel
 import pyNN.spiNNaker as p
+from balanced_random.analytics import format_statistics, phase_statistics
+from balanced_random.balanced_network import PHASES, build_network
+from spike_data.columns import SpikeColumns
+from spike_data.raster import show_raster
 
 p.setup(timestep=0.1)
 p.set_number_of_neurons_per_core(p.IF_curr_exp, 64)
 p.set_number_of_neurons_per_core(p.SpikeSourcePoisson, 64)
-n_neurons = 500
-n_exc = int(round(n_neurons * 0.8))
-n_inh = int(round(n_neurons * 0.2))
-weight_exc = 0.1
-weight_inh = -5.0 * weight_exc
-weight_input = 0.001
-rng = p.NumpyRNG(0)
-
-pop_input = p.Population(100, p.SpikeSourcePoisson(rate=0.0),
-                         additional_parameters={
-                             "max_rate": 50.0,
-                             "seed": 0},
-                         label="Input")
-
-pop_exc = p.Population(n_exc, p.IF_curr_exp, label="Excitatory")
-pop_inh = p.Population(n_inh, p.IF_curr_exp, label="Inhibitory")
-stim_exc = p.Population(
-    n_exc, p.SpikeSourcePoisson(rate=1000.0), label="Stim_Exc",
-    additional_parameters={"seed": 1})
-stim_inh = p.Population(
-    n_inh, p.SpikeSourcePoisson(rate=1000.0), label="Stim_Inh",
-    additional_parameters={"seed": 2})
-
-delays_exc = RandomDistribution(
-    "normal_clipped", mu=1.5, sigma=0.75, low=1.0, high=1.6, rng=rng)
-weights_exc = RandomDistribution(
-    "normal_clipped", mu=weight_exc, sigma=0.1, low=0, high=numpy.inf, rng=rng)
-conn_exc = p.FixedProbabilityConnector(0.1, rng=rng)
-synapse_exc = p.StaticSynapse(weight=weights_exc, delay=delays_exc)
-delays_inh = RandomDistribution(
-    "normal_clipped", mu=0.75, sigma=0.375, low=1.0, high=1.6, rng=rng)
-weights_inh = RandomDistribution(
-    "normal_clipped", mu=weight_inh, sigma=0.1, low=-numpy.inf, high=0,
-    rng=rng)
-conn_inh = p.FixedProbabilityConnector(0.1, rng=rng)
-synapse_inh = p.StaticSynapse(weight=weights_inh, delay=delays_inh)
-p.Projection(
-    pop_exc, pop_exc, conn_exc, synapse_exc, receptor_type="excitatory")
-p.Projection(
-    pop_exc, pop_inh, conn_exc, synapse_exc, receptor_type="excitatory")
-p.Projection(
-    pop_inh, pop_inh, conn_inh, synapse_inh, receptor_type="inhibitory")
-p.Projection(
-    pop_inh, pop_exc, conn_inh, synapse_inh, receptor_type="inhibitory")
-
-conn_stim = p.OneToOneConnector()
-synapse_stim = p.StaticSynapse(weight=weight_exc, delay=1.0)
-p.Projection(
-    stim_exc, pop_exc, conn_stim, synapse_stim, receptor_type="excitatory")
-p.Projection(
-    stim_inh, pop_inh, conn_stim, synapse_stim, receptor_type="excitatory")
-
-delays_input = RandomDistribution(
-    "normal_clipped", mu=1.5, sigma=0.75, low=1.0, high=1.6, rng=rng)
-weights_input = RandomDistribution(
-    "normal_clipped", mu=weight_input, sigma=0.01, low=0, high=numpy.inf,
-    rng=rng)
-p.Projection(pop_input, pop_exc, p.AllToAllConnector(), p.StaticSynapse(
-    weight=weights_input, delay=delays_input))
-
-pop_exc.initialize(
-    v=RandomDistribution("uniform", low=-65.0, high=-55.0, rng=rng))
-pop_inh.initialize(
-    v=RandomDistribution("uniform", low=-65.0, high=-55.0, rng=rng))
 
+network = build_network(
+    p, n_neurons=500, weight_exc=0.1, weight_input=0.001, seed=0,
+    input_phases=PHASES)
+pop_exc = network.pop_exc
 pop_exc.record("spikes")
 
-p.run(1000)
-
-pop_input.set(rate=50.0)
-p.run(1000)
-
-pop_input.set(rate=10.0)
-p.run(1000)
-
-pop_input.set(rate=20.0)
-p.run(1000)
+# The input goes through its phases in one run
+p.run(sum(run_time for run_time, _ in PHASES))
 
-data = pop_exc.get_data("spikes")
 end_time = p.get_current_time()
+spikes = SpikeColumns.from_populations([pop_exc], t_stop=end_time)
+statistics = phase_statistics(spikes.as_array(), pop_exc.size, PHASES)
 
 p.end()
 
-Figure(
-    # raster plot of the presynaptic neuron spike times
-    Panel(data.segments[0].spiketrains,
-          yticks=True, markersize=2.0, xlim=(0, end_time)),
-    title="Balanced Random Network",
-    annotations="Simulated with {}".format(p.name())
-)
+print(format_statistics(
+    statistics, ["input {:g} Hz".format(rate) for _, rate in PHASES]))
+# raster plot of the presynaptic neuron spike times
+pylab.figure(figsize=(8, 4))
+show_raster(pylab.gca(), spikes, t_stop=end_time, colours=["#000000"])
+pylab.xlabel("Time (ms)")
+pylab.ylabel("Neuron index")
+pylab.title("Balanced Random Network")
+pylab.figtext(0.01, 0.01, "Simulated with {}".format(p.name()), fontsize=6)
 pylab.show()
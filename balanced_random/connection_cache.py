@@ -0,0 +1,178 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+A cache on disk of randomly generated connections.
+
+Connections are generated from a NumpyRNG, so the same connector,
+population sizes, weight and delay distributions and RNG state always give
+the same connections.  The cache keys each list of connections by a hash of
+all of these, and stores it as a .npy file of (pre, post, weight, delay)
+rows that is memory-mapped rather than read when it is found again.  The
+state of the RNG after generating the connections is stored too, and
+restored on a hit, so later random draws are the same whether or not the
+connections came from the cache.
+"""
+
+import hashlib
+import json
+import os
+import numpy
+
+#: Changed whenever the generated connections would change
+_VERSION = 1
+
+#: The most random numbers drawn at once when sampling a connection matrix
+_MAX_BLOCK = 2 ** 22
+
+
+def _describe(value):
+    """ A description of a weight or delay that can be hashed
+    """
+    if hasattr(value, "parameters"):
+        return {"distribution": value.name, "parameters": value.parameters}
+    return value
+
+
+def _rng_digest(rng):
+    name, keys, pos, has_gauss, cached_gaussian = rng.rng.get_state()
+    digest = hashlib.sha256(keys.tobytes())
+    digest.update(repr((name, pos, has_gauss, cached_gaussian)).encode())
+    return digest.hexdigest()
+
+
+def random_connections(n_pre, n_post, p_connect, weights, delays, rng,
+                       allow_self_connections=True):
+    """ Generate connections between each pair of neurons with a probability,
+        with weights and delays that are values or RandomDistributions
+
+    :param int n_pre: The size of the pre-population
+    :param int n_post: The size of the post-population
+    :param float p_connect:
+        The probability of each connection; 1 connects all without drawing
+    :param weights: The weights
+    :param delays: The delays in ms
+    :param ~pyNN.random.NumpyRNG rng: The source of the connections
+    :param bool allow_self_connections:
+        Whether neuron i can connect to neuron i
+    :return: The (pre, post, weight, delay) of each connection
+    :rtype: ~numpy.ndarray
+    """
+    rows = max(1, _MAX_BLOCK // max(n_post, 1))
+    pres = [numpy.zeros(0, "int64")]
+    posts = [numpy.zeros(0, "int64")]
+    for first in range(0, n_pre, rows):
+        n_rows = min(rows, n_pre - first)
+        if p_connect >= 1:
+            pre, post = numpy.divmod(numpy.arange(n_rows * n_post), n_post)
+        else:
+            pre, post = numpy.nonzero(
+                rng.rng.uniform(size=(n_rows, n_post)) < p_connect)
+        pres.append(pre + first)
+        posts.append(post)
+    pre = numpy.concatenate(pres)
+    post = numpy.concatenate(posts)
+    if not allow_self_connections:
+        keep = pre != post
+        pre, post = pre[keep], post[keep]
+    connections = numpy.empty((len(pre), 4))
+    connections[:, 0] = pre
+    connections[:, 1] = post
+    for column, value in ((2, weights), (3, delays)):
+        if hasattr(value, "next"):
+            connections[:, column] = numpy.reshape(
+                value.next(len(pre)), len(pre))
+        else:
+            connections[:, column] = value
+    return connections
+
+
+class ConnectionCache(object):
+    """ A directory of generated connections
+    """
+
+    __slots__ = ["__directory", "__n_hits", "__n_misses"]
+
+    def __init__(self, directory):
+        """
+        :param str directory: The directory, created if needed
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__n_hits = 0
+        self.__n_misses = 0
+
+    @property
+    def n_hits(self):
+        """ The number of lists of connections found in the cache
+
+        :rtype: int
+        """
+        return self.__n_hits
+
+    @property
+    def n_misses(self):
+        """ The number of lists of connections generated
+
+        :rtype: int
+        """
+        return self.__n_misses
+
+    def random_connections(self, n_pre, n_post, p_connect, weights, delays,
+                           rng, allow_self_connections=True):
+        """ As :py:func:`random_connections`, but from the cache if there
+
+        :return:
+            The (pre, post, weight, delay) of each connection, read-only and
+            memory-mapped
+        :rtype: ~numpy.ndarray
+        """
+        key = json.dumps({
+            "version": _VERSION, "connector": "random_connections",
+            "n_pre": n_pre, "n_post": n_post, "p_connect": p_connect,
+            "allow_self_connections": allow_self_connections,
+            "weights": _describe(weights), "delays": _describe(delays),
+            "rng_seed": rng.seed, "rng_state": _rng_digest(rng)},
+            sort_keys=True)
+        name = hashlib.sha256(key.encode()).hexdigest()
+        path = os.path.join(self.__directory, name + ".npy")
+        state_path = os.path.join(self.__directory, name + ".rng.npz")
+        if os.path.exists(path):
+            self.__n_hits += 1
+            with numpy.load(state_path) as state:
+                rng.rng.set_state((
+                    str(state["name"]), state["keys"], int(state["pos"]),
+                    int(state["has_gauss"]),
+                    float(state["cached_gaussian"])))
+            return numpy.load(path, mmap_mode="r")
+
+        self.__n_misses += 1
+        connections = random_connections(
+            n_pre, n_post, p_connect, weights, delays, rng,
+            allow_self_connections)
+        rng_name, keys, pos, has_gauss, cached_gaussian = rng.rng.get_state()
+        # Each file is written under another name first so that it is only
+        # ever found complete, and the state before the list as the list
+        # alone is what marks a hit
+        temp_path = "{}.{}.tmp".format(state_path, os.getpid())
+        with open(temp_path, "wb") as f:
+            numpy.savez(f, name=rng_name, keys=keys, pos=pos,
+                        has_gauss=has_gauss, cached_gaussian=cached_gaussian)
+        os.replace(temp_path, state_path)
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp_path, "wb") as f:
+            numpy.save(f, connections)
+        os.replace(temp_path, path)
+        return numpy.load(path, mmap_mode="r")
@@ -0,0 +1,233 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measure how the host side of the balanced random network scales, e.g.::
+
+    python -m balanced_random.scaling --max-neurons 100000 \\
+        --compare balanced_random/scaling_baseline.json
+
+The network keeps its 80/20 split of excitatory and inhibitory neurons but
+has a fixed in-degree, so the connections grow linearly with the neurons.
+Each size is built, run and read back in a fresh process, recording the
+build time, connections generated per second, peak memory, real-time factor
+(wall time over simulated time) and spikes extracted per second.  On a
+board the connections are generated when the first run maps the network,
+so the build time only covers the Python side and the run time includes
+mapping and loading.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import importlib
+import json
+import platform
+import sys
+import time
+import numpy
+from balanced_random.balanced_network import build_network
+from balanced_random.sweep import BACKENDS
+try:
+    import resource
+except ImportError:  # Not on Windows
+    resource = None
+
+#: The sizes of the family, by decade
+SIZES = (1000, 10000, 100000, 1000000)
+
+#: The measures compared with a baseline, and whether higher is better
+MEASURES = (
+    ("build_time", False), ("connections_per_second", True),
+    ("peak_rss_bytes", False), ("real_time_factor", False),
+    ("spikes_per_second", True))
+
+
+def _peak_rss():
+    """ The peak resident set size of this process in bytes, if known
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def connection_count(n_neurons, in_degree, n_input=100):
+    """ The number of connections of a network with a fixed in-degree,
+        including the one-to-one stimulation
+
+    :param int n_neurons: The number of neurons
+    :param int in_degree: The recurrent connections of each neuron
+    :param int n_input: The size of the input population
+    :rtype: int
+    """
+    n_exc = int(round(n_neurons * 0.8))
+    n_inh = int(round(n_neurons * 0.2))
+    k_exc = min(n_exc, int(round(in_degree * 0.8)))
+    k_inh = min(n_inh, int(round(in_degree * 0.2)))
+    k_input = min(n_input, in_degree)
+    return (n_exc * (k_exc + k_inh + k_input) + n_inh * (k_exc + k_inh) +
+            n_exc + n_inh)
+
+
+def measure_size(n_neurons, backend="local", in_degree=100, run_time=1000.0,
+                 timestep=0.1, input_rate=20.0, neurons_per_core=64, seed=0):
+    """ Build, run and read back one network of the family
+
+    :param int n_neurons: The number of neurons
+    :param str backend: The name of the backend to run on
+    :param int in_degree: The recurrent connections of each neuron
+    :param float run_time: The simulated time in ms
+    :param float timestep: The time step in ms
+    :param float input_rate: The rate of the input in Hz
+    :param int neurons_per_core: The neurons per core of each population
+    :param int seed: The seed of the network
+    :rtype: dict
+    """
+    sim = importlib.import_module(BACKENDS[backend])
+    sim.setup(timestep=timestep)
+    sim.set_number_of_neurons_per_core(sim.IF_curr_exp, neurons_per_core)
+    sim.set_number_of_neurons_per_core(
+        sim.SpikeSourcePoisson, neurons_per_core)
+    start = time.perf_counter()
+    network = build_network(
+        sim, n_neurons=n_neurons, in_degree=in_degree, seed=seed)
+    network.pop_exc.record("spikes")
+    build_time = time.perf_counter() - start
+
+    network.pop_input.set(rate=input_rate)
+    start = time.perf_counter()
+    sim.run(run_time)
+    run_wall_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spikes = network.pop_exc.spinnaker_get_data("spikes")
+    extraction_time = time.perf_counter() - start
+    sim.end()
+
+    n_connections = connection_count(
+        n_neurons, in_degree, network.pop_input.size)
+    return {
+        "n_neurons": n_neurons,
+        "n_connections": n_connections,
+        "build_time": build_time,
+        "connections_per_second": n_connections / build_time,
+        "peak_rss_bytes": _peak_rss(),
+        "run_wall_time": run_wall_time,
+        "real_time_factor": run_wall_time / (run_time / 1000.0),
+        "n_spikes": len(spikes),
+        "extraction_time": extraction_time,
+        "spikes_per_second": len(spikes) / max(extraction_time, 1e-9)}
+
+
+def run_family(sizes=SIZES, **kwargs):
+    """ Measure each size in a fresh process, so that the peak memory is
+        that of one size, stopping at the first size that fails
+
+    :param list(int) sizes: The numbers of neurons
+    :param kwargs: The other arguments of :py:func:`measure_size`
+    :return: The record of each size, the last with an "error" if it failed
+    :rtype: list(dict)
+    """
+    records = list()
+    for n_neurons in sizes:
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                record = executor.submit(
+                    measure_size, n_neurons, **kwargs).result()
+        except (BrokenProcessPool, MemoryError) as e:
+            # The process was killed or ran out of memory
+            records.append({"n_neurons": n_neurons,
+                            "error": "{}: {}".format(type(e).__name__, e)})
+            break
+        records.append(record)
+        print("{n_neurons:8d} neurons: {n_connections} connections built "
+              "in {build_time:.2f} s, {peak_rss_bytes} B peak, real-time "
+              "factor {real_time_factor:.2f}, {spikes_per_second:.3g} "
+              "spikes/s extracted".format(**record))
+    return records
+
+
+def compare(records, baseline):
+    """ The ratio of each measure to the baseline at the same size, where
+        above 1 is better
+
+    :param list(dict) records: The records of this run
+    :param list(dict) baseline: The records of the baseline
+    :rtype: list(dict)
+    """
+    by_size = {r["n_neurons"]: r for r in baseline if "error" not in r}
+    comparison = list()
+    for record in records:
+        base = by_size.get(record["n_neurons"])
+        if base is None or "error" in record:
+            continue
+        row = {"n_neurons": record["n_neurons"]}
+        for measure, higher_is_better in MEASURES:
+            if not record.get(measure) or not base.get(measure):
+                row[measure] = None
+            elif higher_is_better:
+                row[measure] = record[measure] / base[measure]
+            else:
+                row[measure] = base[measure] / record[measure]
+        comparison.append(row)
+    return comparison
+
+
+def _environment():
+    return {"platform": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--max-neurons", type=int,
+                        help="leave out larger sizes")
+    parser.add_argument("--backend", choices=sorted(BACKENDS),
+                        default="local")
+    parser.add_argument("--in-degree", type=int, default=100)
+    parser.add_argument("--run-time", type=float, default=1000.0)
+    parser.add_argument("--timestep", type=float, default=0.1)
+    parser.add_argument("--neurons-per-core", type=int, default=64)
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="JSON of an earlier run to compare with")
+    parser.add_argument("--output", default="scaling.json")
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in args.sizes
+             if args.max_neurons is None or size <= args.max_neurons]
+    records = run_family(
+        sizes, backend=args.backend, in_degree=args.in_degree,
+        run_time=args.run_time, timestep=args.timestep,
+        neurons_per_core=args.neurons_per_core)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"parameters": vars(args), "environment": _environment(),
+                   "results": records}, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        for row in compare(records, baseline):
+            print("{:8d} neurons vs baseline: ".format(row["n_neurons"]) +
+                  ", ".join(
+                      "{} {}".format(measure, "-" if row[measure] is None
+                                     else "{:.2f}x".format(row[measure]))
+                      for measure, _ in MEASURES))
+
+
+if __name__ == "__main__":
+    main()
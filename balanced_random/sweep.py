@@ -0,0 +1,215 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Sweep the parameters of the balanced random network in parallel, e.g.::
+
+    python -m balanced_random.sweep --grid weight_exc=0.05,0.1,0.2 \\
+        --grid weight_input=0.001,0.002 --seeds 0 1 --output sweep.csv
+
+or with --random N and --range name=low:high to sample N points uniformly.
+Each point is built and run in a worker process with its own seed, so any
+row of the table can be reproduced by running that point again.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import importlib
+import itertools
+import time
+import numpy
+from balanced_random.analytics import cv_isi
+from balanced_random.balanced_network import PHASES, build_network, run_phases
+from balanced_random.connection_cache import ConnectionCache
+
+#: The backends that points can be run on
+BACKENDS = {"local": "local_engine.spinnaker", "spinnaker": "pyNN.spiNNaker"}
+
+
+def grid(**values):
+    """ Every combination of the given values
+
+    :param values: The values of each parameter
+    :rtype: list(dict)
+    """
+    names = sorted(values)
+    return [dict(zip(names, combination))
+            for combination in itertools.product(
+                *[values[name] for name in names])]
+
+
+def random_search(n_points, seed=None, **ranges):
+    """ Points with each parameter drawn uniformly from its range
+
+    :param int n_points: The number of points
+    :param int seed: The seed of the search
+    :param ranges: The (low, high) range of each parameter
+    :rtype: list(dict)
+    """
+    rng = numpy.random.RandomState(seed)
+    names = sorted(ranges)
+    samples = {name: rng.uniform(*ranges[name], size=n_points)
+               for name in names}
+    return [{name: float(samples[name][i]) for name in names}
+            for i in range(n_points)]
+
+
+def with_seeds(points, seeds):
+    """ Each point with each seed
+
+    :param list(dict) points: The points
+    :param list(int) seeds: The seeds of the network
+    :rtype: list(dict)
+    """
+    return [dict(point, seed=seed) for point in points for seed in seeds]
+
+
+def summarise_spikes(spikes, n_neurons, phases=PHASES):
+    """ Summary statistics of the spikes of a population
+
+    :param ~numpy.ndarray spikes: The (id, time) of each spike
+    :param int n_neurons: The number of neurons in the population
+    :param phases: The run time and input rate of each phase
+    :rtype: dict
+    """
+    ids = spikes[:, 0].astype("int64")
+    times = spikes[:, 1]
+    summary = {"n_spikes": len(times)}
+    end = 0.0
+    for i, (run_time, rate) in enumerate(phases):
+        start, end = end, end + run_time
+        n_spikes = numpy.count_nonzero((times >= start) & (times < end))
+        summary["rate_{}_{:g}Hz".format(i, rate)] = (
+            n_spikes / n_neurons / (run_time / 1000.0))
+    summary["silent_fraction"] = 1.0 - len(numpy.unique(ids)) / n_neurons
+    cv = cv_isi(ids, times, n_neurons)
+    # Over the neurons with at least two intervals
+    summary["mean_cv_isi"] = (
+        float(numpy.nanmean(cv)) if numpy.any(~numpy.isnan(cv))
+        else float("nan"))
+    return summary
+
+
+def run_point(point, backend="local", cache_dir=None, timestep=0.1):
+    """ Build and run the network at one point, returning its summary
+
+    :param dict point: The parameters of build_network, including the seed
+    :param str backend: The name of the backend to run on
+    :param str cache_dir: The directory of the connection cache, if any
+    :param float timestep: The simulation time step in ms
+    :rtype: dict
+    """
+    sim = importlib.import_module(BACKENDS[backend])
+    start = time.perf_counter()
+    sim.setup(timestep=timestep)
+    sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 64)
+    sim.set_number_of_neurons_per_core(sim.SpikeSourcePoisson, 64)
+    cache = None
+    if cache_dir is not None:
+        cache = ConnectionCache(cache_dir)
+    network = build_network(sim, cache=cache, **point)
+    network.pop_exc.record("spikes")
+    run_phases(sim, network)
+    spikes = network.pop_exc.spinnaker_get_data("spikes")
+    sim.end()
+    record = dict(point)
+    record.update(summarise_spikes(spikes, network.pop_exc.size))
+    record["wall_time"] = time.perf_counter() - start
+    return record
+
+
+def run_sweep(points, backend="local", max_workers=None, cache_dir=None):
+    """ Run the points in parallel in worker processes
+
+    :param list(dict) points: The points to run
+    :param str backend: The name of the backend to run on
+    :param int max_workers: The number of processes; by default one per CPU
+    :param str cache_dir: The directory of the connection cache, if any
+    :return: The summary of each point, in the order of the points
+    :rtype: list(dict)
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            run_point, points, itertools.repeat(backend),
+            itertools.repeat(cache_dir)))
+
+
+def format_table(records):
+    """ Format the records as an aligned text table
+
+    :param list(dict) records: The records, all with the same keys
+    :rtype: str
+    """
+    columns = list(records[0])
+    cells = [columns] + [
+        ["{:.4g}".format(r[c]) if isinstance(r[c], float) else str(r[c])
+         for c in columns] for r in records]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths))
+        for row in cells)
+
+
+def _parse_values(text):
+    name, values = text.split("=", 1)
+    return name, [float(value) for value in values.split(",")]
+
+
+def _parse_range(text):
+    name, values = text.split("=", 1)
+    low, high = values.split(":")
+    return name, (float(low), float(high))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--grid", action="append", type=_parse_values,
+                        default=[], metavar="NAME=V1,V2,...",
+                        help="values of a parameter to sweep")
+    parser.add_argument("--random", type=int, metavar="N",
+                        help="sample N points from the ranges instead")
+    parser.add_argument("--range", action="append", type=_parse_range,
+                        default=[], metavar="NAME=LOW:HIGH",
+                        help="range of a parameter to sample")
+    parser.add_argument("--search-seed", type=int, default=0)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0],
+                        help="seeds of the network run at each point")
+    parser.add_argument("--backend", choices=sorted(BACKENDS),
+                        default="local")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", metavar="DIR",
+                        help="keep the random connections in this directory")
+    parser.add_argument("--output", help="CSV file of the results")
+    args = parser.parse_args(argv)
+
+    if args.random:
+        points = random_search(
+            args.random, args.search_seed, **dict(args.range))
+    else:
+        points = grid(**dict(args.grid))
+    records = run_sweep(
+        with_seeds(points, args.seeds), args.backend, args.workers,
+        args.cache)
+    print(format_table(records))
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+
+
+if __name__ == "__main__":
+    main()
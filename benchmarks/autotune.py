@@ -0,0 +1,505 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Choose the neurons per core and splitters of a network, e.g.::
+
+    python -m benchmarks.autotune balanced_random --calibration-time 400
+
+Each candidate partitioning is scored by a cost model of the time each core
+needs per time step, from the neurons it updates and the spikes and synaptic
+events it receives; a candidate is feasible if every core keeps to the time
+step, its input buffer does not overflow and its delays fit.  The traffic
+comes from a short calibration run on the local engine, or from the rates
+of the sources and a default rate for neurons.  With a board, the best
+candidates are then run for real and the one with no dropped spikes and the
+fewest cores (or least time) is chosen.
+"""
+
+import argparse
+import itertools
+import math
+import time
+from collections import namedtuple
+import numpy
+from benchmarks.instrument import (
+    ScriptRecorder, estimate_cores, spinnaker_provenance)
+from local_engine.models import expand
+
+#: How a network is split over cores; n_synapse_vertices of 0 is not split
+PartitionConfig = namedtuple("PartitionConfig", [
+    "neurons_per_core", "n_synapse_vertices", "max_delay",
+    "allow_delay_extension"])
+
+#: The times in microseconds and limits of a core in the cost model
+CostModel = namedtuple("CostModel", [
+    "overhead_us", "neuron_us", "poisson_us", "packet_us", "synapse_us",
+    "input_buffer", "peak_factor", "max_neurons_per_core", "max_core_delay"],
+    defaults=[10.0, 0.5, 0.25, 1.0, 0.1, 256, 2.0, 256, 16])
+
+#: The traffic of a network measured on the local engine
+NetworkProfile = namedtuple("NetworkProfile", [
+    "populations", "projections", "timestep"])
+
+#: The cost model's view of one configuration; slowdown is the time scale
+#: factor the busiest core needs to keep up
+Estimate = namedtuple("Estimate", [
+    "config", "n_cores", "max_load_us", "max_packets", "slowdown",
+    "feasible", "reason"])
+
+#: What a run of one configuration on a board measured
+Calibration = namedtuple("Calibration", [
+    "config", "n_cores", "dropped_spikes", "mapping_time", "load_time",
+    "run_time"])
+
+#: The chosen configuration, with the estimates and calibration runs
+TuningResult = namedtuple("TuningResult", [
+    "best", "estimates", "calibrations"])
+
+#: The models that are spike sources rather than neurons
+SOURCES = ("SpikeSourcePoisson", "SpikeSourceArray")
+
+
+def candidate_configs(neurons_per_core=(16, 32, 64, 128, 192, 256),
+                      n_synapse_vertices=(0, 1, 2),
+                      max_delays=(16, 64, 128),
+                      allow_delay_extension=(False, True)):
+    """ Every combination of the settings, with only one unsplit
+        configuration for each neurons per core
+
+    :rtype: list(PartitionConfig)
+    """
+    configs = list()
+    for per_core, n_synapse in itertools.product(
+            neurons_per_core, n_synapse_vertices):
+        if n_synapse == 0:
+            configs.append(PartitionConfig(per_core, 0, None, True))
+            continue
+        for max_delay, allow in itertools.product(
+                max_delays, allow_delay_extension):
+            configs.append(
+                PartitionConfig(per_core, n_synapse, max_delay, allow))
+    return configs
+
+
+def _splitter_module(sim):
+    # pylint: disable=import-outside-toplevel
+    if sim.__name__.startswith("local_engine"):
+        from local_engine import splitters
+    else:
+        from spynnaker.pyNN.extra_algorithms import (
+            splitter_components as splitters)
+    return splitters
+
+
+def splitter_factory(config, sim):
+    """ A function giving a new splitter for a population of a cell class,
+        as the network builders take; neurons get split into neuron and
+        synapse cores and Poisson sources are delegated to synapse cores
+
+    :param PartitionConfig config: The configuration
+    :param sim: The simulator module
+    :rtype: callable or None
+    """
+    if config is None or not config.n_synapse_vertices:
+        return None
+    splitters = _splitter_module(sim)
+
+    def splitter(cellclass):
+        name = cellclass.__name__ if isinstance(cellclass, type) \
+            else type(cellclass).__name__
+        if name == "SpikeSourcePoisson":
+            return splitters.SplitterPoissonDelegate()
+        if name in SOURCES:
+            return None
+        return splitters.SplitterAbstractPopulationVertexNeuronsSynapses(
+            config.n_synapse_vertices, config.max_delay,
+            config.allow_delay_extension)
+    return splitter
+
+
+def _source_rate(population):
+    parameters = population.celltype.parameters
+    if parameters.get("rates") is not None:
+        # The busiest segment of a schedule
+        return float(numpy.max(numpy.hstack(parameters["rates"])))
+    return float(numpy.mean(expand(parameters["rate"], population.size)))
+
+
+def profile_network(builder, timestep=1.0, calibration_time=None,
+                    runner=None, default_rate=10.0):
+    """ Build a network on the local engine and measure its connections and
+        the rate of each population
+
+    :param callable builder:
+        Builds the network given the simulator and a splitter function (or
+        None); returns anything the runner needs
+    :param float timestep: The time step in ms
+    :param calibration_time:
+        How long to run to measure the rates in ms; by default the rates
+        are those of the Poisson sources and default_rate for the rest
+    :param callable runner:
+        Runs the network given the simulator, what the builder returned and
+        the calibration time; by default just runs that long
+    :param float default_rate: The assumed rate of neurons in Hz
+    :rtype: NetworkProfile
+    """
+    # pylint: disable=import-outside-toplevel
+    from local_engine import spinnaker as sim
+    recorder = ScriptRecorder(sim, "local")
+    try:
+        sim.setup(timestep=timestep)
+        network = builder(sim, None)
+        objects = recorder.population_objects
+        if calibration_time:
+            for population in objects:
+                population.record("spikes")
+            if runner is None:
+                sim.run(calibration_time)
+            else:
+                runner(sim, network, calibration_time)
+        populations = list()
+        for info, population in zip(recorder.populations, objects):
+            if calibration_time:
+                n_spikes = len(population.spinnaker_get_data("spikes"))
+                rate = n_spikes * 1000.0 / (
+                    population.size * sim.get_current_time())
+            elif info["model"] == "SpikeSourcePoisson":
+                rate = _source_rate(population)
+            else:
+                rate = default_rate
+            populations.append(dict(info, rate=rate))
+        projections = list()
+        for info, projection in zip(
+                recorder.projections, recorder.projection_objects):
+            delays = numpy.asarray(projection.getDelays())
+            projections.append(dict(
+                info, n_connections=len(projection),
+                max_delay_steps=int(round(
+                    delays.max() / timestep)) if len(delays) else 0))
+        sim.end()
+    finally:
+        recorder.restore()
+    return NetworkProfile(populations, projections, timestep)
+
+
+def _splitter_info(config, model):
+    if not config.n_synapse_vertices:
+        return None
+    if model == "SpikeSourcePoisson":
+        return ("SplitterPoissonDelegate", [])
+    if model in SOURCES:
+        return None
+    return ("SplitterAbstractPopulationVertexNeuronsSynapses", [
+        config.n_synapse_vertices, config.max_delay,
+        config.allow_delay_extension])
+
+
+def evaluate(profile, config, cost=CostModel(), time_scale_factor=1.0):
+    """ Estimate the cores and the load of the busiest core of a network
+        with a configuration
+
+    :param NetworkProfile profile: The network
+    :param PartitionConfig config: The configuration
+    :param CostModel cost: The cost model
+    :param float time_scale_factor: How much slower than real time it runs
+    :rtype: Estimate
+    """
+    per_core = config.neurons_per_core
+    populations = [dict(p, splitter=_splitter_info(config, p["model"]))
+                   for p in profile.populations]
+    limits = {p["model"]: per_core for p in populations}
+    n_cores = estimate_cores(populations, profile.projections, limits)
+    if per_core > cost.max_neurons_per_core:
+        return Estimate(config, n_cores, None, None, None, False,
+                        "too many neurons per core")
+    split = bool(config.n_synapse_vertices)
+    reasons = list()
+
+    # Delays beyond what the cores hold need a delay extension core for
+    # each slice of the source
+    core_delay = config.max_delay if split else cost.max_core_delay
+    extended = set()
+    for projection in profile.projections:
+        if projection["max_delay_steps"] > core_delay:
+            if split and not config.allow_delay_extension:
+                reasons.append("delays too long")
+            extended.add(projection["pre"])
+    for index in extended:
+        n_cores += int(math.ceil(populations[index]["size"] / per_core))
+
+    # Whether each Poisson source runs on the synapse cores of its target
+    delegated = set()
+    if split:
+        for index, population in enumerate(populations):
+            outgoing = [p for p in profile.projections if p["pre"] == index]
+            if population["model"] == "SpikeSourcePoisson" and outgoing \
+                    and all(p["connector"] == "OneToOneConnector" and
+                            populations[p["post"]]["model"] not in SOURCES
+                            for p in outgoing):
+                delegated.add(index)
+
+    dt = profile.timestep
+    max_load = 0.0
+    max_packets = 0.0
+    for index, population in enumerate(populations):
+        size = population["size"]
+        n_slice = min(per_core, size)
+        if population["model"] in SOURCES:
+            if index not in delegated:
+                max_load = max(max_load, cost.overhead_us +
+                               n_slice * cost.poisson_us)
+            continue
+        packets = 0.0
+        events = 0.0
+        sources = 0.0
+        for projection in profile.projections:
+            if projection["post"] != index:
+                continue
+            pre = populations[projection["pre"]]
+            spikes = pre["rate"] * pre["size"] * dt / 1000.0
+            targets = projection["n_connections"] * n_slice / float(size)
+            events += pre["rate"] * dt / 1000.0 * targets
+            if projection["pre"] in delegated:
+                sources += n_slice
+            elif projection["connector"] == "OneToOneConnector":
+                packets += spikes * n_slice / float(size)
+            else:
+                # The chance a source has any target in the slice
+                packets += spikes * (1.0 - math.exp(
+                    -targets / max(pre["size"], 1)))
+        synaptic = (packets * cost.packet_us + events * cost.synapse_us +
+                    sources * cost.poisson_us)
+        if split:
+            packets /= config.n_synapse_vertices
+            load = cost.overhead_us + max(
+                n_slice * cost.neuron_us,
+                synaptic / config.n_synapse_vertices)
+        else:
+            load = cost.overhead_us + n_slice * cost.neuron_us + synaptic
+        max_load = max(max_load, load)
+        max_packets = max(max_packets, packets)
+
+    budget = dt * 1000.0 * time_scale_factor
+    if max_load > budget:
+        reasons.append("cores overrun the time step")
+    if max_packets * cost.peak_factor > cost.input_buffer:
+        reasons.append("input buffer overflows")
+    return Estimate(
+        config, n_cores, max_load, max_packets, max_load / (dt * 1000.0),
+        not reasons, "; ".join(reasons) or None)
+
+
+def search(profile, configs=None, objective="cores", cost=CostModel(),
+           time_scale_factor=1.0):
+    """ Estimate every configuration, best first: feasible ones before the
+        rest, then by cores or by slowdown as the objective says
+
+    :param NetworkProfile profile: The network
+    :param list(PartitionConfig) configs:
+        The candidates; by default :py:func:`candidate_configs`
+    :param str objective: "cores" or "time"
+    :rtype: list(Estimate)
+    """
+    if configs is None:
+        configs = candidate_configs()
+    estimates = [evaluate(profile, config, cost, time_scale_factor)
+                 for config in configs]
+
+    def key(estimate):
+        load = estimate.max_load_us
+        if load is None:
+            load = numpy.inf
+        if objective == "time":
+            return (not estimate.feasible, load, estimate.n_cores)
+        return (not estimate.feasible, estimate.n_cores, load)
+    return sorted(estimates, key=key)
+
+
+def calibrate(sim, builder, models, config, timestep, time_scale_factor,
+              run_time, runner=None):
+    """ Run a configuration on a board and read what happened
+
+    :param sim: The simulator module, e.g. pyNN.spiNNaker
+    :param callable builder: As for :py:func:`profile_network`
+    :param iterable(str) models: The models to set the neurons per core of
+    :param PartitionConfig config: The configuration
+    :param float timestep: The time step in ms
+    :param float time_scale_factor: How much slower than real time to run
+    :param float run_time: How long to run in ms
+    :param callable runner: As for :py:func:`profile_network`
+    :rtype: Calibration
+    """
+    sim.setup(timestep=timestep, time_scale_factor=time_scale_factor)
+    for model in models:
+        sim.set_number_of_neurons_per_core(
+            getattr(sim, model), config.neurons_per_core)
+    network = builder(sim, splitter_factory(config, sim))
+    start = time.perf_counter()
+    if runner is None:
+        sim.run(run_time)
+    else:
+        runner(sim, network, run_time)
+    wall_time = time.perf_counter() - start
+    provenance = spinnaker_provenance()
+    sim.end()
+    run_time = wall_time
+    for name in ("mapping_time", "load_time"):
+        if provenance[name] is not None:
+            run_time -= provenance[name]
+    return Calibration(
+        config, provenance["n_cores"], provenance["dropped_spikes"],
+        provenance["mapping_time"], provenance["load_time"], run_time)
+
+
+def default_time_scale_factor(timestep):
+    """ The time scale factor sPyNNaker uses when none is given
+
+    :param float timestep: The time step in ms
+    :rtype: float
+    """
+    return float(max(1, math.ceil(1.0 / timestep)))
+
+
+def autotune(builder, timestep=1.0, time_scale_factor=None,
+             objective="cores", configs=None, cost=CostModel(),
+             calibration_time=None, runner=None, sim=None, n_verify=3):
+    """ Choose the configuration of a network
+
+    :param callable builder: As for :py:func:`profile_network`
+    :param float timestep: The time step in ms
+    :param float time_scale_factor:
+        How much slower than real time it runs; by default as sPyNNaker
+        chooses
+    :param str objective: Minimise "cores" or "time"
+    :param list(PartitionConfig) configs: The candidates
+    :param CostModel cost: The cost model
+    :param calibration_time:
+        How long to run to measure the traffic, and to run the best
+        candidates on the board, in ms
+    :param callable runner: As for :py:func:`profile_network`
+    :param sim:
+        The simulator to verify the best candidates on, e.g. pyNN.spiNNaker;
+        by default the cost model alone decides
+    :param int n_verify: How many feasible candidates to verify
+    :return:
+        The best configuration, or None if none is feasible, with the
+        estimates and calibration runs
+    :rtype: TuningResult
+    """
+    if time_scale_factor is None:
+        time_scale_factor = default_time_scale_factor(timestep)
+    profile = profile_network(builder, timestep, calibration_time, runner)
+    estimates = search(profile, configs, objective, cost, time_scale_factor)
+    feasible = [e for e in estimates if e.feasible]
+    calibrations = list()
+    if sim is None or not feasible:
+        best = feasible[0].config if feasible else None
+        return TuningResult(best, estimates, calibrations)
+
+    models = sorted(set(p["model"] for p in profile.populations))
+    for estimate in feasible[:n_verify]:
+        calibrations.append(calibrate(
+            sim, builder, models, estimate.config, timestep,
+            time_scale_factor, calibration_time or 1000.0, runner))
+    # Unknown drops count as drops, so only verified runs are chosen
+    clean = [c for c in calibrations if c.dropped_spikes == 0]
+    if not clean:
+        return TuningResult(None, estimates, calibrations)
+    if objective == "time":
+        best = min(clean, key=lambda c: (
+            c.run_time + (c.mapping_time or 0.0) + (c.load_time or 0.0)))
+    else:
+        best = min(clean, key=lambda c: (c.n_cores, c.run_time))
+    return TuningResult(best.config, estimates, calibrations)
+
+
+def _balanced_random(sim, splitters):
+    # pylint: disable=import-outside-toplevel
+    from balanced_random.balanced_network import build_network
+    return build_network(sim, splitters=splitters)
+
+
+def _balanced_random_runner(sim, network, run_time):
+    # pylint: disable=import-outside-toplevel
+    from balanced_random.balanced_network import PHASES, run_phases
+    # Each phase of the input for an equal part of the time
+    run_phases(sim, network, [
+        (run_time / len(PHASES), rate) for _, rate in PHASES])
+
+
+#: The networks the command line can tune: builder, runner and time step
+NETWORKS = {
+    "balanced_random": (_balanced_random, _balanced_random_runner, 0.1)}
+
+
+def format_estimates(estimates, n_rows=10):
+    """ Format the best estimates as a text table
+
+    :param list(Estimate) estimates: The estimates, best first
+    :param int n_rows: How many to show
+    :rtype: str
+    """
+    lines = ["{:>8} {:>8} {:>9} {:>6} {:>6} {:>9} {:>8}  {}".format(
+        "n/core", "synapse", "max_delay", "extend", "cores", "load us",
+        "packets", "problem")]
+    for estimate in estimates[:n_rows]:
+        config = estimate.config
+        load = estimate.max_load_us
+        packets = estimate.max_packets
+        lines.append("{:8d} {:8d} {:>9} {:>6} {:6d} {:>9} {:>8}  {}".format(
+            config.neurons_per_core, config.n_synapse_vertices,
+            str(config.max_delay or "-"),
+            "yes" if config.allow_delay_extension else "no",
+            estimate.n_cores,
+            "-" if load is None else "{:.1f}".format(load),
+            "-" if packets is None else "{:.1f}".format(packets),
+            estimate.reason or ""))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("network", choices=sorted(NETWORKS))
+    parser.add_argument("--objective", choices=("cores", "time"),
+                        default="cores")
+    parser.add_argument("--time-scale-factor", type=float)
+    parser.add_argument("--calibration-time", type=float,
+                        help="ms to run to measure the traffic")
+    parser.add_argument("--backend", choices=("local", "spinnaker"),
+                        default="local",
+                        help="spinnaker verifies the best on a board")
+    parser.add_argument("--verify", type=int, default=3,
+                        help="how many candidates to run on the board")
+    parser.add_argument("--rows", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    builder, runner, timestep = NETWORKS[args.network]
+    sim = None
+    if args.backend == "spinnaker":
+        # pylint: disable=import-outside-toplevel
+        import pyNN.spiNNaker as sim
+    result = autotune(
+        builder, timestep, args.time_scale_factor, args.objective,
+        calibration_time=args.calibration_time, runner=runner, sim=sim,
+        n_verify=args.verify)
+    print(format_estimates(result.estimates, args.rows))
+    for calibration in result.calibrations:
+        print(calibration)
+    print("Best: {}".format(result.best))
+
+
+if __name__ == "__main__":
+    main()
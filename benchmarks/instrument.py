@@ -0,0 +1,374 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Run one IntroLab script with its calls to the simulator timed, e.g.::
+
+    python -m benchmarks.instrument balanced_random/balanced_random.py \
+        --backend local --output record.json
+
+The record has the time spent in setup, mapping, loading, running and
+extracting data, the number of cores used and the spikes dropped on the
+way.  The mapping and loading times and dropped spikes come from the
+provenance of sPyNNaker; on the local engine, which stands in on machines
+without a board, they are zero and the cores are estimated from the
+populations and splitters as sPyNNaker would place them.
+"""
+
+import argparse
+import inspect
+import json
+import math
+import os
+import runpy
+import sys
+import time
+from collections import defaultdict
+
+#: The top of the repository, so that the scripts can import its packages
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#: The neurons per core sPyNNaker uses when none is set for a model
+DEFAULT_NEURONS_PER_CORE = 256
+
+#: The provenance name of the input buffer overflows of a synapse core
+INPUT_BUFFER_LOST = "Times_the_input_buffer_lost_packets"
+
+
+def _model_name(model):
+    if not isinstance(model, type):
+        model = type(model)
+    return model.__name__
+
+
+def estimate_cores(populations, projections, neurons_per_core):
+    """ Estimate the cores sPyNNaker would place a network on.  A population
+        is split into slices of at most the neurons per core of its model;
+        a slice split into neurons and synapses takes one core for the
+        neurons and one for each synapse vertex, and a Poisson source with
+        a delegate splitter takes no cores when all its projections are one
+        to one onto split populations, as it then runs on their synapse
+        cores.
+
+    :param list(dict) populations:
+        Each with the "size", "model" name and "splitter" (a tuple of its
+        type name and arguments, or None)
+    :param list(dict) projections:
+        Each with the "pre" and "post" population index and "connector"
+        type name
+    :param dict(str,int) neurons_per_core: The limit by model name
+    :rtype: int
+    """
+    outgoing = defaultdict(list)
+    for projection in projections:
+        outgoing[projection["pre"]].append(projection)
+    n_cores = 0
+    for index, population in enumerate(populations):
+        per_core = neurons_per_core.get(
+            population["model"], DEFAULT_NEURONS_PER_CORE)
+        n_slices = int(math.ceil(population["size"] / float(per_core)))
+        splitter = population["splitter"]
+        if splitter is None:
+            n_cores += n_slices
+        elif splitter[0] == "SplitterAbstractPopulationVertexNeuronsSynapses":
+            n_synapse_vertices = splitter[1][0] if splitter[1] else 1
+            n_cores += n_slices * (1 + n_synapse_vertices)
+        elif splitter[0] == "SplitterPoissonDelegate":
+            delegated = all(
+                projection["connector"] == "OneToOneConnector" and
+                populations[projection["post"]]["splitter"] is not None and
+                populations[projection["post"]]["splitter"][0] !=
+                "SplitterPoissonDelegate"
+                for projection in outgoing[index])
+            if not (delegated and outgoing[index]):
+                n_cores += n_slices
+        else:
+            n_cores += n_slices
+    return n_cores
+
+
+def spinnaker_provenance():
+    """ The mapping and loading time in seconds, cores used and input packets
+        lost, each None if the provenance can't be read
+    """
+    # pylint: disable=import-outside-toplevel
+    result = {"mapping_time": None, "load_time": None, "n_cores": None,
+              "dropped_spikes": None}
+    try:
+        from spynnaker.pyNN.data import SpynnakerDataView
+        result["n_cores"] = SpynnakerDataView.get_n_placements()
+    except Exception:  # pylint: disable=broad-except
+        pass
+    try:
+        from spinn_front_end_common.interface.provenance import (
+            ProvenanceReader, TimerCategory)
+        reader = ProvenanceReader()
+        result["mapping_time"] = reader.get_category_timer_sum(
+            TimerCategory.MAPPING) / 1000.0
+        result["load_time"] = reader.get_category_timer_sum(
+            TimerCategory.LOADING) / 1000.0
+        rows = reader.run_query(
+            "SELECT SUM(the_value) FROM core_provenance "
+            "WHERE description = ?", [INPUT_BUFFER_LOST])
+        result["dropped_spikes"] = int(rows[0][0] or 0)
+    except Exception:  # pylint: disable=broad-except
+        pass
+    return result
+
+
+class ScriptRecorder(object):
+    """ Wraps the functions and classes of a simulator module so that a
+        script using it is timed, and records the network it builds
+    """
+
+    __slots__ = [
+        "__sim", "__backend", "__times", "__depth", "__n_runs",
+        "__populations", "__projections", "__population_objects",
+        "__projection_objects", "__neurons_per_core",
+        "__provenance", "__original"]
+
+    def __init__(self, sim, backend):
+        """
+        :param module sim: The simulator module, as imported by the script
+        :param str backend: "local" or "spinnaker"
+        """
+        self.__sim = sim
+        self.__backend = backend
+        self.__times = defaultdict(float)
+        self.__depth = 0
+        self.__n_runs = 0
+        self.__populations = list()
+        self.__projections = list()
+        self.__population_objects = list()
+        self.__projection_objects = list()
+        self.__neurons_per_core = dict()
+        self.__provenance = None
+        self.__original = dict()
+        self.__install()
+
+    def __timed(self, category, function):
+        # Only the outermost timed call counts, so that a method calling
+        # another isn't counted twice
+        def timed(*args, **kwargs):
+            self.__depth += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.__depth -= 1
+                if self.__depth == 0:
+                    self.__times[category] += time.perf_counter() - start
+        return timed
+
+    def __install(self):
+        sim = self.__sim
+        for name in ("setup", "run", "end", "Population", "Projection",
+                     "set_number_of_neurons_per_core"):
+            self.__original[name] = getattr(sim, name)
+        sim.setup = self.__timed("setup_time", self.__original["setup"])
+        sim.run = self.__run
+        sim.end = self.__end
+        sim.set_number_of_neurons_per_core = self.__set_neurons_per_core
+        sim.Population = self.__recorded_class(
+            self.__original["Population"], self.__add_population,
+            ("get_data", "spinnaker_get_data"))
+        sim.Projection = self.__recorded_class(
+            self.__original["Projection"], self.__add_projection,
+            ("get", "getWeights", "getDelays"))
+
+    def restore(self):
+        """ Put back the original functions and classes of the simulator
+        """
+        for name, value in self.__original.items():
+            setattr(self.__sim, name, value)
+
+    def __recorded_class(self, base, on_create, extraction_methods):
+        recorder = self
+        signature = inspect.signature(base.__init__)
+        attributes = {
+            name: recorder.__timed("extraction_time", getattr(base, name))
+            for name in extraction_methods if hasattr(base, name)}
+
+        def __init__(self, *args, **kwargs):
+            base.__init__(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            on_create(self, bound.arguments)
+
+        attributes["__init__"] = __init__
+        return type(base.__name__, (base, ), attributes)
+
+    def __run(self, *args, **kwargs):
+        self.__n_runs += 1
+        return self.__timed("run_wall_time", self.__original["run"])(
+            *args, **kwargs)
+
+    def __end(self, *args, **kwargs):
+        self.collect()
+        return self.__original["end"](*args, **kwargs)
+
+    def __set_neurons_per_core(self, neuron_type, max_permitted):
+        self.__neurons_per_core[_model_name(neuron_type)] = max_permitted
+        return self.__original["set_number_of_neurons_per_core"](
+            neuron_type, max_permitted)
+
+    def __add_population(self, population, arguments):
+        extra = arguments.get("additional_parameters") or {}
+        splitter = extra.get("splitter")
+        if splitter is not None:
+            splitter = (type(splitter).__name__,
+                        list(getattr(splitter, "args", ())))
+        population._benchmark_index = len(self.__populations)
+        self.__population_objects.append(population)
+        self.__populations.append({
+            "label": population.label, "size": int(arguments["size"]),
+            "model": _model_name(arguments["cellclass"]),
+            "splitter": splitter})
+
+    def __add_projection(self, projection, arguments):
+        pre, post = [
+            arguments[name] for name in (
+                "presynaptic_population", "postsynaptic_population")]
+        self.__projection_objects.append(projection)
+        self.__projections.append({
+            "pre": getattr(pre, "_benchmark_index", None),
+            "post": getattr(post, "_benchmark_index", None),
+            "connector": type(arguments["connector"]).__name__})
+
+    def collect(self):
+        """ Read what the simulator knows of the run; done as the script
+            ends the simulation, while that is still available
+        """
+        if self.__provenance is not None:
+            return
+        if self.__backend == "spinnaker":
+            self.__provenance = spinnaker_provenance()
+            self.__provenance["cores_estimated"] = False
+        else:
+            self.__provenance = {
+                "mapping_time": 0.0, "load_time": 0.0, "n_cores": None,
+                "dropped_spikes": 0, "cores_estimated": True}
+        if self.__provenance["n_cores"] is None and all(
+                p["pre"] is not None and p["post"] is not None
+                for p in self.__projections):
+            self.__provenance["n_cores"] = estimate_cores(
+                self.__populations, self.__projections,
+                self.__neurons_per_core)
+            self.__provenance["cores_estimated"] = True
+
+    @property
+    def populations(self):
+        return list(self.__populations)
+
+    @property
+    def projections(self):
+        return list(self.__projections)
+
+    @property
+    def population_objects(self):
+        """ The populations created, in the order of :py:attr:`populations`
+        """
+        return list(self.__population_objects)
+
+    @property
+    def projection_objects(self):
+        """ The projections created, in the order of :py:attr:`projections`
+        """
+        return list(self.__projection_objects)
+
+    @property
+    def neurons_per_core(self):
+        """ The neurons per core set by the script, by model name
+        """
+        return dict(self.__neurons_per_core)
+
+    def record(self):
+        """ The timings and provenance of the script so far
+
+        :rtype: dict
+        """
+        self.collect()
+        record = dict(self.__provenance)
+        run_time = self.__times["run_wall_time"]
+        for name in ("mapping_time", "load_time"):
+            if record[name] is not None:
+                run_time -= record[name]
+        record.update({
+            "n_runs": self.__n_runs,
+            "setup_time": self.__times["setup_time"],
+            "run_wall_time": self.__times["run_wall_time"],
+            "run_time": max(run_time, 0.0),
+            "extraction_time": self.__times["extraction_time"]})
+        return record
+
+
+def run_script(script, backend="local"):
+    """ Run a script with its figures discarded and its simulator calls
+        timed
+
+    :param str script: The path of the script
+    :param str backend: "local" for the local engine or "spinnaker"
+    :return: The record of the run, with an "error" if it failed
+    :rtype: dict
+    """
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.show = lambda *_args, **_kwargs: plt.close("all")
+    if backend == "local":
+        from local_engine.__main__ import install
+        install()
+    import pyNN.spiNNaker as sim
+    recorder = ScriptRecorder(sim, backend)
+    error = None
+    start = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except Exception as e:  # pylint: disable=broad-except
+        error = "{}: {}".format(type(e).__name__, e)
+    wall_time = time.perf_counter() - start
+    record = recorder.record()
+    recorder.restore()
+    record.update({"script": script, "backend": backend,
+                   "wall_time": wall_time, "error": error})
+    return record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("script", help="the script to run")
+    parser.add_argument("--backend", choices=("local", "spinnaker"),
+                        default="local")
+    parser.add_argument("--output", help="where to write the JSON record")
+    args = parser.parse_args(argv)
+
+    # The script runs in its own directory, to pick up its spynnaker.cfg,
+    # but imports packages from the top of the repository
+    script = os.path.abspath(args.script)
+    output = os.path.abspath(args.output) if args.output else None
+    sys.path.insert(0, ROOT)
+    sys.argv = [script]
+    os.chdir(os.path.dirname(script))
+    record = run_script(script, args.backend)
+    text = json.dumps(record, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
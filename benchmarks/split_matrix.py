@@ -0,0 +1,209 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compare the split and non-split versions of the IntroLab scripts, e.g.::
+
+    python -m benchmarks.split_matrix --backend spinnaker --repeats 3
+
+Each split script is its plain script with splitters added and nothing
+else changed, so that the ratios measure the splitting alone.  Each script
+runs in a fresh process in its own directory, with the same seeds as its
+pair, and the median of each measure over the repeats is
+tabulated with the ratio of split to non-split.  Without a board, the
+default local backend runs the scripts on the local engine, which stands
+in for timing and estimates the cores; scripts using plasticity, which it
+does not support, are shown as failed.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import numpy
+from benchmarks.instrument import ROOT
+
+#: The scripts paired with their split versions, by name
+PAIRS = (
+    ("balanced_random", "balanced_random/balanced_random.py",
+     "balanced_random/split/balanced_random_split.py"),
+    ("stdp", "learning/stdp.py", "learning/split/stdp_split.py"),
+    ("struct_pl", "learning/struct_pl.py",
+     "learning/split/struct_pl_split.py"),
+    ("struct_pl_stdp", "learning/struct_pl_stdp.py",
+     "learning/split/struct_pl_stdp_split.py"))
+
+#: The measures compared, with their headings
+MEASURES = (
+    ("mapping_time", "map s"), ("load_time", "load s"),
+    ("run_time", "run s"), ("extraction_time", "extract s"),
+    ("n_cores", "cores"), ("dropped_spikes", "dropped"))
+
+
+def run_script(script, backend, timeout=None):
+    """ Run a script in a new process and read back its record
+
+    :param str script: The script, relative to the top of the repository
+    :param str backend: "local" or "spinnaker"
+    :param timeout: The most seconds to wait, if any
+    :rtype: dict
+    """
+    path = os.path.join(ROOT, script)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [ROOT] + [p for p in [env.get("PYTHONPATH")] if p])
+    handle, output = tempfile.mkstemp(suffix=".json")
+    os.close(handle)
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.instrument", path,
+             "--backend", backend, "--output", output],
+            cwd=os.path.dirname(path), env=env, timeout=timeout,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
+        with open(output, encoding="utf-8") as f:
+            text = f.read()
+        if result.returncode or not text:
+            lines = result.stderr.decode(errors="replace").splitlines()
+            return {"script": script, "backend": backend,
+                    "error": lines[-1] if lines else "failed"}
+        record = json.loads(text)
+    except subprocess.TimeoutExpired:
+        record = {"script": script, "backend": backend, "error": "timeout"}
+    finally:
+        os.remove(output)
+    record["script"] = script
+    return record
+
+
+def run_matrix(pairs=PAIRS, backend="local", repeats=1, timeout=None):
+    """ Run each script of each pair the given number of times
+
+    :param pairs: The (name, script, split script) to compare
+    :param str backend: "local" or "spinnaker"
+    :param int repeats: The runs of each script
+    :param timeout: The most seconds to wait for each run, if any
+    :return: The record of each run, with its "pair" and "variant"
+    :rtype: list(dict)
+    """
+    records = list()
+    for name, script, split_script in pairs:
+        for variant, path in (("plain", script), ("split", split_script)):
+            for repeat in range(repeats):
+                record = run_script(path, backend, timeout)
+                record.update(
+                    {"pair": name, "variant": variant, "repeat": repeat})
+                records.append(record)
+    return records
+
+
+def _median(records, measure):
+    values = [r[measure] for r in records
+              if not r.get("error") and r.get(measure) is not None]
+    if not values:
+        return None
+    return float(numpy.median(values))
+
+
+def summarise(records):
+    """ The median of each measure for each pair and variant, with the
+        ratio of split to plain
+
+    :param list(dict) records: The records from :py:func:`run_matrix`
+    :return: One row per pair and variant, then per pair for the ratio
+    :rtype: list(dict)
+    """
+    rows = list()
+    pairs = list()
+    for record in records:
+        if record["pair"] not in pairs:
+            pairs.append(record["pair"])
+    for pair in pairs:
+        medians = dict()
+        for variant in ("plain", "split"):
+            selected = [r for r in records
+                        if r["pair"] == pair and r["variant"] == variant]
+            errors = [r["error"] for r in selected if r.get("error")]
+            row = {"pair": pair, "variant": variant,
+                   "n_ok": len(selected) - len(errors),
+                   "error": errors[0] if errors else None}
+            for measure, _ in MEASURES:
+                row[measure] = _median(selected, measure)
+            medians[variant] = row
+            rows.append(row)
+        ratio = {"pair": pair, "variant": "split/plain", "n_ok": None,
+                 "error": None}
+        for measure, _ in MEASURES:
+            plain = medians["plain"][measure]
+            split = medians["split"][measure]
+            ratio[measure] = (
+                split / plain if plain and split is not None else None)
+        rows.append(ratio)
+    return rows
+
+
+def format_table(rows):
+    """ Format the summary as a text table
+
+    :param list(dict) rows: The rows from :py:func:`summarise`
+    :rtype: str
+    """
+    header = "{:>16} {:>11}".format("pair", "variant") + "".join(
+        " {:>9}".format(heading) for _, heading in MEASURES)
+    lines = [header]
+    for row in rows:
+        line = "{:>16} {:>11}".format(row["pair"], row["variant"])
+        for measure, _ in MEASURES:
+            value = row[measure]
+            if value is None:
+                line += " {:>9}".format("-")
+            elif measure in ("n_cores", "dropped_spikes") and \
+                    row["variant"] != "split/plain":
+                line += " {:9d}".format(int(value))
+            else:
+                line += " {:9.3f}".format(value)
+        if row["error"]:
+            line += "  " + str(row["error"])[:60]
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", choices=("local", "spinnaker"),
+                        default="local",
+                        help="local runs on the local engine without a board")
+    parser.add_argument("--pairs", nargs="+",
+                        choices=[name for name, _, _ in PAIRS],
+                        help="the pairs to run; all by default")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--timeout", type=float,
+                        help="the most seconds to allow each run")
+    parser.add_argument("--output", default="split_matrix.json")
+    args = parser.parse_args(argv)
+
+    pairs = [pair for pair in PAIRS
+             if args.pairs is None or pair[0] in args.pairs]
+    records = run_matrix(pairs, args.backend, args.repeats, args.timeout)
+    rows = summarise(records)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"parameters": vars(args), "summary": rows,
+                   "runs": records}, f, indent=2)
+    print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Statistics of how the connectivity of a structurally plastic projection
+evolves, kept up to date from the synapses formed and eliminated since the
+last update, so that each update costs time in the number of changes
+rather than the size of the projection.
+
+The changes come from the events of
+:py:func:`learning.struct_pl_offline.simulate_rewiring`, or from the
+difference between successive snapshots of the connections; see
+:py:meth:`ConnectivityTracker.update_connections`.
+"""
+
+from collections import namedtuple
+import numpy
+from learning.struct_pl_offline import (
+    formation_table, grid_shape, squared_distances)
+
+#: The state of the connectivity after an update: the number of synapses,
+#: the mean fan-in, the fraction of post-neurons with s_max synapses, and
+#: the mean grid distance of the synapses
+ConnectivityState = namedtuple("ConnectivityState", [
+    "time", "n_connections", "mean_fan_in", "fraction_full",
+    "mean_distance"])
+
+#: The candidate spreads when fitting sigma to the formed distances
+_SIGMAS = numpy.geomspace(0.05, 100.0, 400)
+
+
+def distance_multiplicity(shape):
+    """ The number of neurons at each squared distance from any neuron on a
+        grid that wraps around
+
+    :param tuple(int, int) shape: The shape of the grid
+    :rtype: ~numpy.ndarray
+    """
+    squared = squared_distances(
+        numpy.arange(shape[0] * shape[1]), 0, shape)
+    return numpy.bincount(squared)
+
+
+class ConnectivityTracker(object):
+    """ Keeps the fan-in of each post-neuron, the histogram of fan-ins and
+        of grid distances, and the synapses formed and eliminated in each
+        interval of time
+    """
+
+    __slots__ = ["__n_post", "__s_max", "__shape", "__interval", "__fan_in",
+                 "__fan_in_counts", "__distances", "__formed_distances",
+                 "__formed", "__eliminated", "__n_connections",
+                 "__distance_sum", "__history", "__keys"]
+
+    def __init__(self, parameters, n_post, interval=100.0,
+                 connections=None):
+        """
+        :param ~learning.struct_pl_offline.RewiringParameters parameters:
+            The rewiring rules, for s_max and the grid
+        :param int n_post: The size of the post-population
+        :param float interval: The length of each interval in ms
+        :param ~numpy.ndarray connections:
+            The (pre, post) connections at the start, if any
+        """
+        self.__n_post = n_post
+        self.__s_max = parameters.s_max
+        self.__shape = grid_shape(parameters, n_post)
+        self.__interval = interval
+        self.__fan_in = numpy.zeros(n_post, dtype="int64")
+        # The number of post-neurons with each fan-in; fan-ins above s_max
+        # share the last bin
+        self.__fan_in_counts = numpy.zeros(self.__s_max + 2, dtype="int64")
+        self.__fan_in_counts[0] = n_post
+        size = len(distance_multiplicity(self.__shape))
+        self.__distances = numpy.zeros(size, dtype="int64")
+        self.__formed_distances = numpy.zeros(size, dtype="int64")
+        self.__formed = numpy.zeros(0, dtype="int64")
+        self.__eliminated = numpy.zeros(0, dtype="int64")
+        self.__n_connections = 0
+        self.__distance_sum = 0.0
+        self.__history = list()
+        self.__keys = numpy.zeros(0, dtype="int64")
+        if connections is not None and len(connections):
+            connections = numpy.asarray(connections).reshape(
+                len(connections), -1)
+            self.update_connections(0.0, connections[:, 0],
+                                    connections[:, 1], count=False)
+
+    def __change(self, pre, post, sign):
+        """ Add (sign 1) or remove (sign -1) synapses
+        """
+        if not len(post):
+            return
+        neurons, counts = numpy.unique(post, return_counts=True)
+        limit = self.__s_max + 1
+        numpy.subtract.at(self.__fan_in_counts,
+                          numpy.minimum(self.__fan_in[neurons], limit), 1)
+        self.__fan_in[neurons] += sign * counts
+        numpy.add.at(self.__fan_in_counts,
+                     numpy.minimum(self.__fan_in[neurons], limit), 1)
+        squared = numpy.minimum(squared_distances(pre, post, self.__shape),
+                                len(self.__distances) - 1)
+        numpy.add.at(self.__distances, squared, sign)
+        self.__n_connections += sign * len(post)
+        self.__distance_sum += sign * float(numpy.sqrt(squared).sum())
+
+    @staticmethod
+    def __count(totals, intervals):
+        if not len(intervals):
+            return totals
+        counts = numpy.bincount(intervals)
+        if len(counts) > len(totals):
+            totals = numpy.concatenate(
+                (totals, numpy.zeros(len(counts) - len(totals), "int64")))
+        totals[:len(counts)] += counts
+        return totals
+
+    def apply(self, times, pre, post, formed):
+        """ Apply synapses formed and eliminated, such as the events of
+            simulate_rewiring, in order of time
+
+        :param ~numpy.ndarray times: The time of each change in ms
+        :param ~numpy.ndarray pre: The pre-neuron of each change
+        :param ~numpy.ndarray post: The post-neuron of each change
+        :param ~numpy.ndarray formed:
+            Whether each change formed a synapse rather than eliminated one
+        :return: The state after the changes
+        :rtype: ConnectivityState
+        """
+        times = numpy.asarray(times, dtype="float64")
+        pre = numpy.asarray(pre, dtype="int64")
+        post = numpy.asarray(post, dtype="int64")
+        formed = numpy.asarray(formed, dtype=bool)
+        self.__change(pre[formed], post[formed], 1)
+        self.__change(pre[~formed], post[~formed], -1)
+        numpy.add.at(self.__formed_distances, numpy.minimum(
+            squared_distances(pre[formed], post[formed], self.__shape),
+            len(self.__formed_distances) - 1), 1)
+        intervals = numpy.floor(times / self.__interval).astype("int64")
+        self.__formed = self.__count(self.__formed, intervals[formed])
+        self.__eliminated = self.__count(
+            self.__eliminated, intervals[~formed])
+        return self.__record(times[-1] if len(times) else (
+            self.__history[-1].time if self.__history else 0.0))
+
+    def update_connections(self, time, pre, post, count=True):
+        """ Update from a snapshot of all the connections, such as from
+            getWeights or a SparseWeights; finding what changed takes a sort
+            of the snapshot, but the statistics are still only updated by the
+            changes.  Use either this or apply on one tracker, not both.
+
+        :param float time: The time of the snapshot in ms
+        :param ~numpy.ndarray pre: The pre-neuron of each connection
+        :param ~numpy.ndarray post: The post-neuron of each connection
+        :param bool count:
+            Whether to count the changes as formed and eliminated at this
+            time
+        :rtype: ConnectivityState
+        """
+        keys = numpy.unique(
+            numpy.asarray(post, dtype="int64") * (2 ** 32) +
+            numpy.asarray(pre, dtype="int64"))
+        added = numpy.setdiff1d(keys, self.__keys, assume_unique=True)
+        removed = numpy.setdiff1d(self.__keys, keys, assume_unique=True)
+        self.__keys = keys
+        if count:
+            changes = numpy.concatenate((added, removed))
+            return self.apply(
+                numpy.full(len(changes), float(time)), changes % (2 ** 32),
+                changes // (2 ** 32), numpy.arange(len(changes)) < len(added))
+        self.__change(added % (2 ** 32), added // (2 ** 32), 1)
+        self.__change(removed % (2 ** 32), removed // (2 ** 32), -1)
+        return self.__record(time)
+
+    def __record(self, time):
+        state = ConnectivityState(
+            float(time), self.__n_connections,
+            self.__n_connections / float(self.__n_post),
+            float(self.__fan_in_counts[self.__s_max:].sum()) / self.__n_post,
+            self.__distance_sum / self.__n_connections
+            if self.__n_connections else 0.0)
+        self.__history.append(state)
+        return state
+
+    @property
+    def fan_in(self):
+        """ The number of synapses of each post-neuron
+        """
+        return self.__fan_in
+
+    @property
+    def fan_in_counts(self):
+        """ The number of post-neurons with each fan-in from 0 to s_max
+        """
+        counts = self.__fan_in_counts[:self.__s_max + 1].copy()
+        counts[-1] += self.__fan_in_counts[-1]
+        return counts
+
+    @property
+    def distance_counts(self):
+        """ The number of synapses at each squared grid distance
+        """
+        return self.__distances
+
+    @property
+    def formed_distance_counts(self):
+        """ The number of synapses ever formed at each squared grid distance
+        """
+        return self.__formed_distances
+
+    @property
+    def history(self):
+        """ The state after each update
+
+        :rtype: list(ConnectivityState)
+        """
+        return self.__history
+
+    def intervals(self):
+        """ The start time in ms of each interval and the number of synapses
+            formed and eliminated in it
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray)
+        """
+        n = max(len(self.__formed), len(self.__eliminated))
+        formed = numpy.zeros(n, dtype="int64")
+        eliminated = numpy.zeros(n, dtype="int64")
+        formed[:len(self.__formed)] = self.__formed
+        eliminated[:len(self.__eliminated)] = self.__eliminated
+        return numpy.arange(n) * self.__interval, formed, eliminated
+
+    def expected_formed_distances(self, probability, sigma):
+        """ The fraction of formations expected at each squared distance if
+            the partners are chosen at random, ignoring that a neuron cannot
+            be offered a partner it already has
+
+        :param float probability: p_form_forward
+        :param float sigma: sigma_form_forward
+        :rtype: ~numpy.ndarray
+        """
+        multiplicity = distance_multiplicity(self.__shape)
+        expected = multiplicity * formation_table(
+            probability, sigma, self.__shape)[:len(multiplicity)]
+        return expected / expected.sum()
+
+    def fitted_sigma(self):
+        """ The sigma_form_forward that best explains the distances of the
+            synapses formed so far, by maximum likelihood with partners
+            chosen at random
+
+        :rtype: float
+        """
+        counts = self.__formed_distances
+        if not counts.sum():
+            return numpy.nan
+        multiplicity = distance_multiplicity(self.__shape)
+        squared = numpy.arange(len(multiplicity))
+        # log P(d) = log m(d) - d / (2 sigma^2) - log Z(sigma)
+        exponent = -squared[None, :] / (2.0 * _SIGMAS[:, None] ** 2)
+        log_z = numpy.log((multiplicity[None, :] * numpy.exp(
+            exponent)).sum(axis=1))
+        log_likelihood = (counts[None, :] * exponent).sum(axis=1) - \
+            counts.sum() * log_z
+        return float(_SIGMAS[numpy.argmax(log_likelihood)])
@@ -0,0 +1,352 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The weights and delays of a projection as a sparse matrix, rather than the
+dense lists and arrays of getWeights(), in compressed sparse rows of either
+the pre- or the post-neurons, like scipy.sparse's CSR and CSC matrices.
+
+A matrix can be written to a directory of .npy files, in both orders, and
+read back memory-mapped, so that the synapses of a range of pre- or
+post-neurons are read without reading the rest.
+"""
+
+import json
+import os
+import numpy
+
+#: Changed whenever the layout of the files changes
+_VERSION = 1
+
+#: The orders that rows can be in
+ORDERS = ("pre", "post")
+
+
+def _projection_columns(projection):
+    """ The (pre, post, weight, delay) columns of the synapses of a
+        projection
+
+    :param projection: The projection
+    :rtype: tuple(~numpy.ndarray)
+    """
+    get_columns = getattr(projection, "get_columns", None)
+    if get_columns is not None:
+        return get_columns(["weight", "delay"])
+    connections = projection.get(["weight", "delay"], format="list")[:]
+    names = getattr(getattr(connections, "dtype", None), "names", None)
+    if names:
+        # A structured array, as held by sPyNNaker's ConnectionHolder
+        return tuple(connections[name] for name in names)
+    connections = numpy.asarray(
+        connections, dtype="float64").reshape(-1, 4)
+    return tuple(connections.T)
+
+
+class SparseWeights(object):
+    """ The synapses of a projection, grouped into rows by either their pre-
+        or their post-neuron; the synapses of row i are those from
+        indptr[i] to indptr[i + 1], sorted by the other neuron
+    """
+
+    __slots__ = ["__shape", "__by", "__first", "__indptr", "__indices",
+                 "__weights", "__delays"]
+
+    # indptr always starts at 0, so the arrays of a slice start with its
+    # first row
+
+    def __init__(self, shape, by, indptr, indices, weights, delays,
+                 first=0):
+        """
+        :param tuple(int, int) shape: The sizes of the pre- and post-
+            populations
+        :param str by: "pre" or "post", the neurons of the rows
+        :param ~numpy.ndarray indptr: Where the synapses of each row start
+        :param ~numpy.ndarray indices: The other neuron of each synapse
+        :param ~numpy.ndarray weights: The weight of each synapse
+        :param ~numpy.ndarray delays: The delay of each synapse, or None
+        :param int first: The neuron of the first row
+        """
+        if by not in ORDERS:
+            raise ValueError("by must be one of {}".format(ORDERS))
+        self.__shape = tuple(int(size) for size in shape)
+        self.__by = by
+        self.__first = first
+        self.__indptr = indptr
+        self.__indices = indices
+        self.__weights = weights
+        self.__delays = delays
+
+    @classmethod
+    def from_connections(cls, pre, post, weights, delays=None, shape=None,
+                         by="pre"):
+        """ Gather a list of connections into rows
+
+        :param ~numpy.ndarray pre: The pre-neuron of each synapse
+        :param ~numpy.ndarray post: The post-neuron of each synapse
+        :param ~numpy.ndarray weights: The weight of each synapse
+        :param ~numpy.ndarray delays: The delay of each synapse
+        :param tuple(int, int) shape:
+            The sizes of the populations, if not the largest neuron ids
+        :param str by: "pre" or "post", the neurons of the rows
+        :rtype: SparseWeights
+        """
+        pre = numpy.asarray(pre, dtype="int64").reshape(-1)
+        post = numpy.asarray(post, dtype="int64").reshape(-1)
+        if shape is None:
+            shape = (int(pre.max()) + 1 if len(pre) else 0,
+                     int(post.max()) + 1 if len(post) else 0)
+        rows, columns = (pre, post) if by == "pre" else (post, pre)
+        n_rows, n_columns = shape if by == "pre" else shape[::-1]
+        # One sort on a combined key groups the rows and orders each one
+        key = rows * max(n_columns, 1) + columns
+        order = numpy.argsort(key, kind="stable")
+        weights = numpy.broadcast_to(numpy.asarray(
+            weights, dtype="float64"), pre.shape)[order]
+        if delays is not None:
+            delays = numpy.broadcast_to(numpy.asarray(
+                delays, dtype="float64"), pre.shape)[order]
+        indptr = numpy.concatenate(([0], numpy.cumsum(
+            numpy.bincount(rows, minlength=n_rows)))).astype("int64")
+        return cls(shape, by, indptr, columns[order].astype("int32"),
+                   weights, delays)
+
+    @classmethod
+    def from_projection(cls, projection, by="pre"):
+        """ The synapses of a projection; only the connections that exist
+            are extracted, rather than a dense matrix
+
+        The synapses are read as columns where the simulator allows: from
+        get_columns on the local engine, and from the structured array in
+        the connection holder of sPyNNaker.  sPyNNaker still reads every
+        synapse off the machine and sorts them into the holder first, so
+        the columns are a second copy of the projection in memory; other
+        simulators return a list with a tuple for each synapse, which is
+        converted as it is.
+
+        :param projection: The projection
+        :param str by: "pre" or "post", the neurons of the rows
+        :rtype: SparseWeights
+        """
+        pre, post, weights, delays = _projection_columns(projection)
+        return cls.from_connections(
+            pre, post, weights, delays,
+            (projection.pre.size, projection.post.size), by)
+
+    @classmethod
+    def from_array(cls, weights, delays=None, by="pre"):
+        """ The synapses of a (pre, post) matrix with NaN where there is no
+            synapse, as from getWeights(format="array")
+
+        :param ~numpy.ndarray weights: The matrix of weights
+        :param ~numpy.ndarray delays: The matrix of delays
+        :param str by: "pre" or "post", the neurons of the rows
+        :rtype: SparseWeights
+        """
+        weights = numpy.asarray(weights, dtype="float64")
+        pre, post = numpy.nonzero(~numpy.isnan(weights))
+        if delays is not None:
+            delays = numpy.asarray(delays, dtype="float64")[pre, post]
+        return cls.from_connections(
+            pre, post, weights[pre, post], delays, weights.shape, by)
+
+    @property
+    def shape(self):
+        """ The sizes of the pre- and post-populations
+        """
+        return self.__shape
+
+    @property
+    def by(self):
+        return self.__by
+
+    @property
+    def first(self):
+        """ The neuron of the first row
+        """
+        return self.__first
+
+    @property
+    def indptr(self):
+        return self.__indptr
+
+    @property
+    def indices(self):
+        return self.__indices
+
+    @property
+    def weights(self):
+        return self.__weights
+
+    @property
+    def delays(self):
+        return self.__delays
+
+    def __len__(self):
+        return int(self.__indptr[-1])
+
+    @property
+    def n_rows(self):
+        return len(self.__indptr) - 1
+
+    def row(self, neuron):
+        """ The other neurons and weights of the synapses of one row
+
+        :param int neuron: The neuron of the row
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        first, last = self.__indptr[neuron - self.__first:
+                                    neuron - self.__first + 2]
+        return self.__indices[first:last], self.__weights[first:last]
+
+    def slice(self, first, last):
+        """ The rows of the neurons from first up to last, sharing the
+            arrays of these rows, so a memory-mapped matrix reads only them
+
+        :param int first: The first neuron
+        :param int last: The neuron after the last
+        :rtype: SparseWeights
+        """
+        first = max(first, self.__first)
+        last = max(first, min(last, self.__first + self.n_rows))
+        indptr = numpy.asarray(self.__indptr[
+            first - self.__first:last - self.__first + 1])
+        begin, end = int(indptr[0]), int(indptr[-1])
+        return SparseWeights(
+            self.__shape, self.__by, indptr - begin,
+            self.__indices[begin:end], self.__weights[begin:end],
+            None if self.__delays is None else self.__delays[begin:end],
+            first)
+
+    def coo(self):
+        """ The (pre, post, weight, delay) of every synapse, as columns
+
+        :rtype: tuple(~numpy.ndarray, ...)
+        """
+        rows = self.__first + numpy.repeat(
+            numpy.arange(self.n_rows), numpy.diff(self.__indptr))
+        columns = numpy.asarray(self.__indices, dtype="int64")
+        pre, post = (rows, columns) if self.__by == "pre" else (columns, rows)
+        return pre, post, numpy.asarray(self.__weights), (
+            None if self.__delays is None else numpy.asarray(self.__delays))
+
+    def reorder(self, by):
+        """ The same synapses with rows of the other neurons
+
+        :param str by: "pre" or "post"
+        :rtype: SparseWeights
+        """
+        n_rows = self.__shape[ORDERS.index(by)]
+        if by == self.__by and self.__first == 0 and self.n_rows == n_rows:
+            return self
+        pre, post, weights, delays = self.coo()
+        return SparseWeights.from_connections(
+            pre, post, weights, delays, self.__shape, by)
+
+    def to_scipy(self, attribute="weight"):
+        """ A scipy.sparse matrix of (pre, post) weights or delays; needs
+            SciPy
+
+        :param str attribute: "weight" or "delay"
+        :rtype: scipy.sparse.csr_matrix or scipy.sparse.csc_matrix
+        """
+        # pylint: disable=import-outside-toplevel
+        import scipy.sparse
+        values = self.__weights if attribute == "weight" else self.__delays
+        indptr = numpy.asarray(self.__indptr)
+        if self.__by == "pre":
+            indptr = numpy.concatenate((
+                numpy.zeros(self.__first, "int64"), indptr,
+                numpy.full(self.__shape[0] - self.__first - self.n_rows,
+                           indptr[-1])))
+            return scipy.sparse.csr_matrix(
+                (values, self.__indices, indptr), shape=self.__shape)
+        indptr = numpy.concatenate((
+            numpy.zeros(self.__first, "int64"), indptr,
+            numpy.full(self.__shape[1] - self.__first - self.n_rows,
+                       indptr[-1])))
+        return scipy.sparse.csc_matrix(
+            (values, self.__indices, indptr), shape=self.__shape)
+
+
+def save_sparse(path, weights):
+    """ Write a matrix to a directory in both orders, to be read back with
+        SparseWeightsFile
+
+    :param str path: The directory, created if needed
+    :param SparseWeights weights: The synapses
+    """
+    os.makedirs(path, exist_ok=True)
+    for by in ORDERS:
+        matrix = weights.reorder(by)
+        arrays = {"indptr": matrix.indptr, "indices": matrix.indices,
+                  "weights": matrix.weights}
+        if matrix.delays is not None:
+            arrays["delays"] = matrix.delays
+        for name, values in arrays.items():
+            numpy.save(os.path.join(path, "{}_{}.npy".format(by, name)),
+                       numpy.ascontiguousarray(values))
+    with open(os.path.join(path, "matrix.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": _VERSION, "shape": list(weights.shape),
+                   "n_synapses": len(weights),
+                   "delays": weights.delays is not None}, f)
+
+
+class SparseWeightsFile(object):
+    """ A matrix written by save_sparse, memory-mapped
+    """
+
+    __slots__ = ["__matrices", "__shape"]
+
+    def __init__(self, path):
+        """
+        :param str path: The directory of the matrix
+        """
+        with open(os.path.join(path, "matrix.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["version"] != _VERSION:
+            raise ValueError("{} holds version {} rather than {}".format(
+                path, meta["version"], _VERSION))
+        self.__shape = tuple(meta["shape"])
+        self.__matrices = dict()
+        for by in ORDERS:
+            def load(name, by=by):
+                return numpy.load(
+                    os.path.join(path, "{}_{}.npy".format(by, name)),
+                    mmap_mode="r")
+            self.__matrices[by] = SparseWeights(
+                self.__shape, by, load("indptr"), load("indices"),
+                load("weights"), load("delays") if meta["delays"] else None)
+
+    @property
+    def shape(self):
+        return self.__shape
+
+    def by_pre(self, first=0, last=None):
+        """ The synapses of the pre-neurons from first up to last
+
+        :rtype: SparseWeights
+        """
+        if last is None:
+            last = self.__shape[0]
+        return self.__matrices["pre"].slice(first, last)
+
+    def by_post(self, first=0, last=None):
+        """ The synapses of the post-neurons from first up to last
+
+        :rtype: SparseWeights
+        """
+        if last is None:
+            last = self.__shape[1]
+        return self.__matrices["post"].slice(first, last)
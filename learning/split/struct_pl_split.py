@@ -1,11 +1,11 @@
+import pyNN.utility.plotting as plot
 import matplotlib.pyplot as plt
 import numpy
-import pyNN.utility.plotting as plot
 import pyNN.spiNNaker as sim
 from spynnaker.pyNN.extra_algorithms.splitter_components import (
     SplitterAbstractPopulationVertexNeuronsSynapses, SplitterPoissonDelegate)
 
-n_neurons = 64
+n_neurons = 100
 simtime = 5000
 
 sim.setup(timestep=1.0)
@@ -44,6 +44,10 @@ sim.Projection(training, pre_pop,  sim.OneToOneConnector(),
 sim.Projection(training, post_pop, sim.OneToOneConnector(),
                synapse_type=sim.StaticSynapse(weight=5.0, delay=10.0))
 
+timing_rule = sim.SpikePairRule(tau_plus=20.0, tau_minus=20.0,
+                                A_plus=0.5, A_minus=0.5)
+weight_rule = sim.AdditiveWeightDependence(w_max=5.0, w_min=0.0)
+
 # Structurally plastic connection between pre_pop and post_pop
 partner_selection_last_neuron = sim.RandomSelection()
 formation_distance = sim.DistanceDependentFormation(
@@ -1,16 +1,15 @@
+import pyNN.utility.plotting as plot
 import matplotlib.pyplot as plt
 import numpy
 import pyNN.spiNNaker as sim
-import pyNN.utility.plotting as plot
 from spynnaker.pyNN.extra_algorithms.splitter_components import (
     SplitterAbstractPopulationVertexNeuronsSynapses, SplitterPoissonDelegate)
 
-n_neurons = 192
+n_neurons = 100
 simtime = 5000
 
 sim.setup(timestep=1.0)
 
-sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 64)
 pre_splitter = SplitterAbstractPopulationVertexNeuronsSynapses(1, 128, False)
 pre_pop = sim.Population(
     n_neurons, sim.IF_curr_exp(), label="Pre", additional_parameters={
@@ -13,50 +13,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import numpy
 import pyNN.utility.plotting as plot
 import matplotlib.pyplot as plt
 import pyNN.spiNNaker as sim
+from learning.stdp_offline import parameters_from_rules, weight_trajectories
+from learning.stdp_trials import TrialProtocol, build_network
+from spike_data.columns import SpikeColumns
 
 n_neurons = 100
 simtime = 5000
 
 sim.setup(timestep=1.0)
 
-pre_pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="Pre")
-post_pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="Post")
-pre_noise = sim.Population(
-    n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Pre")
-post_noise = sim.Population(
-    n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Post")
-
-pre_pop.record("spikes")
-post_pop.record("spikes")
-
-training = sim.Population(
-    n_neurons,
-    sim.SpikeSourcePoisson(rate=10.0, start=1500.0, duration=1500.0),
-    label="Training")
-
-sim.Projection(pre_noise,  pre_pop,  sim.OneToOneConnector(),
-               synapse_type=sim.StaticSynapse(weight=2.0))
-sim.Projection(post_noise, post_pop, sim.OneToOneConnector(),
-               synapse_type=sim.StaticSynapse(weight=2.0))
-
-sim.Projection(training, pre_pop,  sim.OneToOneConnector(),
-               synapse_type=sim.StaticSynapse(weight=5.0, delay=1.0))
-sim.Projection(training, post_pop, sim.OneToOneConnector(),
-               synapse_type=sim.StaticSynapse(weight=5.0, delay=10.0))
-
-timing_rule = sim.SpikePairRule(tau_plus=20.0, tau_minus=20.0,
-                                A_plus=0.5, A_minus=0.5)
-weight_rule = sim.AdditiveWeightDependence(w_max=5.0, w_min=0.0)
-
-stdp_model = sim.STDPMechanism(timing_dependence=timing_rule,
-                               weight_dependence=weight_rule,
-                               weight=0.0, delay=5.0)
-
-stdp_projection = sim.Projection(pre_pop, post_pop, sim.OneToOneConnector(),
-                                 synapse_type=stdp_model)
+# The training fires at 10 Hz from 1500 ms to 3000 ms
+network = build_network(sim, TrialProtocol(
+    n_trials=1, trial_length=simtime, start=1500.0, duration=1500.0,
+    rate=10.0), n_neurons)
+pre_pop = network.pre_pop
+post_pop = network.post_pop
+stdp_projection = network.projection
+timing_rule = network.timing_rule
+weight_rule = network.weight_rule
 
 sim.run(simtime)
 
@@ -66,7 +44,18 @@ pre_spikes = pre_neo.segments[0].spiketrains
 post_neo = post_pop.get_data(variables=["spikes"])
 post_spikes = post_neo.segments[0].spiketrains
 
-print(stdp_projection.getWeights())
+weights = stdp_projection.getWeights()
+print(weights)
+
+# Follow the weights through the run offline, from the recorded spikes
+trajectories = weight_trajectories(
+    SpikeColumns.from_neo(pre_neo).as_array(),
+    SpikeColumns.from_neo(post_neo).as_array(),
+    numpy.arange(n_neurons), numpy.arange(n_neurons), 5.0, 0.0,
+    parameters_from_rules(timing_rule, weight_rule), n_pre=n_neurons,
+    n_post=n_neurons)
+print("Largest difference from the offline weights: {:.4f}".format(
+    numpy.max(numpy.abs(trajectories.final - numpy.asarray(weights)))))
 
 sim.end()
 
@@ -0,0 +1,350 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Reconstruct how the weights of an STDP projection evolved from the recorded
+spikes, offline and without rerunning, for the SpikePairRule with the
+AdditiveWeightDependence.
+
+This follows the deferred updates of sPyNNaker: a synapse is only updated
+when its pre-synaptic spike arrives, applying the potentiation of the
+post-synaptic spikes since the last one (seen through the dendritic delay,
+which is the synaptic delay) and then the depression of the new spike, and
+clamping the result to [w_min, w_max].  The traces add up over all pairs,
+and A_plus and A_minus are relative to w_max, as in PyNN.  The weights of
+the board are fixed point, so they match to within a small tolerance.
+"""
+
+from collections import namedtuple
+import numpy
+
+#: The parameters of the SpikePairRule and AdditiveWeightDependence
+STDPParameters = namedtuple("STDPParameters", [
+    "tau_plus", "tau_minus", "A_plus", "A_minus", "w_min", "w_max"])
+
+#: The most (synapse, spike) pairs handled at once
+_MAX_BLOCK = 2 ** 22
+
+#: The most (neuron, step) entries in a table of spike counts
+_MAX_TABLE = 2 ** 26
+
+
+def parameters_from_rules(timing_rule, weight_rule):
+    """ The parameters of a SpikePairRule and AdditiveWeightDependence
+
+    :rtype: STDPParameters
+    """
+    return STDPParameters(
+        timing_rule.tau_plus, timing_rule.tau_minus, timing_rule.A_plus,
+        timing_rule.A_minus, weight_rule.w_min, weight_rule.w_max)
+
+
+class _Trains(object):
+    """ The spike trains of a population in time steps, sorted by neuron
+        then time, with the trace of the rule just after each spike
+    """
+
+    __slots__ = ["steps", "offsets", "keys", "traces", "span", "counts_to"]
+
+    def __init__(self, spikes, n_neurons, timestep, tau, span):
+        spikes = numpy.asarray(spikes, dtype="float64").reshape(-1, 2)
+        keys = spikes[:, 0].astype("int64") * span + numpy.round(
+            spikes[:, 1] / timestep).astype("int64")
+        # Recorded spikes usually come sorted by neuron then time already
+        if numpy.any(keys[1:] < keys[:-1]):
+            keys.sort()
+        ids = keys // span
+        self.steps = keys - ids * span
+        self.offsets = numpy.searchsorted(ids, numpy.arange(n_neurons + 1))
+        self.span = span
+        self.keys = keys
+        self.traces = self.__traces(ids, timestep, tau)
+        # The spikes before each (neuron, step), when that is small enough
+        # to look up rather than search for
+        self.counts_to = None
+        if n_neurons * span <= _MAX_TABLE:
+            self.counts_to = numpy.concatenate(([0], numpy.cumsum(
+                numpy.bincount(keys, minlength=n_neurons * span),
+                dtype="int32" if len(keys) < 2 ** 31 else "int64")))
+
+    def __traces(self, ids, timestep, tau):
+        # Each trace decays from the last spike of its neuron and adds one;
+        # the recurrence runs over the spike index of every neuron at once
+        counts = numpy.diff(self.offsets)
+        traces = numpy.ones(len(self.steps))
+        if not len(traces):
+            return traces
+        index = numpy.arange(len(self.steps)) - self.offsets[ids]
+        decay = numpy.ones(len(self.steps))
+        later = index > 0
+        decay[later] = numpy.exp(-numpy.diff(self.steps)[
+            numpy.flatnonzero(later) - 1] * timestep / tau)
+        for k in range(1, counts.max()):
+            at = self.offsets[:-1][counts > k] + k
+            traces[at] += traces[at - 1] * decay[at]
+        return traces
+
+    def counts(self, neurons):
+        return self.offsets[neurons + 1] - self.offsets[neurons]
+
+    def last_before(self, neurons, steps, inclusive):
+        """ The index of the last spike of each neuron before each step, or
+            -1 if there is none
+        """
+        keys = neurons * self.span + steps
+        if self.counts_to is None:
+            index = numpy.searchsorted(
+                self.keys, keys, side="right" if inclusive else "left") - 1
+        else:
+            if inclusive:
+                keys += 1
+            numpy.maximum(keys, 0, out=keys)
+            index = self.counts_to[keys] - 1
+        index[index < self.offsets[neurons]] = -1
+        return index
+
+
+def _pairs(trains, neurons):
+    """ Each spike of the neuron of each synapse, as the synapse index and
+        the spike index
+    """
+    counts = trains.counts(neurons)
+    synapses = numpy.repeat(numpy.arange(len(neurons)), counts)
+    starts = numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    spikes = (numpy.arange(len(synapses)) - starts +
+              trains.offsets[neurons][synapses])
+    return synapses, spikes
+
+
+class WeightTrajectories(object):
+    """ The weight of each synapse after each of its updates; the updates of
+        synapse i are those from indptr[i] to indptr[i + 1]
+    """
+
+    __slots__ = ["__indptr", "__times", "__weights", "__initial"]
+
+    def __init__(self, indptr, times, weights, initial):
+        self.__indptr = indptr
+        self.__times = times
+        self.__weights = weights
+        self.__initial = initial
+
+    @property
+    def indptr(self):
+        return self.__indptr
+
+    @property
+    def times(self):
+        """ The time of each update in ms
+        """
+        return self.__times
+
+    @property
+    def weights(self):
+        """ The weight after each update
+        """
+        return self.__weights
+
+    @property
+    def initial(self):
+        return self.__initial
+
+    def __len__(self):
+        return len(self.__initial)
+
+    @property
+    def final(self):
+        """ The weight of each synapse after its last update
+        """
+        final = self.__initial.copy()
+        updated = numpy.diff(self.__indptr) > 0
+        final[updated] = self.__weights[self.__indptr[1:][updated] - 1]
+        return final
+
+    def synapse(self, index):
+        """ The times and weights of the updates of one synapse
+
+        :param int index: The synapse
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        first, last = self.__indptr[index:index + 2]
+        return self.__times[first:last], self.__weights[first:last]
+
+    def at(self, time):
+        """ The weight of every synapse at a time, including any update at
+            that time
+
+        :param float time: The time in ms
+        :rtype: ~numpy.ndarray
+        """
+        counts = numpy.diff(self.__indptr)
+        synapses = numpy.repeat(numpy.arange(len(counts)), counts)
+        n_done = numpy.bincount(
+            synapses[self.__times <= time], minlength=len(counts))
+        weights = self.__initial.copy()
+        updated = n_done > 0
+        weights[updated] = self.__weights[
+            self.__indptr[:-1][updated] + n_done[updated] - 1]
+        return weights
+
+
+def _clipped_cumsum(deltas, indptr, initial, w_min, w_max):
+    """ The weights after each update, clamping after each one
+    """
+    counts = numpy.diff(indptr)
+    cumulative = numpy.cumsum(deltas)
+    before = numpy.concatenate(([0.0], cumulative))[indptr[:-1]]
+    weights = cumulative + numpy.repeat(initial - before, counts)
+
+    # Only synapses that reach a bound need to be followed update by update
+    outside = (weights < w_min) | (weights > w_max)
+    has_updates = counts > 0
+    reached = numpy.zeros(len(counts), dtype=bool)
+    reached[has_updates] = numpy.logical_or.reduceat(
+        outside, indptr[:-1][has_updates])
+    clamped = numpy.flatnonzero(reached)
+    if len(clamped):
+        # Longest first, so that those still updating are a prefix
+        clamped = clamped[numpy.argsort(-counts[clamped], kind="stable")]
+        first = indptr[clamped]
+        n_active = numpy.searchsorted(
+            -counts[clamped], -numpy.arange(counts[clamped[0]]), side="left")
+        weight = initial[clamped]
+        for k, n in enumerate(n_active):
+            at = first[:n] + k
+            weight[:n] = numpy.clip(weight[:n] + deltas[at], w_min, w_max)
+            weights[at] = weight[:n]
+    return weights
+
+
+def weight_trajectories(
+        pre_spikes, post_spikes, pre_ids, post_ids, delays, initial_weights,
+        parameters, timestep=1.0, n_pre=None, n_post=None, flush=False):
+    """ Follow the weight of every synapse of a projection through the run
+
+    :param ~numpy.ndarray pre_spikes:
+        The (id, time) of each spike of the pre-population, as from
+        spinnaker_get_data("spikes")
+    :param ~numpy.ndarray post_spikes: The same for the post-population
+    :param ~numpy.ndarray pre_ids: The pre-neuron of each synapse
+    :param ~numpy.ndarray post_ids: The post-neuron of each synapse
+    :param delays: The delay of each synapse in ms, or one for all
+    :param initial_weights: The starting weight of each synapse, or one
+    :param STDPParameters parameters: The rule
+    :param float timestep: The time step in ms
+    :param int n_pre: The size of the pre-population, if not the largest id
+    :param int n_post: The size of the post-population
+    :param bool flush:
+        Whether to apply the potentiation of post-synaptic spikes after
+        the last pre-synaptic spike, which the board holds back
+    :rtype: WeightTrajectories
+    """
+    pre_ids = numpy.asarray(pre_ids, dtype="int64")
+    post_ids = numpy.asarray(post_ids, dtype="int64")
+    n_synapses = len(pre_ids)
+    delay_steps = numpy.round(numpy.broadcast_to(
+        numpy.asarray(delays, dtype="float64"), (n_synapses, )) /
+        timestep).astype("int64")
+    initial = numpy.array(numpy.broadcast_to(numpy.asarray(
+        initial_weights, dtype="float64"), (n_synapses, )))
+    pre_spikes = numpy.asarray(pre_spikes, dtype="float64").reshape(-1, 2)
+    post_spikes = numpy.asarray(post_spikes, dtype="float64").reshape(-1, 2)
+    if n_pre is None:
+        n_pre = int(max(pre_ids.max(initial=-1),
+                        pre_spikes[:, 0].max(initial=-1))) + 1
+    if n_post is None:
+        n_post = int(max(post_ids.max(initial=-1),
+                         post_spikes[:, 0].max(initial=-1))) + 1
+    last_step = numpy.round(max(
+        pre_spikes[:, 1].max(initial=0), post_spikes[:, 1].max(initial=0)) /
+        timestep)
+    span = int(last_step + delay_steps.max(initial=0)) + 2
+    pre = _Trains(pre_spikes, n_pre, timestep, parameters.tau_plus, span)
+    post = _Trains(post_spikes, n_post, timestep, parameters.tau_minus, span)
+    a_plus = parameters.A_plus * parameters.w_max
+    a_minus = parameters.A_minus * parameters.w_max
+
+    # One update for each pre-synaptic spike of each synapse, and one more
+    # at the end when flushing
+    counts = pre.counts(pre_ids) + int(flush)
+    indptr = numpy.concatenate(([0], numpy.cumsum(counts)))
+    deltas = numpy.zeros(indptr[-1])
+    times = numpy.zeros(indptr[-1])
+
+    # Each synapse pairs with the spikes of its pre- and post-neurons
+    spikes_per_synapse = (
+        len(pre_spikes) / max(n_pre, 1) + len(post_spikes) / max(n_post, 1))
+    n_per_block = max(1, int(_MAX_BLOCK / max(spikes_per_synapse, 1.0)))
+    # The decay of each trace over any number of steps
+    elapsed = numpy.arange(span + 1) * timestep
+    plus_decay = numpy.exp(-elapsed / parameters.tau_plus)
+    minus_decay = numpy.exp(-elapsed / parameters.tau_minus)
+    for first in range(0, n_synapses, n_per_block):
+        block = slice(first, min(first + n_per_block, n_synapses))
+        _block_updates(pre, post, pre_ids[block], post_ids[block],
+                       delay_steps[block], indptr[block.start:block.stop + 1],
+                       deltas, times, a_plus, a_minus, plus_decay,
+                       minus_decay, timestep, flush)
+    if flush:
+        times[indptr[1:][counts > 0] - 1] = last_step * timestep
+    weights = _clipped_cumsum(
+        deltas, indptr, initial, parameters.w_min, parameters.w_max)
+    return WeightTrajectories(indptr, times, weights, initial)
+
+
+def _block_updates(pre, post, pre_ids, post_ids, delay_steps, indptr,
+                   deltas, times, a_plus, a_minus, plus_decay, minus_decay,
+                   timestep, flush):
+    first, end = indptr[0], indptr[-1]
+    n_pre_spikes = pre.counts(pre_ids)
+    # The updates of the pre-synaptic spikes fill the block in order, leaving
+    # out the last update of each synapse when flushing
+    spike_updates = slice(first, end)
+    if flush:
+        spike_updates = numpy.ones(end - first, dtype=bool)
+        spike_updates[indptr[1:] - 1 - first] = False
+        spike_updates = numpy.flatnonzero(spike_updates) + first
+
+    # Depression as each pre-synaptic spike arrives, from the trace of the
+    # last post-synaptic spike seen by then, unless it came at that moment
+    synapses, spikes = _pairs(pre, pre_ids)
+    step = pre.steps[spikes]
+    times[spike_updates] = step * timestep
+    delay = delay_steps[synapses]
+    last_post = post.last_before(post_ids[synapses], step - delay, True)
+    elapsed = step - delay - post.steps[last_post]
+    depressed = (last_post >= 0) & (elapsed > 0)
+    numpy.maximum(elapsed, 0, out=elapsed)
+    deltas[spike_updates] -= numpy.where(
+        depressed, a_minus * post.traces[last_post] * minus_decay[elapsed],
+        0.0)
+
+    # Potentiation for each post-synaptic spike, from the trace of the last
+    # pre-synaptic spike before it, applied at the next pre-synaptic spike
+    synapses, spikes = _pairs(post, post_ids)
+    step = post.steps[spikes] + delay_steps[synapses]
+    pre_neurons = pre_ids[synapses]
+    last_pre = pre.last_before(pre_neurons, step, False)
+    # The index of the update that applies it among those of the synapse
+    n_before = last_pre - pre.offsets[pre_neurons] + 1
+    applied = last_pre >= 0
+    if not flush:
+        applied &= n_before < n_pre_spikes[synapses]
+    last_pre = last_pre[applied]
+    update = indptr[synapses[applied]] + n_before[applied] - first
+    potentiation = a_plus * pre.traces[last_pre] * plus_decay[
+        step[applied] - pre.steps[last_pre]]
+    deltas[first:end] += numpy.bincount(
+        update, potentiation, minlength=end - first)
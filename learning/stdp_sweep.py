@@ -0,0 +1,186 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Sweep the parameters of the STDP rule of learning/stdp.py in one run, e.g.::
+
+    python -m learning.stdp_sweep --grid tau_plus=10,20,40 \\
+        --grid A_plus=0.1,0.5 --block-size 10 --output sweep.csv
+
+The pre- and post-neurons of stdp.py are connected one to one, so each
+pair learns independently of the others.  The pairs are packed into one
+large pre-population and split into a block of pairs for each point of the
+sweep, each with its own STDPMechanism.  sPyNNaker needs all the plastic
+projections into a population to share one rule, so each block has a
+post-population of its own, all fed from views of the same noise and
+training sources; a sweep of N points so needs at least N cores for the
+post-populations, however small the blocks.
+"""
+
+import argparse
+import csv
+import numpy
+from balanced_random.sweep import format_table, grid
+from learning.stdp_trials import TrialProtocol, run_time, training_schedule
+
+#: The parameters of the rule that can be swept, with the values of stdp.py
+DEFAULTS = {"tau_plus": 20.0, "tau_minus": 20.0, "A_plus": 0.5,
+            "A_minus": 0.5, "w_max": 5.0}
+
+
+def blocks(n_points, block_size):
+    """ The first and the one after the last pair of each point
+
+    :param int n_points: The number of points of the sweep
+    :param int block_size: The number of pairs of each point
+    :rtype: list(tuple(int, int))
+    """
+    return [(i * block_size, (i + 1) * block_size) for i in range(n_points)]
+
+
+def build_network(sim, points, block_size, protocol=TrialProtocol()):
+    """ Build the network of stdp.py with a block of pairs for each point
+
+    :param sim: The simulator, already set up
+    :param list(dict) points: The parameters of the rule of each point;
+        those not given are those of stdp.py
+    :param int block_size: The number of pairs of each point
+    :param ~learning.stdp_trials.TrialProtocol protocol:
+        The training; one trial, as in stdp.py, by default
+    :return: The pre-population and the post-population and plastic
+        projection of each block
+    :rtype: tuple
+    """
+    n_neurons = len(points) * block_size
+    pre_pop = sim.Population(n_neurons, sim.IF_curr_exp(), label="Pre")
+    pre_noise = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Pre")
+    post_noise = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Post")
+    training = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(**training_schedule(protocol)),
+        label="Training")
+    pre_pop.record("spikes")
+    sim.Projection(pre_noise, pre_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=2.0))
+    sim.Projection(training, pre_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=5.0, delay=1.0))
+
+    post_pops = list()
+    projections = list()
+    for i, ((first, last), point) in enumerate(
+            zip(blocks(len(points), block_size), points)):
+        parameters = dict(DEFAULTS)
+        parameters.update(point)
+        post_pop = sim.Population(
+            block_size, sim.IF_curr_exp(), label="Post_{}".format(i))
+        post_pop.record("spikes")
+        sim.Projection(post_noise[first:last], post_pop,
+                       sim.OneToOneConnector(),
+                       synapse_type=sim.StaticSynapse(weight=2.0))
+        sim.Projection(training[first:last], post_pop,
+                       sim.OneToOneConnector(),
+                       synapse_type=sim.StaticSynapse(weight=5.0, delay=10.0))
+        stdp_model = sim.STDPMechanism(
+            timing_dependence=sim.SpikePairRule(
+                tau_plus=parameters["tau_plus"],
+                tau_minus=parameters["tau_minus"],
+                A_plus=parameters["A_plus"], A_minus=parameters["A_minus"]),
+            weight_dependence=sim.AdditiveWeightDependence(
+                w_max=parameters["w_max"], w_min=0.0),
+            weight=0.0, delay=5.0)
+        projections.append(sim.Projection(
+            pre_pop[first:last], post_pop, sim.OneToOneConnector(),
+            synapse_type=stdp_model))
+        post_pops.append(post_pop)
+    return pre_pop, post_pops, projections
+
+
+def summarise_blocks(points, weights):
+    """ A row of the parameters and the final weights of each point
+
+    :param list(dict) points: The swept parameters of each point
+    :param list(~numpy.ndarray) weights: The final weights of each block
+    :rtype: list(dict)
+    """
+    records = list()
+    for point, block in zip(points, weights):
+        parameters = dict(DEFAULTS)
+        parameters.update(point)
+        block = numpy.asarray(block, dtype="float64")
+        record = dict(parameters)
+        record.update({
+            "mean_weight": float(block.mean()),
+            "std_weight": float(block.std()),
+            "fraction_at_w_max": float(numpy.mean(
+                block >= parameters["w_max"]))})
+        records.append(record)
+    return records
+
+
+def run_sweep(sim, points, block_size, protocol=TrialProtocol()):
+    """ Run every point of a sweep in one simulation
+
+    :param sim: The simulator, such as pyNN.spiNNaker
+    :param list(dict) points: The parameters of the rule of each point
+    :param int block_size: The number of pairs of each point
+    :param ~learning.stdp_trials.TrialProtocol protocol: The training
+    :rtype: list(dict)
+    """
+    sim.setup(timestep=1.0)
+    _pre_pop, _post_pops, projections = build_network(
+        sim, points, block_size, protocol)
+    sim.run(run_time(protocol))
+    weights = [projection.getWeights() for projection in projections]
+    sim.end()
+    return summarise_blocks(points, weights)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[1],
+        epilog="Each point has a post-population of its own, so N points "
+        "need at least N cores for the post-populations.")
+    parser.add_argument("--grid", action="append", default=[],
+                        metavar="NAME=V1,V2,...",
+                        help="values of a parameter of the rule to sweep")
+    parser.add_argument("--block-size", type=int, default=10,
+                        help="pairs of neurons for each point")
+    parser.add_argument("--trials", type=int, default=1,
+                        help="training windows, 5 s apart, in the run")
+    parser.add_argument("--output", help="CSV file of the results")
+    args = parser.parse_args(argv)
+
+    values = dict()
+    for text in args.grid:
+        name, value = text.split("=", 1)
+        if name not in DEFAULTS:
+            parser.error("{} is not one of {}".format(
+                name, ", ".join(DEFAULTS)))
+        values[name] = [float(v) for v in value.split(",")]
+    # pylint: disable=import-outside-toplevel
+    import pyNN.spiNNaker as sim
+    records = run_sweep(sim, grid(**values), args.block_size,
+                        TrialProtocol(n_trials=args.trials))
+    print(format_table(records))
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Repeat the training of learning/stdp.py as several trials in one run, so
+that the network is mapped and loaded once rather than once per trial,
+e.g.::
+
+    python -m learning.stdp_trials --trials 10 --output trials.snap
+
+Trial i takes trial_length ms from i * trial_length, with the training
+source firing from start to start + duration within it; the gap until the
+next window lets the traces of the rule die away.  The weights are
+snapshotted at each trial boundary, either offline from the recorded
+spikes (the default, which runs without stopping) or by stopping at each
+boundary to read them from the machine; offline, the weights are still
+read once at the end, and their largest difference from those computed is
+reported.  The weights carry over from one
+trial to the next, as they would in repeated training; each trial's
+change is the difference between the snapshots at its two ends.
+"""
+
+import argparse
+from collections import namedtuple
+import os
+import numpy
+from learning.stdp_offline import parameters_from_rules, weight_trajectories
+from learning.weight_snapshots import (
+    WeightSnapshotWriter, run_with_snapshots, snapshots_from_trajectories)
+
+#: The training of each trial: its length, the start and duration of the
+#: training window within it in ms, and the rate of the training in Hz
+TrialProtocol = namedtuple("TrialProtocol", [
+    "n_trials", "trial_length", "start", "duration", "rate"],
+    defaults=[1, 5000.0, 1500.0, 1500.0, 10.0])
+
+#: The populations and the plastic projection of the network
+STDPNetwork = namedtuple("STDPNetwork", [
+    "pre_pop", "post_pop", "training", "projection", "timing_rule",
+    "weight_rule"])
+
+#: The weights at each trial boundary, the change over each trial, and
+#: when the weights were computed offline, the largest difference of those
+#: at the end from the weights read from the projection
+TrialResults = namedtuple("TrialResults", [
+    "boundaries", "weights", "changes", "offline_difference"],
+    defaults=[None])
+
+
+def run_time(protocol):
+    """ The length of the run of all the trials in ms
+
+    :param TrialProtocol protocol: The trials
+    :rtype: float
+    """
+    return protocol.n_trials * protocol.trial_length
+
+
+def training_schedule(protocol):
+    """ The rates, starts and durations of the training source, with one
+        segment for the window of each trial
+
+    :param TrialProtocol protocol: The trials
+    :rtype: dict(str, list(float))
+    """
+    if protocol.start + protocol.duration > protocol.trial_length:
+        raise ValueError("The training window must end within the trial")
+    starts = [i * protocol.trial_length + protocol.start
+              for i in range(protocol.n_trials)]
+    return {"rates": [protocol.rate] * protocol.n_trials,
+            "starts": starts,
+            "durations": [protocol.duration] * protocol.n_trials}
+
+
+def build_network(sim, protocol, n_neurons=100, splitters=None):
+    """ Build the network of learning/stdp.py, which that script builds
+        through this, with the training windows of all the trials in one
+        source
+
+    :param sim: The simulator, already set up
+    :param TrialProtocol protocol: The trials
+    :param int n_neurons: The number of neurons of each population
+    :param splitters:
+        A function of the cell class of each population giving the splitter
+        to place it with, or None for the default of the simulator
+    :rtype: STDPNetwork
+    """
+    def additional(cellclass):
+        splitter = None if splitters is None else splitters(cellclass)
+        return {} if splitter is None else {"splitter": splitter}
+
+    pre_pop = sim.Population(
+        n_neurons, sim.IF_curr_exp(), label="Pre",
+        additional_parameters=additional(sim.IF_curr_exp))
+    post_pop = sim.Population(
+        n_neurons, sim.IF_curr_exp(), label="Post",
+        additional_parameters=additional(sim.IF_curr_exp))
+    pre_noise = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Pre",
+        additional_parameters=additional(sim.SpikeSourcePoisson))
+    post_noise = sim.Population(
+        n_neurons, sim.SpikeSourcePoisson(rate=10.0), label="Noise_Post",
+        additional_parameters=additional(sim.SpikeSourcePoisson))
+    pre_pop.record("spikes")
+    post_pop.record("spikes")
+    if protocol.n_trials == 1:
+        # One window needs only the plain source of stdp.py
+        training_source = sim.SpikeSourcePoisson(
+            rate=protocol.rate, start=protocol.start,
+            duration=protocol.duration)
+    else:
+        training_source = sim.SpikeSourcePoisson(
+            **training_schedule(protocol))
+    training = sim.Population(
+        n_neurons, training_source, label="Training",
+        additional_parameters=additional(sim.SpikeSourcePoisson))
+
+    sim.Projection(pre_noise, pre_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=2.0))
+    sim.Projection(post_noise, post_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=2.0))
+    sim.Projection(training, pre_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=5.0, delay=1.0))
+    sim.Projection(training, post_pop, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=5.0, delay=10.0))
+
+    timing_rule = sim.SpikePairRule(tau_plus=20.0, tau_minus=20.0,
+                                    A_plus=0.5, A_minus=0.5)
+    weight_rule = sim.AdditiveWeightDependence(w_max=5.0, w_min=0.0)
+    stdp_model = sim.STDPMechanism(timing_dependence=timing_rule,
+                                   weight_dependence=weight_rule,
+                                   weight=0.0, delay=5.0)
+    projection = sim.Projection(pre_pop, post_pop, sim.OneToOneConnector(),
+                                synapse_type=stdp_model)
+    return STDPNetwork(pre_pop, post_pop, training, projection, timing_rule,
+                       weight_rule)
+
+
+def trial_results(snapshots, protocol):
+    """ The weights at the trial boundaries and the change over each trial
+
+    :param ~learning.weight_snapshots.WeightSnapshots snapshots:
+        Snapshots that include one at each boundary
+    :param TrialProtocol protocol: The trials
+    :rtype: TrialResults
+    """
+    boundaries = numpy.arange(protocol.n_trials + 1) * protocol.trial_length
+    weights = numpy.array([snapshots.at(time) for time in boundaries])
+    return TrialResults(boundaries, weights, numpy.diff(weights, axis=0))
+
+
+def run_trials(sim, protocol, path, n_neurons=100, offline=True):
+    """ Run all the trials in one simulation, snapshotting the weights at
+        each trial boundary
+
+    :param sim: The simulator, such as pyNN.spiNNaker
+    :param TrialProtocol protocol: The trials
+    :param str path: The file of weight snapshots, replaced if it exists
+    :param int n_neurons: The number of neurons of each population
+    :param bool offline:
+        Whether to compute the snapshots from the recorded spikes rather
+        than stopping at each boundary to read the weights
+    :rtype: TrialResults
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    sim.setup(timestep=1.0)
+    network = build_network(sim, protocol, n_neurons)
+    if offline:
+        sim.run(run_time(protocol))
+        pre = network.pre_pop.spinnaker_get_data("spikes")
+        post = network.post_pop.spinnaker_get_data("spikes")
+        trajectories = weight_trajectories(
+            pre, post, numpy.arange(n_neurons), numpy.arange(n_neurons),
+            5.0, 0.0, parameters_from_rules(
+                network.timing_rule, network.weight_rule),
+            n_pre=n_neurons, n_post=n_neurons)
+        snapshots = snapshots_from_trajectories(
+            trajectories, run_time(protocol), protocol.trial_length, path,
+            dtype="float64")
+        # The weights are read once at the end, so that a model that does
+        # not match the simulator is seen
+        difference = float(numpy.max(numpy.abs(
+            trajectories.final -
+            numpy.asarray(network.projection.getWeights()))))
+    else:
+        # The weights cannot be read before the run, so start from the
+        # initial weights, which the snapshots of the run are added to
+        with WeightSnapshotWriter(path, n_neurons, "float64") as writer:
+            writer.append(0.0, numpy.zeros(n_neurons))
+        snapshots = run_with_snapshots(
+            sim, network.projection, run_time(protocol),
+            protocol.trial_length, path, dtype="float64")
+        difference = None
+    sim.end()
+    return trial_results(snapshots, protocol)._replace(
+        offline_difference=difference)
+
+
+def format_trials(results):
+    """ Format the mean and spread of the change of the weights in each
+        trial as a text table
+
+    :param TrialResults results: The results of the trials
+    :rtype: str
+    """
+    lines = ["trial  mean_change  std_change  mean_weight"]
+    for i, change in enumerate(results.changes):
+        lines.append("{:5d}  {:11.4f}  {:10.4f}  {:11.4f}".format(
+            i, change.mean(), change.std(), results.weights[i + 1].mean()))
+    if results.offline_difference is not None:
+        lines.append("Largest difference from the offline weights: "
+                     "{:.4f}".format(results.offline_difference))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--trial-length", type=float, default=5000.0)
+    parser.add_argument("--start", type=float, default=1500.0)
+    parser.add_argument("--duration", type=float, default=1500.0)
+    parser.add_argument("--rate", type=float, default=10.0)
+    parser.add_argument("--n-neurons", type=int, default=100)
+    parser.add_argument("--online", action="store_true",
+                        help="stop at each boundary to read the weights")
+    parser.add_argument("--output", default="stdp_trials.snap",
+                        help="file of the weight snapshots")
+    args = parser.parse_args(argv)
+
+    # pylint: disable=import-outside-toplevel
+    import pyNN.spiNNaker as sim
+    protocol = TrialProtocol(args.trials, args.trial_length, args.start,
+                             args.duration, args.rate)
+    results = run_trials(sim, protocol, args.output, args.n_neurons,
+                         offline=not args.online)
+    print(format_trials(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Simulate the rewiring of a structurally plastic projection offline, to see
+what connectivity the parameters of struct_pl.py and struct_pl_stdp.py give
+without a run on a board, e.g.::
+
+    python -m learning.struct_pl_offline struct_pl --n-neurons 10000 \\
+        --grid sigma_form_forward=0.5,1,2 --grid s_max=32,64
+
+This follows the rewiring of sPyNNaker: on each core, f_rew times a second
+a random post-synaptic neuron of the core's slice and one of its s_max
+synapse slots are chosen, so a projection makes f_rew attempts a second for
+each slice of its post-population.  An
+empty slot is offered a partner, either any pre-synaptic neuron
+(RandomSelection) or one that spiked in the last time step
+(LastNeuronSelection), which forms a synapse with the probability of the
+DistanceDependentFormation table for their squared distance on the grid,
+unless the two are already connected.  A full slot is eliminated with the
+probability of RandomByWeightElimination for its weight.
+
+Attempts on different post-synaptic neurons do not affect each other, so
+whole batches of them are handled as arrays, a round at a time, with each
+round taking the next attempt of every neuron that has one.  The weights of
+synapses are not changed by STDP here; struct_pl_stdp.py never eliminates
+synapses, so its connectivity does not depend on them.
+"""
+
+import argparse
+from collections import namedtuple
+import time
+import numpy
+from balanced_random.sweep import format_table, grid
+
+#: The parameters of the rewiring, with the defaults of sPyNNaker
+RewiringParameters = namedtuple("RewiringParameters", [
+    "s_max", "f_rew", "grid", "p_form_forward", "sigma_form_forward",
+    "p_form_lateral", "sigma_form_lateral", "threshold",
+    "prob_elim_depressed", "prob_elim_potentiated", "initial_weight",
+    "weight", "partner_selection", "spike_buffer_size"], defaults=[
+        32, 10 ** 4, None, 0.16, 2.5, 1.0, 1.0, 0.5, 0.0245, 1.36e-4, 0.0,
+        0.0, "random", 64])
+
+#: The parameters of learning/struct_pl.py
+STRUCT_PL = RewiringParameters(
+    s_max=32, f_rew=10 ** 4, sigma_form_forward=0.5, threshold=0.2,
+    initial_weight=5.0, weight=5.0)
+
+#: The parameters of learning/struct_pl_stdp.py
+STRUCT_PL_STDP = RewiringParameters(
+    s_max=64, f_rew=10 ** 4, sigma_form_forward=0.5, threshold=0.5,
+    prob_elim_depressed=0.0, prob_elim_potentiated=0.0,
+    initial_weight=0.0, weight=0.0)
+
+SCRIPTS = {"struct_pl": STRUCT_PL, "struct_pl_stdp": STRUCT_PL_STDP}
+
+#: The neurons per core of sPyNNaker for IF_curr_exp, which the scripts
+#: leave as it is
+NEURONS_PER_CORE = 256
+
+#: The formation and elimination probabilities are 16 bit on the board
+_PROBABILITY_SCALE = 2 ** 16
+
+#: The most rewiring attempts drawn at once, per post-synaptic neuron
+_ATTEMPTS_PER_NEURON = 8
+
+#: The formations and eliminations, in order of time
+RewiringEvents = namedtuple("RewiringEvents", [
+    "times", "pre", "post", "formed"])
+
+#: The connections at the end, as (pre, post, weight) rows sorted by post
+#: then pre, and the events that led to them
+RewiringResult = namedtuple("RewiringResult", [
+    "connections", "events", "n_attempts"])
+
+
+def grid_shape(parameters, n_neurons):
+    """ The grid of the formation rule; sqrt(n) by sqrt(n) if not given
+
+    :rtype: tuple(int, int)
+    """
+    if parameters.grid is not None:
+        return tuple(int(g) for g in parameters.grid)
+    side = int(numpy.sqrt(n_neurons))
+    return side, side
+
+
+def squared_distances(pre, post, shape):
+    """ The squared distance between neurons on a grid that wraps around,
+        with neuron i at (i // x, i % y), as on the board
+
+    :param ~numpy.ndarray pre: The pre-synaptic neurons
+    :param ~numpy.ndarray post: The post-synaptic neurons
+    :param tuple(int, int) shape: The shape of the grid
+    :rtype: ~numpy.ndarray
+    """
+    grid_x, grid_y = shape
+    squared = numpy.zeros(numpy.broadcast(pre, post).shape, dtype="int64")
+    for size, pre_x, post_x in (
+            (grid_x, pre // grid_x, post // grid_x),
+            (grid_y, pre % grid_y, post % grid_y)):
+        if size > 1:
+            delta = numpy.abs(pre_x - post_x)
+            delta = numpy.where(delta > size // 2, size - delta, delta)
+            squared += delta * delta
+    return squared
+
+
+def formation_table(probability, sigma, shape):
+    """ The probability of forming a synapse at each squared distance, as
+        in DistanceDependentFormation
+
+    :param float probability: The probability at distance 0
+    :param float sigma: The spread of the formation
+    :param tuple(int, int) shape: The shape of the grid
+    :rtype: ~numpy.ndarray
+    """
+    largest = sum((size // 2) ** 2 for size in shape if size > 1)
+    squared = numpy.arange(largest + 1)
+    return numpy.floor(
+        probability * numpy.exp(-squared / (2.0 * sigma ** 2)) *
+        _PROBABILITY_SCALE) / _PROBABILITY_SCALE
+
+
+class _Partners(object):
+    """ Chooses the pre-synaptic partner offered to each empty slot
+    """
+
+    __slots__ = ["__n_pre", "__cumulative", "__steps", "__ids", "__bounds",
+                 "__buffer_size"]
+
+    def __init__(self, parameters, n_pre, dt, spikes=None, rates=None):
+        self.__n_pre = n_pre
+        self.__cumulative = None
+        self.__steps = None
+        self.__buffer_size = parameters.spike_buffer_size
+        if parameters.partner_selection == "random":
+            return
+        if parameters.partner_selection != "last_neuron":
+            raise ValueError("Unknown partner selection {}".format(
+                parameters.partner_selection))
+        if spikes is not None:
+            spikes = numpy.asarray(spikes).reshape(-1, 2)
+            steps = numpy.round(spikes[:, 1] / dt).astype("int64")
+            order = numpy.argsort(steps, kind="stable")
+            self.__steps = steps[order]
+            self.__ids = spikes[order, 0].astype("int64")
+        elif rates is not None:
+            expected = numpy.broadcast_to(numpy.asarray(
+                rates, dtype="float64"), (n_pre, )) * dt / 1000.0
+            self.__cumulative = numpy.cumsum(expected)
+        else:
+            raise ValueError(
+                "Choosing the last neurons to spike needs spikes or rates")
+
+    def choose(self, steps, rng):
+        """ The partner offered at each step, or -1 if there is none
+
+        :param ~numpy.ndarray steps: The time step of each attempt
+        :rtype: ~numpy.ndarray
+        """
+        n = len(steps)
+        if self.__steps is not None:
+            # The spikes received in the step before, up to the buffer size
+            first, last = (
+                numpy.searchsorted(self.__steps, steps - 1, side="left"),
+                numpy.searchsorted(self.__steps, steps - 1, side="right"))
+            count = numpy.minimum(last - first, self.__buffer_size)
+            chosen = first + (rng.uniform(size=n) * count).astype("int64")
+            return numpy.where(
+                count > 0, self.__ids[numpy.minimum(
+                    chosen, len(self.__ids) - 1)], -1)
+        if self.__cumulative is not None:
+            # Some neuron spiked, and each spike is equally likely to be
+            # chosen, so pick a neuron in proportion to its rate
+            total = self.__cumulative[-1]
+            spiked = rng.poisson(total, size=n) > 0
+            chosen = numpy.searchsorted(
+                self.__cumulative, rng.uniform(size=n) * total, side="right")
+            return numpy.where(spiked, numpy.minimum(
+                chosen, self.__n_pre - 1), -1)
+        return rng.randint(self.__n_pre, size=n)
+
+
+def simulate_rewiring(parameters, n_pre, n_post, run_time, dt=1.0,
+                      connections=None, spikes=None, rates=None,
+                      lateral=False, seed=None,
+                      neurons_per_core=NEURONS_PER_CORE):
+    """ Simulate the rewiring of a projection
+
+    :param RewiringParameters parameters: The rewiring rules
+    :param int n_pre: The size of the pre-population
+    :param int n_post: The size of the post-population
+    :param float run_time: The time to run for in ms
+    :param float dt: The time step in ms
+    :param ~numpy.ndarray connections:
+        The (pre, post) connections at the start, if any
+    :param ~numpy.ndarray spikes:
+        The (id, time) spikes of the pre-population, for LastNeuronSelection
+    :param rates: The rate of each pre-neuron in Hz, instead of spikes
+    :param bool lateral:
+        Whether the pre- and post-populations are the same, so that the
+        lateral formation rule is used
+    :param int seed: The seed of the random numbers
+    :param int neurons_per_core:
+        The size of the slices of the post-population, each of which makes
+        its own f_rew attempts a second
+    :rtype: RewiringResult
+    """
+    rng = numpy.random.RandomState(seed)
+    s_max = parameters.s_max
+    shape = grid_shape(parameters, n_post)
+    if lateral:
+        table = formation_table(
+            parameters.p_form_lateral, parameters.sigma_form_lateral, shape)
+    else:
+        table = formation_table(
+            parameters.p_form_forward, parameters.sigma_form_forward, shape)
+    table = numpy.append(table, 0.0)
+    partners = _Partners(parameters, n_pre, dt, spikes, rates)
+
+    # The pre-synaptic neuron in each slot of each post-neuron, -1 if empty
+    slots = numpy.full((n_post, s_max), -1, dtype="int64")
+    weights = numpy.zeros((n_post, s_max))
+    if connections is not None and len(connections):
+        connections = numpy.asarray(connections).reshape(
+            len(connections), -1)[:, :2].astype("int64")
+        order = numpy.argsort(connections[:, 1], kind="stable")
+        pre, post = connections[order, 0], connections[order, 1]
+        counts = numpy.bincount(post, minlength=n_post)
+        if counts.max() > s_max:
+            raise ValueError("A neuron has more than s_max connections")
+        column = numpy.arange(len(post)) - numpy.repeat(
+            numpy.cumsum(counts) - counts, counts)
+        slots[post, column] = pre
+        weights[post, column] = parameters.weight
+
+    # Attempt k of each slice is made in step floor(k * period), on a
+    # post-neuron of that slice
+    lo_atoms = numpy.arange(0, n_post, neurons_per_core)
+    n_atoms = numpy.minimum(lo_atoms + neurons_per_core, n_post) - lo_atoms
+    n_per_slice = int(numpy.floor(run_time * parameters.f_rew / 1000.0))
+    n_attempts = n_per_slice * len(lo_atoms)
+    period = 1000.0 / (parameters.f_rew * dt)
+    batch = max(1, _ATTEMPTS_PER_NEURON * n_post // max(len(lo_atoms), 1))
+    events = list()
+    for first in range(0, n_per_slice, batch):
+        k = numpy.arange(first, min(first + batch, n_per_slice))
+        steps = numpy.repeat(
+            numpy.floor(k * period).astype("int64"), len(lo_atoms))
+        core = numpy.tile(numpy.arange(len(lo_atoms)), len(k))
+        post = lo_atoms[core] + (
+            rng.uniform(size=len(core)) * n_atoms[core]).astype("int64")
+        slot = rng.randint(s_max, size=len(core))
+        pre = partners.choose(steps, rng)
+        chance = rng.randint(_PROBABILITY_SCALE, size=len(core)) / float(
+            _PROBABILITY_SCALE)
+        events.extend(_rewire_batch(
+            slots, weights, steps, post, slot, pre, chance, table, shape,
+            parameters))
+    if events:
+        times, pre, post, formed = (
+            numpy.concatenate(column) for column in zip(*events))
+        order = numpy.argsort(times, kind="stable")
+        events = RewiringEvents(
+            times[order] * dt, pre[order], post[order], formed[order])
+    else:
+        events = RewiringEvents(
+            numpy.zeros(0), numpy.zeros(0, "int64"), numpy.zeros(0, "int64"),
+            numpy.zeros(0, bool))
+    post, column = numpy.nonzero(slots >= 0)
+    pre = slots[post, column]
+    order = numpy.lexsort((pre, post))
+    return RewiringResult(
+        numpy.column_stack((pre[order], post[order],
+                            weights[post, column][order])),
+        events, n_attempts)
+
+
+def _rewire_batch(slots, weights, steps, post, slot, pre, chance, table,
+                  shape, parameters):
+    """ Make a batch of attempts in time order, a round at a time, each
+        round making the next attempt of each post-neuron
+
+    :return: The (steps, pre, post, formed) of each formation and
+        elimination of each round
+    :rtype: list(tuple)
+    """
+    order = numpy.argsort(post, kind="stable")
+    counts = numpy.bincount(post)
+    rank = numpy.empty(len(post), dtype="int64")
+    rank[order] = numpy.arange(len(post)) - numpy.repeat(
+        numpy.cumsum(counts) - counts, counts)
+    by_round = numpy.argsort(rank, kind="stable")
+    bounds = numpy.searchsorted(
+        rank[by_round], numpy.arange(rank.max() + 2 if len(rank) else 1))
+    events = list()
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        attempt = by_round[first:last]
+        a_post, a_slot = post[attempt], slot[attempt]
+        current = slots[a_post, a_slot]
+        occupied = current >= 0
+
+        # Elimination, more likely for weights at or below the threshold
+        weight = weights[a_post, a_slot]
+        probability = numpy.where(
+            weight > parameters.threshold, parameters.prob_elim_potentiated,
+            parameters.prob_elim_depressed)
+        eliminate = occupied & (chance[attempt] < probability)
+
+        # Formation with a partner not already connected
+        a_pre = pre[attempt]
+        candidate = ~occupied & (a_pre >= 0)
+        distance = numpy.minimum(
+            squared_distances(a_pre, a_post, shape), len(table) - 1)
+        candidate &= chance[attempt] < table[distance]
+        candidate[candidate] &= ~(
+            slots[a_post[candidate]] == a_pre[candidate, None]).any(axis=1)
+
+        slots[a_post[eliminate], a_slot[eliminate]] = -1
+        slots[a_post[candidate], a_slot[candidate]] = a_pre[candidate]
+        weights[a_post[candidate], a_slot[candidate]] = \
+            parameters.initial_weight
+        changed = eliminate | candidate
+        events.append((
+            steps[attempt][changed],
+            numpy.where(candidate, a_pre, current)[changed],
+            a_post[changed], candidate[changed]))
+    return events
+
+
+def summarise(result, parameters, n_pre, n_post):
+    """ Summarise the connectivity at the end of a simulation
+
+    :param RewiringResult result: The result of simulate_rewiring
+    :param RewiringParameters parameters: The rewiring rules
+    :param int n_pre: The size of the pre-population
+    :param int n_post: The size of the post-population
+    :rtype: dict
+    """
+    pre = result.connections[:, 0].astype("int64")
+    post = result.connections[:, 1].astype("int64")
+    fan_in = numpy.bincount(post, minlength=n_post)
+    distance = numpy.sqrt(squared_distances(
+        pre, post, grid_shape(parameters, n_post)))
+    formed = result.events.formed
+    return {
+        "n_connections": len(pre),
+        "mean_fan_in": float(fan_in.mean()),
+        "max_fan_in": int(fan_in.max()),
+        "mean_distance": float(distance.mean()) if len(pre) else 0.0,
+        "n_formed": int(formed.sum()),
+        "n_eliminated": int(len(formed) - formed.sum())}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("script", choices=sorted(SCRIPTS),
+                        help="the script whose parameters are the defaults")
+    parser.add_argument("--n-neurons", type=int, default=100)
+    parser.add_argument("--run-time", type=float, default=5000.0)
+    parser.add_argument("--grid", action="append", default=[],
+                        metavar="NAME=V1,V2,...",
+                        help="values of a rewiring parameter to sweep")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="rate of the pre-neurons in Hz, choosing the "
+                        "last neurons to spike as partners")
+    parser.add_argument("--neurons-per-core", type=int,
+                        default=NEURONS_PER_CORE,
+                        help="the size of the slices of the post-population,"
+                        " each rewiring at f_rew")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    values = dict()
+    for text in args.grid:
+        name, value = text.split("=", 1)
+        values[name] = [float(v) for v in value.split(",")]
+    records = list()
+    for point in grid(**values):
+        changes = {name: int(value) if name in ("s_max", "f_rew") else value
+                   for name, value in point.items()}
+        if args.rate is not None:
+            changes["partner_selection"] = "last_neuron"
+        parameters = SCRIPTS[args.script]._replace(**changes)
+        start = time.perf_counter()
+        result = simulate_rewiring(
+            parameters, args.n_neurons, args.n_neurons, args.run_time,
+            rates=args.rate, seed=args.seed,
+            neurons_per_core=args.neurons_per_core)
+        record = dict(point)
+        record.update(summarise(
+            result, parameters, args.n_neurons, args.n_neurons))
+        record["seconds"] = time.perf_counter() - start
+        records.append(record)
+    print(format_table(records))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Snapshots of the plastic weights of a projection taken through a run, kept
+in an append-only file that stores, for each snapshot, only the weights
+that changed since the one before.
+
+Every so often, or whenever most weights changed, a snapshot is stored in
+full instead, so that any snapshot can be read back by starting from the
+full one before it rather than from the start of the file.
+
+The file starts with a header of the magic bytes, the format version, the
+type of the weights and the number of connections.  Each snapshot follows
+as its time in ms, whether it is full, and the number of weights stored,
+then the index of each changed weight (left out when full) and the
+weights themselves.  A snapshot cut short by a crash is ignored when
+reading and overwritten when appending.
+"""
+
+import os
+import struct
+import numpy
+
+_MAGIC = b"WSNP"
+
+#: Changed whenever the layout of the file changes
+_VERSION = 1
+
+_HEADER = struct.Struct("<4sBcQ")
+_RECORD = struct.Struct("<dBQ")
+
+#: The type of the index of each changed weight
+_INDEX = numpy.dtype("<u4")
+
+
+class WeightSnapshots(object):
+    """ The snapshots in a file, read back in any order
+    """
+
+    __slots__ = ["__path", "__dtype", "__n_connections", "__times",
+                 "__offsets", "__counts", "__full", "__end", "__cached",
+                 "__cached_index"]
+
+    def __init__(self, path):
+        """
+        :param str path: The file of snapshots
+        """
+        self.__path = path
+        with open(path, "rb") as f:
+            magic, version, code, n_connections = _HEADER.unpack(
+                f.read(_HEADER.size))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(
+                    "{} is not a file of weight snapshots of version "
+                    "{}".format(path, _VERSION))
+            self.__dtype = numpy.dtype("<" + code.decode())
+            self.__n_connections = n_connections
+            size = os.fstat(f.fileno()).st_size
+            times = list()
+            offsets = list()
+            counts = list()
+            full = list()
+            offset = _HEADER.size
+            # Only the record headers are read; the weights stay on disk
+            while offset + _RECORD.size <= size:
+                f.seek(offset)
+                time, is_full, count = _RECORD.unpack(f.read(_RECORD.size))
+                end = offset + _RECORD.size + count * (
+                    self.__dtype.itemsize +
+                    (0 if is_full else _INDEX.itemsize))
+                if end > size:
+                    break
+                times.append(time)
+                offsets.append(offset + _RECORD.size)
+                counts.append(count)
+                full.append(bool(is_full))
+                offset = end
+        self.__times = numpy.array(times, dtype="float64")
+        self.__offsets = offsets
+        self.__counts = counts
+        self.__full = full
+        self.__end = offset
+        self.__cached = None
+        self.__cached_index = None
+
+    @property
+    def n_connections(self):
+        return self.__n_connections
+
+    @property
+    def dtype(self):
+        return self.__dtype
+
+    @property
+    def times(self):
+        """ The time of each snapshot in ms
+        """
+        return self.__times
+
+    @property
+    def full(self):
+        """ Whether each snapshot is stored in full
+        """
+        return numpy.array(self.__full, dtype=bool)
+
+    @property
+    def end(self):
+        """ The size of the complete snapshots in bytes
+        """
+        return self.__end
+
+    def __len__(self):
+        return len(self.__times)
+
+    def __read(self, f, index):
+        f.seek(self.__offsets[index])
+        count = self.__counts[index]
+        if self.__full[index]:
+            return None, numpy.fromfile(f, self.__dtype, count)
+        indices = numpy.fromfile(f, _INDEX, count)
+        return indices, numpy.fromfile(f, self.__dtype, count)
+
+    def __getitem__(self, index):
+        """ The weights of a snapshot
+
+        :param int index: The number of the snapshot
+        :rtype: ~numpy.ndarray
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("There are {} snapshots".format(len(self)))
+        first = index
+        while not self.__full[first]:
+            first -= 1
+        # Carry on from the last snapshot read if that is closer
+        if (self.__cached_index is not None and
+                first <= self.__cached_index <= index):
+            weights = self.__cached
+            first = self.__cached_index + 1
+        with open(self.__path, "rb") as f:
+            for i in range(first, index + 1):
+                indices, values = self.__read(f, i)
+                if indices is None:
+                    weights = values
+                else:
+                    weights[indices] = values
+        self.__cached = weights
+        self.__cached_index = index
+        return weights.copy()
+
+    def at(self, time):
+        """ The weights of the last snapshot taken at or before a time
+
+        :param float time: The time in ms
+        :rtype: ~numpy.ndarray
+        """
+        index = numpy.searchsorted(self.__times, time, side="right") - 1
+        if index < 0:
+            raise ValueError("There is no snapshot at or before {} ms".format(
+                time))
+        return self[int(index)]
+
+    def changes(self, index):
+        """ The indices of the weights that changed in a snapshot, and their
+            new values; all of them for a full snapshot
+
+        :param int index: The number of the snapshot
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        with open(self.__path, "rb") as f:
+            indices, values = self.__read(f, index)
+        if indices is None:
+            indices = numpy.arange(self.__n_connections)
+        return indices.astype("int64"), values
+
+
+class WeightSnapshotWriter(object):
+    """ Appends snapshots to a file, storing the weights that changed since
+        the last one
+    """
+
+    __slots__ = ["__file", "__dtype", "__n_connections", "__last",
+                 "__last_time", "__keyframe_interval", "__since_full"]
+
+    def __init__(self, path, n_connections, dtype="float32",
+                 keyframe_interval=32):
+        """
+        :param str path:
+            The file of snapshots; if it exists, new snapshots are added to
+            the end of it
+        :param int n_connections: The number of weights in each snapshot
+        :param dtype:
+            The type of the stored weights; float32 holds the fixed point
+            weights of the board exactly
+        :param int keyframe_interval:
+            The most snapshots stored as changes between full ones
+        """
+        dtype = numpy.dtype(dtype).newbyteorder("<")
+        if n_connections > numpy.iinfo(_INDEX).max:
+            raise ValueError("Too many connections for a snapshot file")
+        self.__dtype = dtype
+        self.__n_connections = n_connections
+        self.__keyframe_interval = keyframe_interval
+        self.__last = None
+        self.__last_time = None
+        self.__since_full = 0
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            existing = WeightSnapshots(path)
+            if (existing.n_connections != n_connections or
+                    existing.dtype != dtype):
+                raise ValueError(
+                    "{} holds snapshots of {} weights of type {}".format(
+                        path, existing.n_connections, existing.dtype))
+            if len(existing):
+                self.__last = existing[-1]
+                self.__last_time = existing.times[-1]
+                self.__since_full = len(existing) - 1 - int(
+                    numpy.flatnonzero(existing.full)[-1])
+            self.__file = open(path, "r+b")
+            # Drop any snapshot that was not completely written
+            self.__file.truncate(existing.end)
+            self.__file.seek(existing.end)
+        else:
+            self.__file = open(path, "wb")
+            self.__file.write(_HEADER.pack(
+                _MAGIC, _VERSION, dtype.char.encode(), n_connections))
+
+    def append(self, time, weights):
+        """ Add a snapshot of all the weights
+
+        :param float time: The time of the snapshot in ms
+        :param ~numpy.ndarray weights: The weight of each connection
+        """
+        weights = numpy.asarray(weights, dtype=self.__dtype).reshape(-1)
+        if len(weights) != self.__n_connections:
+            raise ValueError("Expected {} weights, not {}".format(
+                self.__n_connections, len(weights)))
+        if self.__last is None:
+            self.__write_full(time, weights)
+            return
+        changed = numpy.flatnonzero(weights != self.__last)
+        self.append_changes(time, changed, weights[changed])
+
+    def append_changes(self, time, indices, values):
+        """ Add a snapshot given the weights that changed since the last
+
+        :param float time: The time of the snapshot in ms
+        :param ~numpy.ndarray indices: The index of each changed weight
+        :param ~numpy.ndarray values: The new value of each
+        """
+        if self.__last_time is not None and time < self.__last_time:
+            raise ValueError("Snapshots must be added in order of time")
+        if self.__last is None:
+            raise ValueError("The first snapshot must have every weight")
+        indices = numpy.asarray(indices, dtype=_INDEX).reshape(-1)
+        values = numpy.asarray(values, dtype=self.__dtype).reshape(-1)
+        self.__last[indices] = values
+        # A full snapshot is smaller once most of the weights have changed
+        if (self.__since_full >= self.__keyframe_interval or
+                len(indices) * (_INDEX.itemsize + self.__dtype.itemsize) >=
+                self.__n_connections * self.__dtype.itemsize):
+            self.__write_full(time, self.__last)
+            return
+        self.__file.write(_RECORD.pack(time, 0, len(indices)))
+        self.__file.write(indices.tobytes())
+        self.__file.write(values.tobytes())
+        self.__last_time = time
+        self.__since_full += 1
+
+    def __write_full(self, time, weights):
+        if self.__last_time is not None and time < self.__last_time:
+            raise ValueError("Snapshots must be added in order of time")
+        self.__file.write(_RECORD.pack(time, 1, len(weights)))
+        self.__file.write(weights.tobytes())
+        self.__last = weights.copy()
+        self.__last_time = time
+        self.__since_full = 0
+
+    def close(self):
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def run_with_snapshots(sim, projection, run_time, interval, path, **kwargs):
+    """ Run the simulation in steps of an interval, taking a snapshot of the
+        weights of a projection after each step; each snapshot still costs an
+        extraction of the weights from the machine
+
+    :param sim: The simulator, such as pyNN.spiNNaker
+    :param projection: The plastic projection
+    :param float run_time: The time to run for in ms
+    :param float interval: The time between snapshots in ms
+    :param str path: The file of snapshots, appended to if it exists
+    :param kwargs: Passed on to the WeightSnapshotWriter
+    :rtype: WeightSnapshots
+    """
+    end = sim.get_current_time() + run_time
+    writer = None
+    try:
+        while sim.get_current_time() < end:
+            sim.run(min(interval, end - sim.get_current_time()))
+            weights = numpy.asarray(projection.getWeights(), dtype="float64")
+            if writer is None:
+                writer = WeightSnapshotWriter(path, len(weights), **kwargs)
+            writer.append(sim.get_current_time(), weights)
+    finally:
+        if writer is not None:
+            writer.close()
+    return WeightSnapshots(path)
+
+
+def snapshots_from_trajectories(trajectories, run_time, interval, path,
+                                **kwargs):
+    """ Write snapshots of the weights from offline trajectories, as if
+        taken every interval through the run, without stopping the run
+
+    :param ~learning.stdp_offline.WeightTrajectories trajectories:
+        The updates of each synapse
+    :param float run_time: The length of the run in ms
+    :param float interval: The time between snapshots in ms
+    :param str path: The file of snapshots
+    :param kwargs: Passed on to the WeightSnapshotWriter
+    :rtype: WeightSnapshots
+    """
+    n_snapshots = int(numpy.ceil(run_time / interval - 1e-9))
+    counts = numpy.diff(trajectories.indptr)
+    synapses = numpy.repeat(numpy.arange(len(counts)), counts)
+    # The first snapshot to include each update, snapshot k being at time
+    # k * interval
+    snapshot = numpy.maximum(numpy.ceil(
+        trajectories.times / interval - 1e-9).astype("int64"), 0)
+    # Group the updates by snapshot, keeping them in order of synapse and
+    # then time, and keep the last update of each synapse in each
+    order = numpy.argsort(snapshot, kind="stable")
+    snapshot = snapshot[order]
+    synapses = synapses[order]
+    last = numpy.ones(len(order), dtype=bool)
+    last[:-1] = ((snapshot[1:] != snapshot[:-1]) |
+                 (synapses[1:] != synapses[:-1]))
+    order, snapshot, synapses = order[last], snapshot[last], synapses[last]
+    bounds = numpy.searchsorted(snapshot, numpy.arange(n_snapshots + 2))
+    weights = trajectories.weights
+    initial = trajectories.initial.copy()
+    initial[synapses[:bounds[1]]] = weights[order[:bounds[1]]]
+    with WeightSnapshotWriter(path, len(trajectories), **kwargs) as writer:
+        writer.append(0.0, initial)
+        for k in range(1, n_snapshots + 1):
+            first, last = bounds[k:k + 2]
+            writer.append_changes(
+                min(k * interval, run_time), synapses[first:last],
+                weights[order[first:last]])
+    return WeightSnapshots(path)
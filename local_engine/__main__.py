@@ -0,0 +1,96 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Run an IntroLab script on the local engine, e.g.::
+
+    python -m local_engine balanced_random/balanced_random.py
+
+The script is run unchanged, with pyNN.spiNNaker and the parts of sPyNNaker
+it uses replaced by the local engine.  Figures are saved next to the script
+unless --show is given.
+"""
+
+import argparse
+import importlib
+import os
+import runpy
+import sys
+import time
+import types
+
+#: The modules of sPyNNaker replaced by those of the local engine
+_REPLACED = {
+    "spynnaker.pyNN.utilities.neo_convertor": "local_engine.neo_convertor",
+    "spynnaker.pyNN.extra_algorithms.splitter_components":
+        "local_engine.splitters"}
+
+
+def _replace_module(name, module):
+    """ Put a module in place, creating empty parent packages if sPyNNaker
+        is not installed
+    """
+    sys.modules[name] = module
+    while "." in name:
+        parent_name, child = name.rsplit(".", 1)
+        parent = sys.modules.get(parent_name)
+        if parent is None:
+            try:
+                parent = importlib.import_module(parent_name)
+            except ImportError:
+                parent = types.ModuleType(parent_name)
+                parent.__path__ = []
+                sys.modules[parent_name] = parent
+        setattr(parent, child, module)
+        module = parent
+        name = parent_name
+
+
+def install():
+    """ Make imports of pyNN.spiNNaker and the sPyNNaker modules used by the
+        scripts resolve to the local engine
+    """
+    _replace_module(
+        "pyNN.spiNNaker", importlib.import_module("local_engine.spinnaker"))
+    for name, replacement in _REPLACED.items():
+        _replace_module(name, importlib.import_module(replacement))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("script", help="the script to run")
+    parser.add_argument("--show", action="store_true",
+                        help="show figures rather than saving them")
+    args, script_args = parser.parse_known_args(argv)
+
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+    if not args.show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    install()
+    figure_name = os.path.splitext(args.script)[0] + ".png"
+    if not args.show:
+        plt.show = lambda *_args, **_kwargs: plt.savefig(figure_name)
+
+    sys.argv = [args.script] + script_args
+    start = time.perf_counter()
+    runpy.run_path(args.script, run_name="__main__")
+    print("Ran {} in {:.2f} s".format(
+        args.script, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The connectors of the local engine; each generates the pre and post indices
+of all its connections at once.
+"""
+
+import numpy
+from pyNN.random import NumpyRNG
+
+#: The most random numbers drawn at once when sampling a connection matrix
+_MAX_BLOCK = 2 ** 22
+
+
+def _random_state(rng):
+    if rng is None:
+        rng = NumpyRNG()
+    return rng.rng
+
+
+class _Connector(object):
+    """ Base of the connectors
+    """
+
+    #: The weight and delay given in a connection list, if any
+    weights = None
+    delays = None
+
+    def __init__(self, allow_self_connections=True, safe=True,
+                 verbose=False, callback=None, rng=None):
+        # safe, verbose and callback are accepted for compatibility only
+        self.allow_self_connections = allow_self_connections
+        self.rng = rng
+
+    def connect(self, n_pre, n_post, same_population):
+        """ Generate the connections
+
+        :param int n_pre: The size of the pre-population
+        :param int n_post: The size of the post-population
+        :param bool same_population:
+            Whether the pre- and post-populations are the same, so that self
+            connections may need to be removed
+        :return: The pre and post index of each connection
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        raise NotImplementedError
+
+    def _no_self(self, same_population):
+        return same_population and not self.allow_self_connections
+
+
+class OneToOneConnector(_Connector):
+    """ Connects neuron i of the pre-population to neuron i of the post
+    """
+
+    def connect(self, n_pre, n_post, same_population):
+        index = numpy.arange(min(n_pre, n_post))
+        return index, index
+
+
+class AllToAllConnector(_Connector):
+    """ Connects every pre-neuron to every post-neuron
+    """
+
+    def connect(self, n_pre, n_post, same_population):
+        pre, post = numpy.divmod(numpy.arange(n_pre * n_post), n_post)
+        if self._no_self(same_population):
+            keep = pre != post
+            pre, post = pre[keep], post[keep]
+        return pre, post
+
+
+class FixedProbabilityConnector(_Connector):
+    """ Connects each pair of neurons independently with a probability
+    """
+
+    def __init__(self, p_connect, allow_self_connections=True, safe=True,
+                 verbose=False, callback=None, rng=None):
+        super().__init__(allow_self_connections, safe, verbose, callback, rng)
+        self.p_connect = p_connect
+
+    def connect(self, n_pre, n_post, same_population):
+        random = _random_state(self.rng)
+        rows = max(1, _MAX_BLOCK // max(n_post, 1))
+        pres = list()
+        posts = list()
+        for first in range(0, n_pre, rows):
+            n_rows = min(rows, n_pre - first)
+            pre, post = numpy.nonzero(
+                random.uniform(size=(n_rows, n_post)) < self.p_connect)
+            pres.append(pre + first)
+            posts.append(post)
+        pre = numpy.concatenate(pres + [numpy.zeros(0, "int64")])
+        post = numpy.concatenate(posts + [numpy.zeros(0, "int64")])
+        if self._no_self(same_population):
+            keep = pre != post
+            pre, post = pre[keep], post[keep]
+        return pre, post
+
+
+class FixedNumberPreConnector(_Connector):
+    """ Connects each post-neuron to a fixed number of random pre-neurons
+    """
+
+    def __init__(self, n, allow_self_connections=True, safe=True,
+                 verbose=False, with_replacement=False, rng=None):
+        super().__init__(allow_self_connections, safe, verbose, None, rng)
+        self.n = n
+        self.with_replacement = with_replacement
+
+    def connect(self, n_pre, n_post, same_population):
+        random = _random_state(self.rng)
+        no_self = self._no_self(same_population)
+        if self.with_replacement:
+            pre = random.randint(
+                n_pre - int(no_self), size=(n_post, self.n))
+            if no_self:
+                # Skip over the post-neuron itself
+                pre += pre >= numpy.arange(n_post)[:, None]
+        elif 2 * self.n <= n_pre - int(no_self):
+            # Few of the sources are chosen, so draw them directly and redraw
+            # any chosen twice, rather than ranking every source
+            rows = max(1, _MAX_BLOCK // max(self.n, 1))
+            blocks = list()
+            for first in range(0, n_post, rows):
+                block = random.randint(
+                    n_pre - int(no_self),
+                    size=(min(rows, n_post - first), self.n))
+                while True:
+                    block.sort(axis=1)
+                    repeated = numpy.zeros(block.shape, dtype=bool)
+                    repeated[:, 1:] = block[:, 1:] == block[:, :-1]
+                    n_repeated = numpy.count_nonzero(repeated)
+                    if not n_repeated:
+                        break
+                    block[repeated] = random.randint(
+                        n_pre - int(no_self), size=n_repeated)
+                if no_self:
+                    block += block >= numpy.arange(
+                        first, first + len(block))[:, None]
+                blocks.append(block)
+            pre = numpy.concatenate(blocks)
+        else:
+            rows = max(1, _MAX_BLOCK // max(n_pre, 1))
+            blocks = list()
+            for first in range(0, n_post, rows):
+                keys = random.uniform(size=(min(rows, n_post - first), n_pre))
+                if no_self:
+                    index = numpy.arange(first, first + len(keys))
+                    keys[index - first, index] = numpy.inf
+                blocks.append(
+                    numpy.argpartition(keys, self.n - 1, axis=1)[:, :self.n])
+            pre = numpy.concatenate(blocks)
+        post = numpy.repeat(numpy.arange(n_post), self.n)
+        return pre.ravel(), post
+
+
+class FromListConnector(_Connector):
+    """ Connects the listed pairs; a list with a third and fourth column
+        also gives the weight and delay of each connection
+    """
+
+    def __init__(self, conn_list, safe=True, verbose=False, column_names=None,
+                 callback=None):
+        super().__init__(True, safe, verbose, callback)
+        conn_list = numpy.asarray(conn_list, dtype="float64")
+        if conn_list.size == 0:
+            conn_list = numpy.zeros((0, 2))
+        self.conn_list = conn_list
+        if conn_list.shape[1] > 2:
+            self.weights = conn_list[:, 2]
+        if conn_list.shape[1] > 3:
+            self.delays = conn_list[:, 3]
+
+    def connect(self, n_pre, n_post, same_population):
+        return (self.conn_list[:, 0].astype("int64"),
+                self.conn_list[:, 1].astype("int64"))
@@ -0,0 +1,338 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The neuron and spike source models of the local engine, each updating the
+state of a whole population with NumPy arrays.
+"""
+
+import numpy
+
+
+def expand(value, size):
+    """ Expand a parameter value to one float per neuron
+
+    :param value:
+        A scalar, a sequence of one value per neuron, or a
+        RandomDistribution
+    :param int size: The number of neurons
+    :rtype: numpy.ndarray
+    """
+    if hasattr(value, "next"):
+        return numpy.asarray(value.next(size), dtype="float64").reshape(size)
+    return numpy.array(
+        numpy.broadcast_to(numpy.asarray(value, dtype="float64"), (size,)))
+
+
+class _Model(object):
+    """ A model type; like in PyNN, either the class or an instance with
+        parameters can be given to a Population
+    """
+
+    #: The parameters of the model and their default values
+    default_parameters = {}
+
+    #: The state variables and their initial values
+    default_initial_values = {}
+
+    #: Whether the model receives synaptic input
+    receives_input = True
+
+    def __init__(self, **parameters):
+        unknown = set(parameters) - set(self.default_parameters)
+        if unknown:
+            raise ValueError("Unknown parameters {} for {}".format(
+                sorted(unknown), type(self).__name__))
+        self.parameters = dict(self.default_parameters)
+        self.parameters.update(parameters)
+
+    def create_state(self, size, parameters, initial_values, rng):
+        """ Create the arrays of parameters and state of a population
+
+        :rtype: dict(str, numpy.ndarray)
+        """
+        state = {name: expand(value, size)
+                 for name, value in parameters.items()}
+        for name, value in self.default_initial_values.items():
+            state[name] = expand(initial_values.get(name, value), size)
+        return state
+
+    def set_parameters(self, state, size, parameters):
+        """ Change parameters between runs
+        """
+        for name, value in parameters.items():
+            if name not in self.default_parameters:
+                raise ValueError("Unknown parameter {} for {}".format(
+                    name, type(self).__name__))
+            state[name] = expand(value, size)
+
+    def merge_states(self, states, sizes):
+        """ Join the states of populations of this model into one, so that
+            they are all updated together
+
+        :param list(dict) states: The state of each population
+        :param list(int) sizes: The size of each population
+        :rtype: dict(str, numpy.ndarray)
+        """
+        return {name: numpy.concatenate([state[name] for state in states])
+                for name in states[0]}
+
+    def split_state(self, merged, states, sizes):
+        """ Copy a merged state back into the states of the populations
+
+        :param dict merged: The merged state
+        :param list(dict) states: The state of each population, updated
+        :param list(int) sizes: The size of each population
+        """
+        first = 0
+        for state, size in zip(states, sizes):
+            for name in state:
+                state[name] = merged[name][first:first + size].copy()
+            first += size
+
+    def prepare(self, state, dt):
+        """ Add anything that depends on the time step to a merged state;
+            names of such values start with an underscore
+
+        :param dict state: The merged state
+        :param float dt: The time step in ms
+        """
+
+    def step(self, state, size, step, dt, exc, inh, rng):
+        """ Advance the population by one time step
+
+        :param dict state: The arrays of the population
+        :param int size: The number of neurons in the population
+        :param int step: The index of the time step
+        :param float dt: The time step in ms
+        :param exc:
+            The excitatory input arriving in this step, or None if the model
+            does not receive input
+        :param inh: The inhibitory input arriving in this step, or None
+        :param rng: The random number generator of the population
+        :return:
+            The number of spikes of each neuron in this step, or whether each
+            neuron spiked
+        :rtype: numpy.ndarray
+        """
+        raise NotImplementedError
+
+
+class IF_curr_exp(_Model):
+    """ Leaky integrate and fire neuron with exponentially decaying
+        current-based synapses, integrated exactly over each time step
+    """
+
+    default_parameters = {
+        'cm': 1.0, 'i_offset': 0.0, 'tau_m': 20.0, 'tau_refrac': 0.1,
+        'tau_syn_E': 5.0, 'tau_syn_I': 5.0, 'v_reset': -65.0,
+        'v_rest': -65.0, 'v_thresh': -50.0}
+    default_initial_values = {'v': -65.0, 'isyn_exc': 0.0, 'isyn_inh': 0.0}
+
+    def create_state(self, size, parameters, initial_values, rng):
+        state = super().create_state(size, parameters, initial_values, rng)
+        state["refractory"] = numpy.zeros(size, dtype="int64")
+        return state
+
+    def prepare(self, state, dt):
+        state["_decay_m"] = numpy.exp(-dt / state["tau_m"])
+        state["_decay_E"] = numpy.exp(-dt / state["tau_syn_E"])
+        state["_decay_I"] = numpy.exp(-dt / state["tau_syn_I"])
+        state["_r_m"] = state["tau_m"] / state["cm"]
+        state["_refrac_steps"] = numpy.round(
+            state["tau_refrac"] / dt).astype("int64")
+
+    def step(self, state, size, step, dt, exc, inh, rng):
+        isyn_exc = state["isyn_exc"]
+        isyn_inh = state["isyn_inh"]
+        isyn_exc += exc
+        isyn_inh += inh
+        v_inf = state["v_rest"] + state["_r_m"] * (
+            isyn_exc - isyn_inh + state["i_offset"])
+        v = state["v"]
+        v -= v_inf
+        v *= state["_decay_m"]
+        v += v_inf
+        refractory = state["refractory"]
+        in_refractory = refractory > 0
+        if in_refractory.any():
+            v[in_refractory] = state["v_reset"][in_refractory]
+            refractory[in_refractory] -= 1
+        spiked = v >= state["v_thresh"]
+        if spiked.any():
+            v[spiked] = state["v_reset"][spiked]
+            refractory[spiked] = state["_refrac_steps"][spiked]
+        isyn_exc *= state["_decay_E"]
+        isyn_inh *= state["_decay_I"]
+        return spiked
+
+
+class SpikeSourcePoisson(_Model):
+    """ Independent Poisson spike trains at a rate in Hz between start and
+        start + duration; more than one spike per step is possible at high
+        rates.  As in sPyNNaker, rates, starts and durations instead give a
+        schedule of rates, either one list for every neuron or a list per
+        neuron; a missing duration lasts until the next start.
+    """
+
+    default_parameters = {
+        'rate': 1.0, 'start': 0.0, 'duration': numpy.inf, 'rates': None,
+        'starts': None, 'durations': None}
+    receives_input = False
+
+    #: The names of the parameters of a schedule
+    _SCHEDULE = ("rates", "starts", "durations")
+
+    def create_state(self, size, parameters, initial_values, rng):
+        if parameters.get("rates") is not None:
+            return self.__schedule(
+                size, parameters["rates"], parameters.get("starts"),
+                parameters.get("durations"))
+        return {"rates": expand(parameters["rate"], size)[:, None],
+                "starts": expand(parameters["start"], size)[:, None],
+                "durations": expand(parameters["duration"], size)[:, None]}
+
+    def set_parameters(self, state, size, parameters):
+        unknown = set(parameters) - set(self.default_parameters)
+        if unknown:
+            raise ValueError("Unknown parameters {} for {}".format(
+                sorted(unknown), type(self).__name__))
+        if set(parameters) & set(self._SCHEDULE):
+            state.update(self.__schedule(
+                size, parameters.get("rates"), parameters.get("starts"),
+                parameters.get("durations")))
+            return
+        if state["rates"].shape[1] != 1:
+            raise ValueError(
+                "Set rates, starts and durations of a scheduled source")
+        for name, value in parameters.items():
+            state[name + "s"] = expand(value, size)[:, None]
+
+    def merge_states(self, states, sizes):
+        # Pad the schedules to the same number of segments with empty ones
+        n_segments = max(state["rates"].shape[1] for state in states)
+        merged = dict()
+        for name in self._SCHEDULE:
+            merged[name] = numpy.concatenate([
+                numpy.pad(state[name],
+                          ((0, 0), (0, n_segments - state[name].shape[1])))
+                for state in states])
+        return merged
+
+    def split_state(self, merged, states, sizes):
+        # Nothing changes while running
+        return
+
+    @staticmethod
+    def __per_neuron(values, size):
+        values = list(values)
+        if values and not numpy.isscalar(values[0]):
+            if len(values) != size:
+                raise ValueError(
+                    "A schedule per neuron needs one for each of the "
+                    "{} neurons".format(size))
+            return [list(v) for v in values]
+        return [values] * size
+
+    @classmethod
+    def __schedule(cls, size, rates, starts, durations):
+        if rates is None or starts is None:
+            raise ValueError("A schedule needs both rates and starts")
+        rates = cls.__per_neuron(rates, size)
+        starts = cls.__per_neuron(starts, size)
+        if durations is None:
+            durations = [
+                list(numpy.diff(numpy.append(s, numpy.inf))) for s in starts]
+        else:
+            durations = cls.__per_neuron(durations, size)
+        n_segments = max(len(r) for r in rates)
+        state = {name: numpy.zeros((size, n_segments))
+                 for name in cls._SCHEDULE}
+        for i, values in enumerate(zip(rates, starts, durations)):
+            if len(set(len(v) for v in values)) != 1:
+                raise ValueError(
+                    "The rates, starts and durations of neuron {} differ in "
+                    "length".format(i))
+            for name, value in zip(cls._SCHEDULE, values):
+                state[name][i, :len(value)] = value
+        return state
+
+    def prepare(self, state, dt):
+        state["_expected"] = state["rates"] * dt / 1000.0
+        state["_start_step"] = numpy.round(state["starts"] / dt)
+        state["_end_step"] = numpy.round(
+            (state["starts"] + state["durations"]) / dt)
+        # The rates only change at the steps where a segment starts or ends
+        state["_changes"] = numpy.unique(numpy.concatenate(
+            (state["_start_step"].ravel(), state["_end_step"].ravel())))
+        state["_period"] = None
+
+    def step(self, state, size, step, dt, exc, inh, rng):
+        period = numpy.searchsorted(state["_changes"], step, side="right")
+        if period != state["_period"]:
+            active = ((step >= state["_start_step"]) &
+                      (step < state["_end_step"]))
+            # The rate of the segment under way, 0 if there is none
+            state["_now"] = numpy.where(
+                active, state["_expected"], 0.0).max(axis=1)
+            state["_period"] = period
+        return rng.poisson(state["_now"])
+
+
+class SpikeSourceArray(_Model):
+    """ Spikes at given times; spike_times is either one list of times for
+        every neuron or a list of times per neuron
+    """
+
+    default_parameters = {'spike_times': []}
+    receives_input = False
+
+    def create_state(self, size, parameters, initial_values, rng):
+        return self.__spike_state(size, parameters["spike_times"])
+
+    def set_parameters(self, state, size, parameters):
+        if "spike_times" in parameters:
+            state.update(self.__spike_state(size, parameters["spike_times"]))
+
+    def merge_states(self, states, sizes):
+        offsets = numpy.cumsum([0] + list(sizes[:-1]))
+        ids = numpy.concatenate([
+            state["_ids"] + offset for state, offset in zip(states, offsets)])
+        times = numpy.concatenate([state["_times"] for state in states])
+        order = numpy.argsort(times, kind="stable")
+        return {"_ids": ids[order], "_times": times[order]}
+
+    def split_state(self, merged, states, sizes):
+        # Nothing changes while running
+        return
+
+    @staticmethod
+    def __spike_state(size, spike_times):
+        times = list(spike_times)
+        if not times or numpy.isscalar(times[0]):
+            times = [times] * size
+        ids = numpy.concatenate(
+            [numpy.full(len(t), i, dtype="int64")
+             for i, t in enumerate(times)] + [numpy.zeros(0, "int64")])
+        times = numpy.concatenate(
+            [numpy.asarray(t, dtype="float64") for t in times] +
+            [numpy.zeros(0)])
+        order = numpy.argsort(times, kind="stable")
+        return {"_ids": ids[order], "_times": times[order]}
+
+    def step(self, state, size, step, dt, exc, inh, rng):
+        first, last = numpy.searchsorted(
+            state["_times"], [(step - 0.5) * dt, (step + 0.5) * dt])
+        return numpy.bincount(state["_ids"][first:last], minlength=size)
@@ -0,0 +1,38 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The spike conversion of spynnaker.pyNN.utilities.neo_convertor used by the
+IntroLab scripts
+"""
+
+import numpy
+
+
+def convert_spikes(neo, run=0):
+    """ The spikes of a Neo Block as an array of (neuron index, time)
+
+    :param ~neo.core.Block neo: The data from get_data
+    :param int run: The segment to convert
+    :rtype: ~numpy.ndarray
+    """
+    spiketrains = neo.segments[run].spiketrains
+    if not spiketrains:
+        return numpy.zeros((0, 2))
+    return numpy.concatenate([
+        numpy.column_stack((
+            numpy.full(len(train), train.annotations["source_index"]),
+            train.magnitude))
+        for train in spiketrains])
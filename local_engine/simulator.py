@@ -0,0 +1,430 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The time-stepped core of the local engine.
+
+All the populations of a model are merged into one set of state arrays, so
+each time step costs a handful of NumPy calls per model rather than per
+population.  The synapses between each pair of merged groups are held in
+compressed sparse rows ordered by the pre-neuron, and the input they carry
+is added to a ring buffer of the next max-delay time steps of each group.
+"""
+
+import numpy
+
+#: The index in the ring buffer of each receptor type
+RECEPTORS = {"excitatory": 0, "inhibitory": 1}
+
+
+class _Population(object):
+    __slots__ = [
+        "model", "size", "state", "seed", "record_spikes", "record_v",
+        "spike_ids", "spike_times", "v", "pending", "group", "offset"]
+
+    def __init__(self, model, size, state, seed):
+        self.model = model
+        self.size = size
+        self.state = state
+        self.seed = seed
+        self.record_spikes = False
+        self.record_v = False
+        self.spike_ids = list()
+        self.spike_times = list()
+        self.v = list()
+        # Input still to arrive, indexed by delay from the current step
+        self.pending = None
+        self.group = None
+        self.offset = 0
+
+
+class _Projection(object):
+    __slots__ = ["pre", "post", "pre_ids", "post_ids", "weights",
+                 "delay_steps", "receptor"]
+
+    def __init__(self, pre, post, pre_ids, post_ids, weights, delay_steps,
+                 receptor):
+        self.pre = pre
+        self.post = post
+        self.pre_ids = pre_ids
+        self.post_ids = post_ids
+        self.weights = weights
+        self.delay_steps = delay_steps
+        self.receptor = receptor
+
+
+class _Synapses(object):
+    """ The synapses from one group to another in compressed sparse rows
+    """
+
+    __slots__ = ["pre", "post", "indptr", "target", "weight", "delay"]
+
+    def __init__(self, pre, post, projections, ring_length):
+        pre_ids = numpy.concatenate([
+            p.pre.offset + p.pre_ids for p in projections])
+        order = numpy.argsort(pre_ids, kind="stable")
+        n_post = post.size
+        self.pre = pre
+        self.post = post
+        self.indptr = numpy.concatenate(([0], numpy.cumsum(
+            numpy.bincount(pre_ids, minlength=pre.size))))
+        # The position in the flattened ring of the slot of the current step
+        self.target = numpy.concatenate([
+            p.receptor * ring_length * n_post + p.post.offset + p.post_ids
+            for p in projections])[order]
+        self.weight = numpy.concatenate([
+            numpy.abs(p.weights) for p in projections])[order]
+        self.delay = numpy.concatenate([
+            p.delay_steps for p in projections])[order] * n_post
+
+    def deliver(self, spiking, counts, step, ring_length):
+        """ Add the input from the spikes of a step to the ring buffer of the
+            post-group
+        """
+        starts = self.indptr[spiking]
+        lengths = self.indptr[spiking + 1] - starts
+        total = int(lengths.sum())
+        if not total:
+            return
+        ends = numpy.cumsum(lengths)
+        index = numpy.arange(total) + numpy.repeat(starts - ends + lengths,
+                                                   lengths)
+        weight = self.weight[index]
+        if counts is not None:
+            weight = weight * numpy.repeat(counts, lengths)
+        n_post = self.post.size
+        slot = (step % ring_length) * n_post
+        flat = self.target[index] + (self.delay[index] + slot) % (
+            ring_length * n_post)
+        numpy.add.at(self.post.ring.reshape(-1), flat, weight)
+
+
+class _Group(object):
+    """ The merged populations of one model
+    """
+
+    __slots__ = ["model", "populations", "size", "state", "rng", "ring",
+                 "synapses", "record_spikes", "v_index", "spike_ids",
+                 "spike_steps", "v"]
+
+    def __init__(self, model, populations, rng, dt):
+        self.model = model
+        self.populations = populations
+        sizes = [pop.size for pop in populations]
+        self.size = sum(sizes)
+        offset = 0
+        for pop in populations:
+            pop.group = self
+            pop.offset = offset
+            offset += pop.size
+        self.state = model.merge_states(
+            [pop.state for pop in populations], sizes)
+        model.prepare(self.state, dt)
+        self.rng = rng
+        self.ring = None
+        self.synapses = list()
+        self.record_spikes = any(pop.record_spikes for pop in populations)
+        self.v_index = None
+        if any(pop.record_v for pop in populations):
+            self.v_index = numpy.concatenate([
+                numpy.arange(pop.offset, pop.offset + pop.size)
+                for pop in populations if pop.record_v])
+        self.spike_ids = list()
+        self.spike_steps = list()
+        self.v = list()
+
+    def create_ring(self, ring_length, step):
+        self.ring = numpy.zeros((2, ring_length, self.size))
+        for pop in self.populations:
+            if pop.pending is not None:
+                self.ring[:, :pop.pending.shape[1],
+                          pop.offset:pop.offset + pop.size] = pop.pending
+        self.ring = numpy.roll(self.ring, step % ring_length, axis=1)
+
+    def split(self, step):
+        sizes = [pop.size for pop in self.populations]
+        self.model.split_state(
+            self.state, [pop.state for pop in self.populations], sizes)
+        if self.ring is not None:
+            ring = numpy.roll(self.ring, -(step % self.ring.shape[1]), axis=1)
+            for pop in self.populations:
+                pop.pending = ring[:, :, pop.offset:pop.offset + pop.size]
+
+    def collect(self, dt):
+        """ Hand the recorded data of the last run to the populations
+        """
+        if self.spike_ids:
+            ids = numpy.concatenate(self.spike_ids)
+            times = numpy.repeat(
+                numpy.array(self.spike_steps, dtype="float64") * dt,
+                [len(i) for i in self.spike_ids])
+            for pop in self.populations:
+                if pop.record_spikes:
+                    mine = (ids >= pop.offset) & (
+                        ids < pop.offset + pop.size)
+                    pop.spike_ids.append(ids[mine] - pop.offset)
+                    pop.spike_times.append(times[mine])
+        if self.v:
+            v = numpy.array(self.v)
+            first = 0
+            for pop in self.populations:
+                if pop.record_v:
+                    pop.v.append(v[:, first:first + pop.size])
+                    first += pop.size
+        self.spike_ids = list()
+        self.spike_steps = list()
+        self.v = list()
+
+
+class Simulator(object):
+    """ The state of a simulation
+    """
+
+    __slots__ = ["__dt", "__step", "__populations", "__projections",
+                 "__groups", "__rngs", "__ring_length"]
+
+    def __init__(self, dt):
+        """
+        :param float dt: The time step in ms
+        """
+        self.__dt = dt
+        self.__step = 0
+        self.__populations = list()
+        self.__projections = list()
+        self.__groups = None
+        self.__rngs = dict()
+        self.__ring_length = 1
+
+    @property
+    def dt(self):
+        """ The time step in ms
+
+        :rtype: float
+        """
+        return self.__dt
+
+    @property
+    def time(self):
+        """ The time simulated so far in ms
+
+        :rtype: float
+        """
+        return self.__step * self.__dt
+
+    def add_population(self, model, size, initial_values, seed=None):
+        """ Add a population
+
+        :param model: The model of the neurons, with its parameters
+        :param int size: The number of neurons
+        :param dict initial_values: Initial values of the state variables
+        :param seed: The seed of the random numbers of the model, if any
+        :return: The index of the population
+        :rtype: int
+        """
+        self.__split()
+        state = model.create_state(
+            size, model.parameters, initial_values, None)
+        self.__populations.append(_Population(model, size, state, seed))
+        return len(self.__populations) - 1
+
+    def set_parameters(self, index, parameters):
+        """ Change the parameters of a population between runs
+        """
+        self.__split()
+        pop = self.__populations[index]
+        pop.model.set_parameters(pop.state, pop.size, parameters)
+
+    def initialize(self, index, initial_values):
+        """ Change the state variables of a population between runs
+        """
+        self.__split()
+        pop = self.__populations[index]
+        for name, value in initial_values.items():
+            if name not in pop.model.default_initial_values:
+                raise ValueError("Unknown state variable {} for {}".format(
+                    name, type(pop.model).__name__))
+            pop.state[name] = pop.model.create_state(
+                pop.size, {}, {name: value}, None)[name]
+
+    def record(self, index, variables):
+        """ Record spikes and / or v of a population
+
+        :param int index: The population
+        :param iterable(str) variables: The variables to record
+        """
+        self.__split()
+        pop = self.__populations[index]
+        for variable in variables:
+            if variable == "spikes":
+                pop.record_spikes = True
+            elif variable == "v" and "v" in pop.model.default_initial_values:
+                pop.record_v = True
+            else:
+                raise ValueError("Cannot record {} of {}".format(
+                    variable, type(pop.model).__name__))
+
+    def add_projection(self, pre, post, pre_ids, post_ids, weights, delays,
+                       receptor_type):
+        """ Add synapses between populations
+
+        :param int pre: The index of the pre-population
+        :param int post: The index of the post-population
+        :param ~numpy.ndarray pre_ids: The pre-neuron of each synapse
+        :param ~numpy.ndarray post_ids: The post-neuron of each synapse
+        :param ~numpy.ndarray weights: The weight of each synapse
+        :param ~numpy.ndarray delays: The delay of each synapse in ms
+        :param str receptor_type: "excitatory" or "inhibitory"
+        :return: The delays as rounded to time steps, in ms
+        :rtype: ~numpy.ndarray
+        """
+        if receptor_type not in RECEPTORS:
+            raise ValueError("Unknown receptor type {}".format(receptor_type))
+        if not self.__populations[post].model.receives_input:
+            raise ValueError("{} does not receive input".format(
+                type(self.__populations[post].model).__name__))
+        self.__split()
+        delay_steps = numpy.maximum(
+            numpy.round(numpy.asarray(delays) / self.__dt), 1).astype("int64")
+        self.__projections.append(_Projection(
+            self.__populations[pre], self.__populations[post],
+            numpy.asarray(pre_ids, dtype="int64"),
+            numpy.asarray(post_ids, dtype="int64"),
+            numpy.asarray(weights, dtype="float64"), delay_steps,
+            RECEPTORS[receptor_type]))
+        return delay_steps * self.__dt
+
+    def spikes(self, index):
+        """ The spikes recorded from a population
+
+        :return: The neuron index and time of each spike
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        pop = self.__populations[index]
+        return (numpy.concatenate(pop.spike_ids + [numpy.zeros(0, "int64")]),
+                numpy.concatenate(pop.spike_times + [numpy.zeros(0)]))
+
+    def clear_recording(self, index, variables):
+        """ Forget the data recorded from a population so far
+
+        :param int index: The population
+        :param list(str) variables: "spikes" and / or "v"
+        """
+        pop = self.__populations[index]
+        if "spikes" in variables:
+            pop.spike_ids = list()
+            pop.spike_times = list()
+        if "v" in variables:
+            pop.v = list()
+
+    def v(self, index):
+        """ The membrane voltage recorded from a population
+
+        :return: The voltage of each neuron at the start of each time step
+        :rtype: ~numpy.ndarray
+        """
+        pop = self.__populations[index]
+        if not pop.v:
+            return numpy.zeros((0, pop.size))
+        return numpy.concatenate(pop.v)
+
+    def __split(self):
+        if self.__groups is not None:
+            for group in self.__groups:
+                group.split(self.__step)
+            self.__groups = None
+
+    def __rng(self, model_type, populations):
+        # The random numbers carry on while the populations of the model
+        # stay the same, and start again from all their seeds once one is
+        # added after a run, so that its seed is not ignored; the step is
+        # then seeded too, so that the numbers before are not repeated
+        members = tuple(id(pop) for pop in populations)
+        if model_type in self.__rngs:
+            known, rng = self.__rngs[model_type]
+            if known == members:
+                return rng
+        seeds = [pop.seed for pop in populations]
+        if any(seed is None for seed in seeds):
+            rng = numpy.random.RandomState()
+        else:
+            rng = numpy.random.RandomState(
+                seeds + [self.__step] if self.__step else seeds)
+        self.__rngs[model_type] = (members, rng)
+        return rng
+
+    def __merge(self):
+        by_model = dict()
+        for pop in self.__populations:
+            by_model.setdefault(type(pop.model), list()).append(pop)
+        self.__groups = [
+            _Group(pops[0].model, pops, self.__rng(model_type, pops),
+                   self.__dt)
+            for model_type, pops in by_model.items()]
+        self.__ring_length = 1 + max(
+            [int(proj.delay_steps.max(initial=0))
+             for proj in self.__projections] + [0])
+        for group in self.__groups:
+            if group.model.receives_input:
+                group.create_ring(self.__ring_length, self.__step)
+        by_groups = dict()
+        for proj in self.__projections:
+            by_groups.setdefault(
+                (proj.pre.group, proj.post.group), list()).append(proj)
+        for (pre, post), projections in by_groups.items():
+            pre.synapses.append(
+                _Synapses(pre, post, projections, self.__ring_length))
+
+    def run(self, run_time):
+        """ Run for a time
+
+        :param float run_time: The time to run for in ms
+        """
+        if self.__groups is None:
+            self.__merge()
+        groups = self.__groups
+        dt = self.__dt
+        ring_length = self.__ring_length
+        n_steps = int(round(run_time / dt))
+        for step in range(self.__step, self.__step + n_steps):
+            slot = step % ring_length
+            fired = list()
+            for group in groups:
+                if group.v_index is not None:
+                    group.v.append(group.state["v"][group.v_index])
+                if group.ring is None:
+                    counts = group.model.step(
+                        group.state, group.size, step, dt, None, None,
+                        group.rng)
+                else:
+                    counts = group.model.step(
+                        group.state, group.size, step, dt,
+                        group.ring[0, slot], group.ring[1, slot], group.rng)
+                    group.ring[:, slot] = 0.0
+                fired.append(counts)
+            for group, counts in zip(groups, fired):
+                spiking = numpy.flatnonzero(counts)
+                if not len(spiking):
+                    continue
+                if group.record_spikes:
+                    group.spike_ids.append(spiking)
+                    group.spike_steps.append(step)
+                multiplicity = None
+                if counts.dtype != bool:
+                    multiplicity = counts[spiking]
+                for synapses in group.synapses:
+                    synapses.deliver(spiking, multiplicity, step, ring_length)
+        self.__step += n_steps
+        for group in groups:
+            group.collect(dt)
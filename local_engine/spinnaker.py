@@ -0,0 +1,345 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The subset of the pyNN.spiNNaker interface used by the IntroLab scripts,
+simulated locally; ``python -m local_engine script.py`` runs a script
+with this module in place of pyNN.spiNNaker.
+"""
+
+import neo
+import numpy
+import quantities
+from pyNN.random import NumpyRNG, RandomDistribution  # noqa: F401
+from local_engine.connectors import (  # noqa: F401
+    AllToAllConnector, FixedNumberPreConnector, FixedProbabilityConnector,
+    FromListConnector, OneToOneConnector)
+from local_engine.models import (  # noqa: F401
+    IF_curr_exp, SpikeSourceArray, SpikeSourcePoisson, expand)
+from local_engine.simulator import Simulator
+
+_simulator = None
+_neurons_per_core = dict()
+
+
+def _get_simulator():
+    if _simulator is None:
+        raise RuntimeError("setup() must be called first")
+    return _simulator
+
+
+def setup(timestep=1.0, min_delay=None, **extra_params):
+    """ Start a new simulation; the extra parameters of sPyNNaker, such as
+        time_scale_factor, are accepted and ignored
+    """
+    global _simulator
+    _simulator = Simulator(timestep)
+    _neurons_per_core.clear()
+
+
+def end():
+    """ End the simulation
+    """
+    global _simulator
+    _simulator = None
+
+
+def run(simtime):
+    """ Run the simulation for a time in ms
+    """
+    _get_simulator().run(simtime)
+    return get_current_time()
+
+
+def get_current_time():
+    """ The time simulated so far in ms
+
+    :rtype: float
+    """
+    return _get_simulator().time
+
+
+def get_time_step():
+    """ The time step in ms
+
+    :rtype: float
+    """
+    return _get_simulator().dt
+
+
+def name():
+    """ The name of the simulator
+
+    :rtype: str
+    """
+    return "local_engine"
+
+
+def set_number_of_neurons_per_core(neuron_type, max_permitted):
+    """ Accepted for compatibility; everything runs on one core here
+    """
+    _neurons_per_core[neuron_type] = max_permitted
+
+
+class StaticSynapse(object):
+    """ A synapse with a fixed weight and delay; a delay of None is one time
+        step
+    """
+
+    __slots__ = ["weight", "delay"]
+
+    def __init__(self, weight=0.0, delay=None):
+        self.weight = weight
+        self.delay = delay
+
+
+class _Recorder(object):
+    """ The recorder of a population, for clearing its data
+    """
+
+    __slots__ = ["__index"]
+
+    def __init__(self, index):
+        self.__index = index
+
+    def clear(self):
+        """ Forget all the data recorded so far
+        """
+        _get_simulator().clear_recording(self.__index, ["spikes", "v"])
+
+
+class Population(object):
+    """ A population of neurons of one model
+    """
+
+    __slots__ = ["__index", "__size", "__celltype", "__label"]
+
+    __n_created = 0
+
+    def __init__(self, size, cellclass, cellparams=None, structure=None,
+                 initial_values=None, label=None, constraints=None,
+                 additional_parameters=None, **kwargs):
+        if isinstance(cellclass, type):
+            cellclass = cellclass(**(cellparams or {}))
+        if label is None:
+            label = "population{}".format(Population.__n_created)
+        Population.__n_created += 1
+        seed = None
+        if additional_parameters:
+            seed = additional_parameters.get("seed")
+        self.__size = size
+        self.__celltype = cellclass
+        self.__label = label
+        self.__index = _get_simulator().add_population(
+            cellclass, size, initial_values or {}, seed)
+
+    @property
+    def size(self):
+        return self.__size
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def label(self):
+        return self.__label
+
+    @property
+    def celltype(self):
+        return self.__celltype
+
+    @property
+    def _index(self):
+        return self.__index
+
+    def set(self, **parameters):
+        """ Change the parameters of the neurons between runs
+        """
+        _get_simulator().set_parameters(self.__index, parameters)
+
+    def initialize(self, **initial_values):
+        """ Set the state variables of the neurons
+        """
+        _get_simulator().initialize(self.__index, initial_values)
+
+    def record(self, variables, to_file=None, sampling_interval=None):
+        """ Record "spikes" and / or "v"
+        """
+        if isinstance(variables, str):
+            variables = [variables]
+        if "all" in variables:
+            variables = ["spikes"]
+            if "v" in self.__celltype.default_initial_values:
+                variables.append("v")
+        _get_simulator().record(self.__index, variables)
+
+    @property
+    def recorder(self):
+        """ Clears the recorded data, as the recorder of a PyNN population
+        """
+        return _Recorder(self.__index)
+
+    def spinnaker_get_data(self, variable):
+        """ The recorded data as a NumPy array, as in sPyNNaker: (id, time)
+            for spikes or (id, time, value) for v
+        """
+        sim = _get_simulator()
+        if variable == "spikes":
+            ids, times = sim.spikes(self.__index)
+            order = numpy.lexsort((times, ids))
+            return numpy.column_stack((ids[order], times[order]))
+        v = sim.v(self.__index)
+        times = numpy.arange(len(v)) * sim.dt
+        return numpy.column_stack((
+            numpy.repeat(numpy.arange(self.__size), len(v)),
+            numpy.tile(times, self.__size), v.T.ravel()))
+
+    def get_data(self, variables="all", gather=True, clear=False,
+                 annotations=None):
+        """ The recorded data as a Neo Block with a single Segment; with
+            clear, the data returned is then forgotten
+        """
+        if isinstance(variables, str):
+            variables = [variables]
+        sim = _get_simulator()
+        block = neo.Block(name=self.__label)
+        segment = neo.Segment(name="segment000")
+        block.segments.append(segment)
+        if "spikes" in variables or "all" in variables:
+            ids, times = sim.spikes(self.__index)
+            order = numpy.argsort(ids, kind="stable")
+            bounds = numpy.searchsorted(
+                ids[order], numpy.arange(self.__size + 1))
+            sorted_times = times[order]
+            for i in range(self.__size):
+                segment.spiketrains.append(neo.SpikeTrain(
+                    numpy.sort(sorted_times[bounds[i]:bounds[i + 1]]),
+                    t_start=0.0, t_stop=max(sim.time, sim.dt), units="ms",
+                    source_population=self.__label, source_index=i))
+        if "v" in variables or "all" in variables:
+            v = sim.v(self.__index)
+            if len(v):
+                segment.analogsignals.append(neo.AnalogSignal(
+                    v, units="mV", t_start=0.0 * quantities.ms,
+                    sampling_period=sim.dt * quantities.ms, name="v",
+                    source_population=self.__label,
+                    array_annotations={
+                        "channel_index": numpy.arange(self.__size)}))
+        if clear:
+            sim.clear_recording(self.__index, [
+                "spikes", "v"] if "all" in variables else variables)
+        return block
+
+
+class Projection(object):
+    """ The synapses from one population to another
+    """
+
+    __slots__ = ["__connections", "__pre", "__post", "__label"]
+
+    def __init__(self, presynaptic_population, postsynaptic_population,
+                 connector, synapse_type=None, source=None,
+                 receptor_type="excitatory", space=None, label=None):
+        if synapse_type is None:
+            synapse_type = StaticSynapse()
+        if not isinstance(synapse_type, StaticSynapse):
+            raise NotImplementedError(
+                "Only StaticSynapse is supported by the local engine")
+        sim = _get_simulator()
+        pre, post = connector.connect(
+            presynaptic_population.size, postsynaptic_population.size,
+            presynaptic_population is postsynaptic_population)
+        weight = synapse_type.weight
+        if connector.weights is not None:
+            weight = connector.weights
+        delay = synapse_type.delay
+        if connector.delays is not None:
+            delay = connector.delays
+        if delay is None:
+            delay = sim.dt
+        weights = expand(weight, len(pre))
+        delays = sim.add_projection(
+            presynaptic_population._index, postsynaptic_population._index,
+            pre, post, weights, expand(delay, len(pre)), receptor_type)
+        self.__connections = (pre, post, weights, delays)
+        self.__pre = presynaptic_population
+        self.__post = postsynaptic_population
+        self.__label = label
+
+    @property
+    def label(self):
+        return self.__label
+
+    @property
+    def pre(self):
+        return self.__pre
+
+    @property
+    def post(self):
+        return self.__post
+
+    def __len__(self):
+        return len(self.__connections[0])
+
+    def __matrix(self, values):
+        pre, post = self.__connections[:2]
+        matrix = numpy.full((self.__pre.size, self.__post.size), numpy.nan)
+        matrix[pre, post] = values
+        return matrix
+
+    def get(self, attribute_names, format, gather=True,
+            with_address=True):  # pylint: disable=redefined-builtin
+        """ The weights and / or delays, as a "list" of tuples or an "array"
+            with NaN where there is no connection
+        """
+        if isinstance(attribute_names, str):
+            attribute_names = [attribute_names]
+        pre, post, weights, delays = self.__connections
+        values = {"weight": weights, "delay": delays}
+        if format == "array":
+            arrays = [self.__matrix(values[name]) for name in attribute_names]
+            return arrays[0] if len(arrays) == 1 else arrays
+        columns = [values[name] for name in attribute_names]
+        if with_address:
+            columns = [pre, post] + columns
+        return list(zip(*[column.tolist() for column in columns]))
+
+    def get_columns(self, attribute_names, with_address=True):
+        """ As get with format="list", but a column of the synapses for each
+            attribute, rather than a tuple for each synapse
+
+        :param attribute_names: "weight", "delay" or a list of them
+        :param bool with_address:
+            Whether the columns of the pre- and post-neurons come first
+        :rtype: tuple(~numpy.ndarray)
+        """
+        if isinstance(attribute_names, str):
+            attribute_names = [attribute_names]
+        pre, post, weights, delays = self.__connections
+        values = {"weight": weights, "delay": delays}
+        columns = [values[name] for name in attribute_names]
+        if with_address:
+            columns = [pre, post] + columns
+        return tuple(column.copy() for column in columns)
+
+    def getWeights(self, format="list"):  # pylint: disable=redefined-builtin
+        if format == "list":
+            return self.__connections[2].tolist()
+        return self.get("weight", format)
+
+    def getDelays(self, format="list"):  # pylint: disable=redefined-builtin
+        if format == "list":
+            return self.__connections[3].tolist()
+        return self.get("delay", format)
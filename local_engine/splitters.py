@@ -0,0 +1,36 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Stand-ins for the splitters of
+spynnaker.pyNN.extra_algorithms.splitter_components; how a population is
+split over cores makes no difference to the local engine
+"""
+
+
+class _Splitter(object):
+    __slots__ = ["args", "kwargs"]
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class SplitterAbstractPopulationVertexNeuronsSynapses(_Splitter):
+    __slots__ = []
+
+
+class SplitterPoissonDelegate(_Splitter):
+    __slots__ = []
@@ -0,0 +1,254 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Spikes held as columns: one contiguous array of neuron ids and one of
+times, rather than a Neo SpikeTrain per neuron and a tuple per spike.
+"""
+
+import numpy
+
+
+class SpikeColumns(object):
+    """ The spikes of one or more populations.  The ids of the neurons of
+        each population follow on from those of the population before, and
+        the spikes of each population are held together, so that selecting
+        a population copies nothing.
+    """
+
+    __slots__ = ["__ids", "__times", "__labels", "__neuron_offsets",
+                 "__spike_offsets", "__t_stop"]
+
+    def __init__(self, ids, times, sizes, labels=None, spike_counts=None,
+                 t_stop=None, first_id=0):
+        """
+        :param ~numpy.ndarray ids: The neuron id of each spike
+        :param ~numpy.ndarray times: The time of each spike in ms
+        :param list(int) sizes: The number of neurons of each population
+        :param list(str) labels: The label of each population
+        :param list(int) spike_counts:
+            The number of spikes of each population, if the spikes are held
+            in the order of the populations
+        :param float t_stop: The end of the recording in ms, if known
+        :param int first_id: The id of the first neuron
+        """
+        self.__ids = numpy.asarray(ids, dtype="int32")
+        self.__times = numpy.asarray(times)
+        if self.__times.dtype.kind != "f":
+            self.__times = self.__times.astype("float64")
+        if labels is None:
+            labels = [str(i) for i in range(len(sizes))]
+        if spike_counts is None and len(sizes) == 1:
+            spike_counts = [len(self.__ids)]
+        self.__labels = list(labels)
+        self.__neuron_offsets = first_id + numpy.concatenate(
+            ([0], numpy.cumsum(sizes))).astype("int64")
+        self.__spike_offsets = None
+        if spike_counts is not None:
+            self.__spike_offsets = numpy.concatenate(
+                ([0], numpy.cumsum(spike_counts))).astype("int64")
+        self.__t_stop = t_stop
+
+    @classmethod
+    def from_array(cls, spikes, size, label=None, dtype="float64",
+                   t_stop=None):
+        """ Wrap an array of (id, time) rows, as from spinnaker_get_data
+
+        :param ~numpy.ndarray spikes: The spikes
+        :param int size: The number of neurons
+        :param str label: The label of the population
+        :param dtype: The type of the times
+        :param float t_stop: The end of the recording in ms
+        :rtype: SpikeColumns
+        """
+        spikes = numpy.asarray(spikes).reshape(-1, 2)
+        return cls(spikes[:, 0], spikes[:, 1].astype(dtype), [size],
+                   None if label is None else [label], t_stop=t_stop)
+
+    @classmethod
+    def from_populations(cls, populations, dtype="float64", t_stop=None):
+        """ Read the recorded spikes of populations straight into columns,
+            without creating Neo objects
+
+        :param list populations: The populations, recording spikes
+        :param dtype: The type of the times
+        :param float t_stop: The end of the recording in ms
+        :rtype: SpikeColumns
+        """
+        populations = list(populations)
+        arrays = [numpy.asarray(pop.spinnaker_get_data("spikes")).reshape(
+            -1, 2) for pop in populations]
+        sizes = [pop.size for pop in populations]
+        offsets = numpy.concatenate(([0], numpy.cumsum(sizes)))
+        n_spikes = sum(len(array) for array in arrays)
+        ids = numpy.empty(n_spikes, dtype="int32")
+        times = numpy.empty(n_spikes, dtype=dtype)
+        first = 0
+        for array, offset in zip(arrays, offsets):
+            last = first + len(array)
+            ids[first:last] = array[:, 0] + offset
+            times[first:last] = array[:, 1]
+            first = last
+        return cls(ids, times, sizes, [pop.label for pop in populations],
+                   [len(array) for array in arrays], t_stop)
+
+    @classmethod
+    def from_neo(cls, block, label=None, dtype="float64"):
+        """ Convert the spike trains of the first segment of a Neo Block
+
+        :param ~neo.core.Block block: The data, as from get_data
+        :param str label: The label of the population
+        :param dtype: The type of the times
+        :rtype: SpikeColumns
+        """
+        trains = block.segments[0].spiketrains
+        counts = numpy.array([len(train) for train in trains], dtype="int64")
+        ids = numpy.repeat(numpy.array(
+            [train.annotations["source_index"] for train in trains],
+            dtype="int32"), counts)
+        times = numpy.empty(int(counts.sum()), dtype=dtype)
+        first = 0
+        for train, count in zip(trains, counts):
+            times[first:first + count] = train.rescale("ms").magnitude
+            first += count
+        t_stop = float(trains[0].t_stop.rescale("ms")) if trains else None
+        return cls(ids, times, [len(trains)],
+                   None if label is None else [label], t_stop=t_stop)
+
+    @property
+    def ids(self):
+        """ The neuron id of each spike, counting across the populations
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__ids
+
+    @property
+    def times(self):
+        """ The time of each spike in ms
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__times
+
+    @property
+    def labels(self):
+        """ The label of each population
+
+        :rtype: list(str)
+        """
+        return list(self.__labels)
+
+    @property
+    def n_neurons(self):
+        """ The number of neurons in all the populations
+
+        :rtype: int
+        """
+        return int(self.__neuron_offsets[-1] - self.__neuron_offsets[0])
+
+    @property
+    def neuron_offsets(self):
+        """ The id of the first neuron of each population, and the id after
+            the last neuron
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__neuron_offsets
+
+    @property
+    def t_stop(self):
+        """ The end of the recording in ms, or the last spike if not known
+
+        :rtype: float
+        """
+        if self.__t_stop is not None:
+            return self.__t_stop
+        return float(self.__times.max(initial=0.0))
+
+    @property
+    def nbytes(self):
+        """ The memory held by the columns
+
+        :rtype: int
+        """
+        return self.__ids.nbytes + self.__times.nbytes
+
+    def __len__(self):
+        return len(self.__ids)
+
+    def population(self, label):
+        """ The spikes of one population, which share memory with these;
+            the ids still count across all the populations
+
+        :param label: The label or index of the population
+        :rtype: SpikeColumns
+        """
+        index = label
+        if not isinstance(label, (int, numpy.integer)):
+            index = self.__labels.index(label)
+        first_id, end_id = self.__neuron_offsets[index:index + 2]
+        if self.__spike_offsets is None:
+            # The spikes are not in the order of the populations
+            selected = (self.__ids >= first_id) & (self.__ids < end_id)
+            ids, times = self.__ids[selected], self.__times[selected]
+        else:
+            first, last = self.__spike_offsets[index:index + 2]
+            ids, times = self.__ids[first:last], self.__times[first:last]
+        return SpikeColumns(
+            ids, times, [end_id - first_id], [self.__labels[index]],
+            t_stop=self.__t_stop, first_id=first_id)
+
+    def local_ids(self):
+        """ The id of each spike within its own population
+
+        :rtype: ~numpy.ndarray
+        """
+        population = numpy.searchsorted(
+            self.__neuron_offsets, self.__ids, side="right") - 1
+        return self.__ids - self.__neuron_offsets[population]
+
+    def as_array(self):
+        """ The spikes as (id, time) rows, as from spinnaker_get_data
+
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.column_stack((self.__ids, self.__times))
+
+    def to_spiketrains(self):
+        """ Convert to a Neo SpikeTrain per neuron, only when really needed
+
+        :rtype: list(~neo.core.SpikeTrain)
+        """
+        # pylint: disable=import-outside-toplevel
+        import neo
+        first = int(self.__neuron_offsets[0])
+        n_neurons = int(self.__neuron_offsets[-1]) - first
+        order = numpy.argsort(self.__ids, kind="stable")
+        bounds = numpy.searchsorted(
+            self.__ids[order], numpy.arange(first, first + n_neurons + 1))
+        times = self.__times[order]
+        t_stop = max(self.t_stop, 0.0)
+        population = numpy.searchsorted(
+            self.__neuron_offsets, numpy.arange(first, first + n_neurons),
+            side="right") - 1
+        return [
+            neo.SpikeTrain(
+                numpy.sort(times[bounds[i]:bounds[i + 1]]), t_start=0.0,
+                t_stop=t_stop, units="ms",
+                source_population=self.__labels[population[i]],
+                source_index=int(
+                    first + i - self.__neuron_offsets[population[i]]))
+            for i in range(n_neurons)]
@@ -0,0 +1,179 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Raster plots of large numbers of spikes, drawn by counting the spikes that
+fall in each pixel rather than drawing a marker per spike, so that the
+cost of drawing depends on the size of the image rather than the number of
+spikes.  Images can be written straight to PNG without matplotlib.
+"""
+
+import struct
+import zlib
+import numpy
+
+#: The default colour of each population, those of matplotlib's "tab10"
+TAB10 = [
+    "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b",
+    "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+
+def to_rgb(colour):
+    """ Convert a colour to red, green and blue from 0 to 1
+
+    :param colour: A "#rrggbb" string or a tuple of floats from 0 to 1
+    :rtype: ~numpy.ndarray
+    """
+    if isinstance(colour, str):
+        colour = colour.lstrip("#")
+        return numpy.array([int(colour[i:i + 2], 16) / 255.0
+                            for i in (0, 2, 4)])
+    return numpy.asarray(colour, dtype="float64")[:3]
+
+
+def pixel_counts(ids, times, n_neurons, first_id, t_start, t_stop, width,
+                 height):
+    """ The number of spikes in each pixel, with the first neuron at the
+        bottom
+
+    :param ~numpy.ndarray ids: The neuron of each spike
+    :param ~numpy.ndarray times: The time of each spike in ms
+    :param int n_neurons: The number of neurons drawn
+    :param int first_id: The id of the neuron drawn at the bottom
+    :param float t_start: The time at the left edge in ms
+    :param float t_stop: The time at the right edge in ms
+    :param int width: The width in pixels
+    :param int height: The height in pixels
+    :rtype: ~numpy.ndarray
+    """
+    x = numpy.floor((times - t_start) * (width / (t_stop - t_start)))
+    y = numpy.floor((ids - first_id) * (height / n_neurons))
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    pixel = (height - 1 - y[inside].astype("int64")) * width + x[
+        inside].astype("int64")
+    return numpy.bincount(pixel, minlength=width * height).reshape(
+        height, width)
+
+
+def _dilate(alpha, marker_size):
+    """ Spread each pixel over a square of marker_size pixels
+    """
+    spread = alpha.copy()
+    for dy in range(marker_size):
+        for dx in range(marker_size):
+            if dx or dy:
+                numpy.maximum(spread[dy:, dx:], alpha[:alpha.shape[0] - dy,
+                                                      :alpha.shape[1] - dx],
+                              out=spread[dy:, dx:])
+    return spread
+
+
+def raster_image(spikes, width=1000, height=600, t_start=0.0, t_stop=None,
+                 colours=None, background="#ffffff", saturation=1,
+                 marker_size=1):
+    """ Draw the spikes of each population in its own colour
+
+    :param ~spike_data.columns.SpikeColumns spikes: The spikes
+    :param int width: The width in pixels
+    :param int height: The height in pixels
+    :param float t_start: The time at the left edge in ms
+    :param float t_stop:
+        The time at the right edge in ms; by default the end of the spikes
+    :param list colours: The colour of each population, by default tab10
+    :param background: The colour of the background
+    :param int saturation: The number of spikes in a pixel for full colour
+    :param int marker_size: The size in pixels of the square of a spike
+    :return: The image as rows of red, green and blue bytes, top row first
+    :rtype: ~numpy.ndarray
+    """
+    if t_stop is None:
+        t_stop = spikes.t_stop
+    if t_stop <= t_start:
+        t_stop = t_start + 1.0
+    if colours is None:
+        colours = TAB10
+    n_neurons = max(spikes.n_neurons, 1)
+    first_id = int(spikes.neuron_offsets[0])
+    image = numpy.empty((height, width, 3))
+    image[:] = to_rgb(background)
+    for index in range(len(spikes.labels)):
+        population = spikes.population(index)
+        if not len(population):
+            continue
+        counts = pixel_counts(
+            population.ids, population.times, n_neurons, first_id, t_start,
+            t_stop, width, height)
+        alpha = numpy.minimum(counts / float(saturation), 1.0)
+        if marker_size > 1:
+            alpha = _dilate(alpha, marker_size)
+        image -= alpha[..., None] * (
+            image - to_rgb(colours[index % len(colours)]))
+    return (image * 255.0 + 0.5).astype("uint8")
+
+
+def show_raster(axes, spikes, t_start=0.0, t_stop=None, **kwargs):
+    """ Draw the spikes on matplotlib axes as an image of the size of the
+        axes on screen, so that matplotlib does not draw each spike
+
+    :param ~matplotlib.axes.Axes axes: The axes to draw on
+    :param ~spike_data.columns.SpikeColumns spikes: The spikes
+    :param float t_start: The time at the left edge in ms
+    :param float t_stop:
+        The time at the right edge in ms; by default the end of the spikes
+    :param kwargs: Passed on to :py:func:`raster_image`
+    """
+    if t_stop is None:
+        t_stop = spikes.t_stop
+    extent = axes.get_window_extent()
+    kwargs.setdefault("marker_size", 2)
+    first_id = int(spikes.neuron_offsets[0])
+    axes.imshow(
+        raster_image(spikes, max(int(extent.width), 1),
+                     max(int(extent.height), 1), t_start, t_stop, **kwargs),
+        extent=(t_start, t_stop, first_id, first_id + spikes.n_neurons),
+        aspect="auto", interpolation="nearest")
+
+
+def write_png(filename, image):
+    """ Write an image as an 8-bit RGB PNG
+
+    :param str filename: The file to write
+    :param ~numpy.ndarray image: Rows of red, green and blue bytes
+    """
+    height, width = image.shape[:2]
+    # Each row starts with the filter type, 0 for none
+    rows = numpy.zeros((height, width * 3 + 1), dtype="uint8")
+    rows[:, 1:] = numpy.asarray(image, dtype="uint8").reshape(height, -1)
+
+    def chunk(tag, data):
+        return (struct.pack(">I", len(data)) + tag + data +
+                struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff))
+
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def save_raster(spikes, filename, **kwargs):
+    """ Draw the spikes and write them to a PNG, without matplotlib
+
+    :param ~spike_data.columns.SpikeColumns spikes: The spikes
+    :param str filename: The file to write
+    :param kwargs: Passed on to :py:func:`raster_image`
+    """
+    write_png(filename, raster_image(spikes, **kwargs))
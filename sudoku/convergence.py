@@ -0,0 +1,230 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Detection of the Sudoku network settling on a solution, so that the
+simulation can be stopped early.
+"""
+
+from collections import namedtuple
+import numpy
+from spike_data.columns import SpikeColumns
+from sudoku.sudoku_board import (
+    binned_spike_counts, counts_to_board, is_consistent, is_valid)
+
+#: The outcome of :py:func:`run_until_solved`, with the number of spikes
+#: of the puzzle in the run
+SolveResult = namedtuple("SolveResult", [
+    "solved", "time_to_solution", "first_correct_time", "board", "run_time",
+    "n_spikes"])
+
+
+class ConvergenceMonitor(object):
+    """ Follows the board decoded in each bin, and decides that the puzzle
+        is solved once the board has been valid, consistent with the puzzle
+        and unchanged for a number of bins
+    """
+
+    __slots__ = [
+        "__init", "__stable_bins", "__solution", "__board", "__n_stable",
+        "__first_valid_time", "__first_correct_time", "__stable_since",
+        "__solved"]
+
+    def __init__(self, init, stable_bins, solution=None):
+        """
+        :param init: The puzzle as a 9x9 grid, with 0 for cells not given
+        :param int stable_bins:
+            The number of bins the board must be stable for
+        :param solution:
+            The known solution of the puzzle as a 9x9 grid, if any
+        """
+        self.__init = numpy.asarray(init)
+        self.__stable_bins = stable_bins
+        self.__solution = solution
+        self.__board = None
+        self.__n_stable = 0
+        self.__first_valid_time = None
+        self.__first_correct_time = None
+        self.__stable_since = None
+        self.__solved = False
+
+    @property
+    def solved(self):
+        """ Whether the board has been valid and stable for long enough
+
+        :rtype: bool
+        """
+        return self.__solved
+
+    @property
+    def board(self):
+        """ The last board added
+
+        :rtype: numpy.ndarray or None
+        """
+        return self.__board
+
+    @property
+    def first_valid_time(self):
+        """ The end time of the first bin with a valid board, or None
+
+        :rtype: float or None
+        """
+        return self.__first_valid_time
+
+    @property
+    def first_correct_time(self):
+        """ The end time of the first bin with a board equal to the known
+            solution, or None if not seen or no solution was given
+
+        :rtype: float or None
+        """
+        return self.__first_correct_time
+
+    @property
+    def time_to_solution(self):
+        """ The end time of the first bin of the stable valid board, or None
+            if not solved
+
+        :rtype: float or None
+        """
+        if not self.__solved:
+            return None
+        return self.__stable_since
+
+    def add_board(self, time, board):
+        """ Add the board decoded from the next bin
+
+        :param float time: The end time of the bin
+        :param board: The board decoded from the bin
+        :return: Whether the puzzle is now solved
+        :rtype: bool
+        """
+        if self.__solved:
+            return True
+        valid = is_valid(board) and is_consistent(board, self.__init)
+        if valid and self.__first_valid_time is None:
+            self.__first_valid_time = time
+        if (self.__solution is not None and
+                self.__first_correct_time is None and
+                numpy.array_equal(board, self.__solution)):
+            self.__first_correct_time = time
+        if valid and self.__n_stable and numpy.array_equal(
+                board, self.__board):
+            self.__n_stable += 1
+        elif valid:
+            self.__n_stable = 1
+            self.__stable_since = time
+        else:
+            self.__n_stable = 0
+        self.__board = board
+        self.__solved = self.__n_stable >= self.__stable_bins
+        return self.__solved
+
+
+def _clear_spikes(cells):
+    """ Forget the spikes read, so that the next chunk reads only its own;
+        PyNN populations clear through their recorder, while a simulator
+        without one keeps the older spikes, which are then outside the bins
+        of the chunk and ignored
+    """
+    recorder = getattr(cells, "recorder", None)
+    if recorder is not None:
+        recorder.clear()
+
+
+def run_batch_until_solved(sim, cells, n_N, inits, max_time,
+                           chunk_time=1000, ms_per_bin=100, stable_bins=10,
+                           solutions=None, stop=None):
+    """ Run in chunks, decoding the board of every puzzle in each bin after
+        each chunk, until the boards of all the puzzles are stable and
+        valid or max_time is reached
+
+    :param sim: The simulator
+    :param cells:
+        The Cells population of all the puzzles, recording spikes; its
+        spikes are cleared through its recorder after each chunk is decoded
+    :param int n_N: The number of neurons per digit in a cell
+    :param list inits:
+        The puzzles packed one after the other in the population, each a
+        9x9 grid with 0 for cells not given
+    :param float max_time: The longest time to run for
+    :param float chunk_time:
+        The time to run between checks, a multiple of ms_per_bin
+    :param float ms_per_bin: The length of the bins used to decode the board
+    :param int stable_bins: The number of bins a board must be stable for
+    :param list solutions:
+        The known solution of each puzzle, if any, to find the time that the
+        correct board was first seen
+    :param callable stop:
+        Called after each chunk; the run ends early if it returns True
+    :return: The result for each puzzle
+    :rtype: list(SolveResult)
+    """
+    n_puzzles = len(inits)
+    if solutions is None:
+        solutions = [None] * n_puzzles
+    monitors = [
+        ConvergenceMonitor(init, stable_bins, solution)
+        for init, solution in zip(inits, solutions)]
+    n_spikes = numpy.zeros(n_puzzles, dtype="int64")
+    run_time = 0
+    while run_time < max_time and not all(m.solved for m in monitors):
+        chunk = min(chunk_time, max_time - run_time)
+        sim.run(chunk)
+        spikes = SpikeColumns.from_populations([cells])
+        _clear_spikes(cells)
+        counts = binned_spike_counts(
+            spikes.ids, spikes.times, n_N, run_time, run_time + chunk,
+            ms_per_bin, n_puzzles)
+        n_spikes += counts.reshape(len(counts), n_puzzles, -1).sum(
+            axis=(0, 2))
+        boards = counts_to_board(
+            counts.reshape(len(counts), n_puzzles, 81, 9))
+        for i, bin_boards in enumerate(boards):
+            for monitor, board in zip(monitors, bin_boards):
+                monitor.add_board(run_time + (i + 1) * ms_per_bin, board)
+        run_time += chunk
+        if stop is not None and stop():
+            break
+    return [
+        SolveResult(m.solved, m.time_to_solution, m.first_correct_time,
+                    m.board, run_time, int(count))
+        for m, count in zip(monitors, n_spikes)]
+
+
+def run_until_solved(sim, cells, n_N, init, max_time, chunk_time=1000,
+                     ms_per_bin=100, stable_bins=10, stop=None):
+    """ Run in chunks, decoding the board in each bin after each chunk, until
+        the board is stable and valid or max_time is reached
+
+    :param sim: The simulator
+    :param cells:
+        The Cells population, recording spikes; its spikes are cleared
+        through its recorder after each chunk is decoded
+    :param int n_N: The number of neurons per digit in a cell
+    :param init: The puzzle as a 9x9 grid, with 0 for cells not given
+    :param float max_time: The longest time to run for
+    :param float chunk_time:
+        The time to run between checks, a multiple of ms_per_bin
+    :param float ms_per_bin: The length of the bins used to decode the board
+    :param int stable_bins: The number of bins the board must be stable for
+    :param callable stop:
+        Called after each chunk; the run ends early if it returns True
+    :rtype: SolveResult
+    """
+    return run_batch_until_solved(
+        sim, cells, n_N, [init], max_time, chunk_time, ms_per_bin,
+        stable_bins, stop=stop)[0]
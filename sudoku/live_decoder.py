@@ -0,0 +1,387 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+A pure Python receiver of the live spikes of the Sudoku Cells population,
+which decodes the board as the simulation runs.
+
+The live output arrives as EIEIO data packets (as sent by
+``activate_live_output_for``), which are parsed with NumPy straight into a
+ring buffer of (time, neuron id) and counted per cell and digit over bins
+of ``ms_per_bin``.
+"""
+
+import asyncio
+import socket
+import struct
+import time
+from threading import Event, Thread
+import numpy
+from sudoku.sudoku_board import counts_to_board, spike_counts
+
+_KEY_16 = 0
+_KEY_PAYLOAD_16 = 1
+_KEY_32 = 2
+_KEY_PAYLOAD_32 = 3
+
+#: The most keys that fit in a live output packet of KEY_32 with a timestamp
+MAX_KEYS_PER_PACKET = 62
+
+_RECEIVE_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def parse_spike_packet(data):
+    """ Get the spikes from an EIEIO data packet with timestamps
+
+    :param bytes data: The packet
+    :return: The times and keys of the spikes
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+    :raises ValueError: If the packet is not a timestamped data packet
+    """
+    count, flags = data[0], data[1]
+    has_prefix = (flags >> 7) & 1
+    upper_prefix = (flags >> 6) & 1
+    has_payload_base = (flags >> 5) & 1
+    payload_is_time = (flags >> 4) & 1
+    eieio_type = (flags >> 2) & 3
+    if not payload_is_time:
+        raise ValueError("The packet does not have timestamps")
+
+    position = 2
+    prefix = 0
+    if has_prefix:
+        prefix, = struct.unpack_from("<H", data, position)
+        position += 2
+        if upper_prefix:
+            prefix <<= 16
+    if eieio_type in (_KEY_16, _KEY_PAYLOAD_16):
+        element_format = "<u2"
+        base_format = "<H"
+    else:
+        element_format = "<u4"
+        base_format = "<I"
+    payload_base = None
+    if has_payload_base:
+        payload_base, = struct.unpack_from(base_format, data, position)
+        position += struct.calcsize(base_format)
+
+    with_payload = eieio_type in (_KEY_PAYLOAD_16, _KEY_PAYLOAD_32)
+    elements = numpy.frombuffer(
+        data, dtype=element_format, count=count * (1 + with_payload),
+        offset=position).astype("uint32")
+    if with_payload:
+        keys = elements[0::2] | prefix
+        times = elements[1::2]
+        if payload_base is not None:
+            times = times | payload_base
+    elif payload_base is not None:
+        keys = elements | prefix
+        times = numpy.full(count, payload_base, dtype="uint32")
+    else:
+        raise ValueError("The packet has no time for its keys")
+    return times, keys
+
+
+def spike_packets(times, keys):
+    """ Build the EIEIO data packets carrying the given spikes, in the
+        format sent by the live output (KEY_32 with a timestamp base)
+
+    :param times: The times of the spikes
+    :param keys: The keys of the spikes
+    :rtype: iterable(tuple(int, bytes))
+    :return: The time and data of each packet
+    """
+    times = numpy.asarray(times, dtype="uint32")
+    keys = numpy.asarray(keys, dtype="uint32")
+    order = numpy.argsort(times, kind="stable")
+    times = times[order]
+    keys = keys[order]
+    starts = numpy.flatnonzero(numpy.diff(times, prepend=-1) != 0)
+    ends = numpy.append(starts[1:], len(times))
+    for start, end in zip(starts, ends):
+        for first in range(start, end, MAX_KEYS_PER_PACKET):
+            last = min(first + MAX_KEYS_PER_PACKET, end)
+            header = struct.pack(
+                "<BBI", last - first, 0x30 | (_KEY_32 << 2), times[first])
+            yield int(times[first]), header + keys[first:last].astype(
+                "<u4").tobytes()
+
+
+class SpikeRingBuffer(object):
+    """ A fixed size buffer of the most recent (time, id) of spikes
+    """
+
+    __slots__ = ["__times", "__ids", "__n_written"]
+
+    def __init__(self, capacity):
+        """
+        :param int capacity: The number of spikes kept
+        """
+        self.__times = numpy.zeros(capacity, dtype="uint32")
+        self.__ids = numpy.zeros(capacity, dtype="int64")
+        self.__n_written = 0
+
+    @property
+    def n_written(self):
+        """ The total number of spikes ever added
+
+        :rtype: int
+        """
+        return self.__n_written
+
+    def append(self, times, ids):
+        """ Add spikes, overwriting the oldest if full
+        """
+        capacity = len(self.__times)
+        times = times[-capacity:]
+        ids = ids[-capacity:]
+        positions = (self.__n_written + numpy.arange(len(times))) % capacity
+        self.__times[positions] = times
+        self.__ids[positions] = ids
+        self.__n_written += len(times)
+
+    def latest(self, n_spikes):
+        """ The most recent spikes, oldest first
+
+        :param int n_spikes: The maximum number of spikes to get
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        capacity = len(self.__times)
+        n_spikes = min(n_spikes, capacity, self.__n_written)
+        positions = (self.__n_written - n_spikes +
+                     numpy.arange(n_spikes)) % capacity
+        return self.__times[positions], self.__ids[positions]
+
+
+class LiveSudokuDecoder(asyncio.DatagramProtocol):
+    """ Receives the live spikes of the Cells population and publishes the
+        board decoded from the spike counts of each bin
+    """
+
+    __slots__ = [
+        "__n_cell", "__ms_per_bin", "__on_board", "__buffer", "__counts",
+        "__bin", "__board", "__keys", "__atoms", "__n_packets",
+        "__n_bad_packets", "__loop", "__thread"]
+
+    def __init__(self, n_cell, ms_per_bin=100, on_board=None,
+                 capacity=1024 * 1024):
+        """
+        :param int n_cell: The number of neurons in a cell
+        :param int ms_per_bin: The length of the bins in milliseconds
+        :param callable on_board:
+            Called with the end time of each bin and its board
+        :param int capacity: The number of spikes kept in the ring buffer
+        """
+        self.__n_cell = n_cell
+        self.__ms_per_bin = ms_per_bin
+        self.__on_board = on_board
+        self.__buffer = SpikeRingBuffer(capacity)
+        self.__counts = numpy.zeros((81, 9), dtype="int64")
+        self.__bin = 0
+        self.__board = numpy.zeros((9, 9), dtype="int64")
+        self.__keys = None
+        self.__atoms = None
+        self.__n_packets = 0
+        self.__n_bad_packets = 0
+        self.__loop = None
+        self.__thread = None
+
+    @property
+    def board(self):
+        """ The board of the last complete bin
+
+        :rtype: numpy.ndarray
+        """
+        return self.__board
+
+    @property
+    def spikes(self):
+        """ The ring buffer of received spikes
+
+        :rtype: SpikeRingBuffer
+        """
+        return self.__buffer
+
+    @property
+    def n_packets(self):
+        """ The number of packets received
+
+        :rtype: int
+        """
+        return self.__n_packets
+
+    @property
+    def n_bad_packets(self):
+        """ The number of packets received that could not be parsed
+
+        :rtype: int
+        """
+        return self.__n_bad_packets
+
+    def set_key_map(self, key_to_atom):
+        """ Set the mapping from the keys in the packets to neuron ids, as
+            read from the database; until this is set, keys are used as ids
+
+        :param dict(int,int) key_to_atom: The neuron id of each key
+        """
+        keys = numpy.fromiter(key_to_atom.keys(), dtype="int64")
+        atoms = numpy.fromiter(key_to_atom.values(), dtype="int64")
+        order = numpy.argsort(keys)
+        self.__atoms = atoms[order]
+        self.__keys = keys[order]
+
+    def __key_ids(self, keys):
+        keys = keys.astype("int64")
+        if self.__keys is None:
+            return keys
+        index = numpy.minimum(
+            numpy.searchsorted(self.__keys, keys), len(self.__keys) - 1)
+        return numpy.where(self.__keys[index] == keys, self.__atoms[index], -1)
+
+    def datagram_received(self, data, addr):
+        self.__n_packets += 1
+        try:
+            times, keys = parse_spike_packet(data)
+        except (ValueError, IndexError, struct.error):
+            self.__n_bad_packets += 1
+            return
+        self.add_spikes(times, keys)
+
+    def add_spikes(self, times, keys):
+        """ Add spikes to the buffer and the counts, publishing the boards
+            of any bins that they complete
+
+        :param times: The times of the spikes
+        :param keys: The keys of the spikes
+        """
+        ids = self.__key_ids(keys)
+        valid = (ids >= 0) & (ids < 81 * self.__n_cell)
+        times = times[valid]
+        ids = ids[valid]
+        self.__buffer.append(times, ids)
+        bins = times // self.__ms_per_bin
+        for spike_bin in numpy.unique(bins):
+            if spike_bin < self.__bin:
+                # Too late for a bin that has already been published
+                continue
+            while self.__bin < spike_bin:
+                self.__publish()
+            self.__counts += spike_counts(
+                ids[bins == spike_bin], self.__n_cell // 9)
+
+    def __publish(self):
+        self.__board = counts_to_board(self.__counts)
+        self.__counts[:] = 0
+        self.__bin += 1
+        if self.__on_board is not None:
+            self.__on_board(self.__bin * self.__ms_per_bin, self.__board)
+
+    def finish(self):
+        """ Publish the board of the current, possibly partial, bin
+        """
+        self.__publish()
+
+    async def listen(self, port, host="0.0.0.0"):
+        """ Start receiving packets on the running event loop
+
+        :param int port: The port to listen on, or 0 for any free port
+        :param str host: The address to listen on
+        :return: The transport and the port listened on
+        :rtype: tuple(asyncio.DatagramTransport, int)
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, _RECEIVE_BUFFER_SIZE)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            sock.close()
+            raise
+        transport, _ = await asyncio.get_running_loop(
+            ).create_datagram_endpoint(lambda: self, sock=sock)
+        return transport, sock.getsockname()[1]
+
+    def start(self, port, host="0.0.0.0"):
+        """ Receive packets on an event loop in a background thread
+
+        :param int port: The port to listen on, or 0 for any free port
+        :param str host: The address to listen on
+        :return: The port listened on
+        :rtype: int
+        """
+        ready = Event()
+        result = dict()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self.__loop = loop
+            try:
+                transport, result["port"] = loop.run_until_complete(
+                    self.listen(port, host))
+            except Exception as error:  # pylint: disable=broad-except
+                # Passed back to start, which would otherwise wait forever
+                result["error"] = error
+                loop.close()
+                return
+            finally:
+                ready.set()
+            loop.run_forever()
+            transport.close()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+        self.__thread = Thread(target=run, name="Sudoku decoder", daemon=True)
+        self.__thread.start()
+        ready.wait()
+        if "error" in result:
+            self.__thread.join()
+            self.__thread = None
+            raise result["error"]
+        return result["port"]
+
+    def stop(self):
+        """ Stop the background thread started by :py:meth:`start`
+        """
+        if self.__thread is not None:
+            self.__loop.call_soon_threadsafe(self.__loop.stop)
+            self.__thread.join()
+            self.__thread = None
+
+
+async def replay_spikes(times, keys, port, host="127.0.0.1", time_scale=1.0):
+    """ Send spikes as live output packets, e.g. to test a decoder
+
+    :param times: The times of the spikes in milliseconds
+    :param keys: The keys of the spikes
+    :param int port: The port to send to
+    :param str host: The host to send to
+    :param time_scale:
+        The wall clock seconds per simulated second, or None to send as
+        fast as possible
+    """
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(host, port))
+    start = time.perf_counter()
+    try:
+        for packet_time, packet in spike_packets(times, keys):
+            if time_scale is not None:
+                delay = (start + packet_time / 1000.0 * time_scale -
+                         time.perf_counter())
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            transport.sendto(packet)
+    finally:
+        transport.close()
@@ -0,0 +1,136 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+The puzzles used by the Sudoku examples.
+
+NB use as init[8-y][x] -> cell[x][y]
+"""
+
+#: The puzzles by number; 0 for cells whose value is not given
+PUZZLES = {
+    # Diabolical problem:
+    1: [[0, 0, 1,  0, 0, 8,  0, 7, 3],
+        [0, 0, 5,  6, 0, 0,  0, 0, 1],
+        [7, 0, 0,  0, 0, 1,  0, 0, 0],
+
+        [0, 9, 0,  8, 1, 0,  0, 0, 0],
+        [5, 3, 0,  0, 0, 0,  0, 4, 6],
+        [0, 0, 0,  0, 6, 5,  0, 3, 0],
+
+        [0, 0, 0,  1, 0, 0,  0, 0, 4],
+        [8, 0, 0,  0, 0, 9,  3, 0, 0],
+        [9, 4, 0,  5, 0, 0,  7, 0, 0]],
+    2: [[2, 0, 0,  0, 0, 6,  0, 3, 0],
+        [4, 8, 0,  0, 1, 9,  0, 0, 0],
+        [0, 0, 7,  0, 2, 0,  9, 0, 0],
+
+        [0, 0, 0,  3, 0, 0,  0, 9, 0],
+        [7, 0, 8,  0, 0, 0,  1, 0, 5],
+        [0, 4, 0,  0, 0, 7,  0, 0, 0],
+
+        [0, 0, 4,  0, 9, 0,  6, 0, 0],
+        [0, 0, 0,  6, 4, 0,  0, 1, 9],
+        [0, 5, 0,  1, 0, 0,  0, 0, 8]],
+    3: [[0, 0, 3,  2, 0, 0,  0, 7, 0],
+        [0, 0, 5,  0, 0, 0,  3, 0, 0],
+        [0, 0, 8,  9, 7, 0,  0, 5, 0],
+
+        [0, 0, 0,  8, 9, 0,  0, 0, 0],
+        [0, 5, 0,  0, 0, 0,  0, 2, 0],
+        [0, 0, 0,  0, 6, 1,  0, 0, 0],
+
+        [0, 1, 0,  0, 2, 5,  6, 0, 0],
+        [0, 0, 4,  0, 0, 0,  8, 0, 0],
+        [0, 9, 0,  0, 0, 7,  5, 0, 0]],
+    4: [[0, 1, 0,  0, 0, 0,  0, 0, 2],
+        [8, 7, 0,  0, 0, 0,  5, 0, 4],
+        [5, 0, 2,  0, 0, 0,  0, 9, 0],
+
+        [0, 5, 0,  4, 0, 9,  0, 0, 1],
+        [0, 0, 0,  7, 3, 2,  0, 0, 0],
+        [9, 0, 0,  5, 0, 1,  0, 4, 0],
+
+        [0, 2, 0,  0, 0, 0,  4, 0, 8],
+        [4, 0, 6,  0, 0, 0,  0, 1, 3],
+        [1, 0, 0,  0, 0, 0,  0, 2, 0]],
+    5: [[8, 9, 0,  2, 0, 0,  0, 7, 0],
+        [0, 0, 0,  0, 8, 0,  0, 0, 0],
+        [0, 4, 1,  0, 3, 0,  5, 0, 0],
+
+        [2, 5, 8,  0, 0, 0,  0, 0, 6],
+        [0, 0, 0,  0, 0, 0,  0, 0, 0],
+        [6, 0, 0,  0, 0, 0,  1, 4, 7],
+
+        [0, 0, 7,  0, 1, 0,  4, 3, 0],
+        [0, 0, 0,  0, 2, 0,  0, 0, 0],
+        [0, 2, 0,  0, 0, 7,  0, 5, 1]],
+    # "World's hardest sudoku":
+    # http://www.telegraph.co.uk/news/science/science-news/9359579/\
+    # Worlds-hardest-sudoku-can-you-crack-it.html
+    6: [[8, 0, 0,  0, 0, 0,  0, 0, 0],
+        [0, 0, 3,  6, 0, 0,  0, 0, 0],
+        [0, 7, 0,  0, 9, 0,  2, 0, 0],
+
+        [0, 5, 0,  0, 0, 7,  0, 0, 0],
+        [0, 0, 0,  0, 4, 5,  7, 0, 0],
+        [0, 0, 0,  1, 0, 0,  0, 3, 0],
+
+        [0, 0, 1,  0, 0, 0,  0, 6, 8],
+        [0, 0, 8,  5, 0, 0,  0, 1, 0],
+        [0, 9, 0,  0, 0, 0,  4, 0, 0]],
+    7: [[1, 0, 0,  4, 0, 0,  0, 0, 0],
+        [7, 0, 0,  5, 0, 0,  6, 0, 3],
+        [0, 0, 0,  0, 3, 0,  4, 2, 0],
+
+        [0, 0, 9,  0, 0, 0,  0, 3, 5],
+        [0, 0, 0,  3, 0, 5,  0, 0, 0],
+        [6, 3, 0,  0, 0, 0,  1, 0, 0],
+
+        [0, 2, 6,  0, 5, 0,  0, 0, 0],
+        [9, 0, 4,  0, 0, 6,  0, 0, 7],
+        [0, 0, 0,  0, 0, 8,  0, 0, 2]],
+}
+
+
+#: The Dream problem - no input!
+EMPTY = [[0 for _x in range(9)] for _y in range(9)]
+
+
+def parse_puzzle(line):
+    """ Read a puzzle written as 81 characters, row by row from the top,
+        with 0 or . for cells not given
+
+    :param str line: The puzzle
+    :return: The puzzle as a 9x9 grid
+    :rtype: list(list(int))
+    """
+    line = line.strip()
+    if len(line) != 81:
+        raise ValueError("A puzzle must have 81 characters: {}".format(line))
+    values = [0 if char in "0." else int(char) for char in line]
+    return [values[row * 9:(row + 1) * 9] for row in range(9)]
+
+
+def load_puzzles(filename):
+    """ Read a file of puzzles, one per line in the 81 character format,
+        ignoring blank lines and lines starting with #
+
+    :param str filename: The file to read
+    :rtype: list(list(list(int)))
+    """
+    with open(filename, encoding="utf-8") as f:
+        return [parse_puzzle(line) for line in f
+                if line.strip() and not line.startswith("#")]
@@ -19,34 +19,26 @@
 # Steve Furber, November 2015
 #
 #############################################################
-from pyNN.random import RandomDistribution
 import pyNN.spiNNaker as p
 import spynnaker.pyNN.external_devices as ext
-import subprocess
+from spinn_front_end_common.utilities.database import DatabaseConnection
 import os
 import sys
+import threading
 import traceback
-
-run_time = 20000                        # run time in milliseconds
+import numpy
+from sudoku.convergence import run_until_solved
+from sudoku.live_decoder import LiveSudokuDecoder
+from sudoku.puzzles import PUZZLES
+from sudoku.sudoku_board import format_board
+from sudoku.sudoku_network import build_network
+from sudoku.visualiser import VisualiserSupervisor
+
+run_time = 20000                        # (maximum) run time in milliseconds
+stable_bins = 10                        # solved bins to stop (0 = never)
+chunk_time = 1000                       # ms run between checks for solution
 neurons_per_digit = 5                   # number of neurons per digit
-fact = float(neurons_per_digit) / 10.0  # number of neurons per digit / 10
 ms_per_bin = 100
-running = False
-ended = False
-
-
-# Run the visualiser
-def read_output(visualiser, out):
-    result = visualiser.poll()
-    while result is None:
-        line = out.readline()
-        if line:
-            print(line)
-        result = visualiser.poll()
-    print("Visualiser exited: {} - quitting".format(result))
-    if running and not ended:
-        p.end()
-    os._exit(0)  # pylint: disable=protected-access
 
 
 def activate_visualiser(old_vis):
@@ -69,259 +61,109 @@ def activate_visualiser(old_vis):
         neur_per_num_opt = "--neurons_per_number"
         ms_per_bin_opt = "--ms_per_bin"
     try:
-        subprocess.Popen(
-            args=vis_exe + [neur_per_num_opt, str(neurons_per_digit),
-                            ms_per_bin_opt, str(ms_per_bin)],
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1)
-        # Thread(target=read_output,
-        #        args=[visualiser, visualiser.stdout]).start()
+        return VisualiserSupervisor(
+            vis_exe + [neur_per_num_opt, str(neurons_per_digit),
+                       ms_per_bin_opt, str(ms_per_bin)], echo=True,
+            on_exit=stop_run).start()
     except Exception:  # pylint: disable=broad-except
         if not old_vis:
             print("This example depends on https://github.com/"
                   "SpiNNakerManchester/sPyNNakerVisualisers")
             traceback.print_exc()
             print("trying old visualiser")
-            activate_visualiser(old_vis=True)
-        else:
-            raise
+            return activate_visualiser(old_vis=True)
+        raise
+
+
+def stop_run(returncode):
+    """ Called as the visualiser exits, to end the run that it was showing
+        if that is still going
+    """
+    if not run_ended.is_set():
+        print("Visualiser exited: {} - quitting".format(returncode))
+        ext.request_stop()
 
 
-activate_visualiser(old_vis=("OLD_VIS" in os.environ))
+def visualiser_exited():
+    """ Whether the run should stop because the visualiser was closed
+    """
+    return visualiser is not None and visualiser.exited
+
+
+def activate_decoder():
+    """ Decode the board from the live spikes in Python, printing it each
+        time it changes, instead of using an external visualiser
+    """
+    last_board = [None]
+
+    def print_board(time, board):
+        if last_board[0] is None or not numpy.array_equal(
+                board, last_board[0]):
+            print("Board at {} ms:".format(time))
+            print(format_board(board))
+        last_board[0] = board
+
+    live_decoder = LiveSudokuDecoder(n_cell, ms_per_bin, print_board)
+    live_decoder.start(port=17897)
+    connection = DatabaseConnection(local_port=19999)
+    connection.add_database_callback(
+        lambda reader: live_decoder.set_key_map(
+            reader.get_key_to_atom_id_mapping("Cells")))
+    return live_decoder, connection
+
+
+external_vis = "OLD_VIS" in os.environ or "EXTERNAL_VIS" in os.environ
+run_ended = threading.Event()
+visualiser = None
+if external_vis:
+    visualiser = activate_visualiser(old_vis=("OLD_VIS" in os.environ))
 
 p.setup(timestep=1.0)
 print("Creating Sudoku Network...")
-n_cell = int(90 * fact)   # total number of neurons in a cell
-n_stim = 30               # number of neurons in each stimulation source
-n_N = n_cell // 9         # number of neurons per value in cell
+n_cell = 9 * neurons_per_digit   # total number of neurons in a cell
+n_stim = 30                      # number of neurons in each stimulation source
+n_N = n_cell // 9                # number of neurons per value in cell
+if not external_vis:
+    decoder, db_connection = activate_decoder()
 
-# total number of neurons
-n_total = n_cell * 9 * 9
-n_stim_total = n_stim * 9 * 9
-
-# global distributions & parameters
+# global parameters
 weight_cell = 0.2
 weight_stim = 1
-dur_nois = RandomDistribution("uniform", [30000.0, 30001.0])
 weight_nois = 1.4
 delay = 2.0
 puzzle = 6
 
 # initialise non-zeros
 # NB use as init[8-y][x] -> cell[x][y]
-
-if puzzle == 1:
-    # Diabolical problem:
-    init = [[0, 0, 1,  0, 0, 8,  0, 7, 3],
-            [0, 0, 5,  6, 0, 0,  0, 0, 1],
-            [7, 0, 0,  0, 0, 1,  0, 0, 0],
-
-            [0, 9, 0,  8, 1, 0,  0, 0, 0],
-            [5, 3, 0,  0, 0, 0,  0, 4, 6],
-            [0, 0, 0,  0, 6, 5,  0, 3, 0],
-
-            [0, 0, 0,  1, 0, 0,  0, 0, 4],
-            [8, 0, 0,  0, 0, 9,  3, 0, 0],
-            [9, 4, 0,  5, 0, 0,  7, 0, 0]]
-elif puzzle == 2:
-    init = [[2, 0, 0,  0, 0, 6,  0, 3, 0],
-            [4, 8, 0,  0, 1, 9,  0, 0, 0],
-            [0, 0, 7,  0, 2, 0,  9, 0, 0],
-
-            [0, 0, 0,  3, 0, 0,  0, 9, 0],
-            [7, 0, 8,  0, 0, 0,  1, 0, 5],
-            [0, 4, 0,  0, 0, 7,  0, 0, 0],
-
-            [0, 0, 4,  0, 9, 0,  6, 0, 0],
-            [0, 0, 0,  6, 4, 0,  0, 1, 9],
-            [0, 5, 0,  1, 0, 0,  0, 0, 8]]
-elif puzzle == 3:
-    init = [[0, 0, 3,  2, 0, 0,  0, 7, 0],
-            [0, 0, 5,  0, 0, 0,  3, 0, 0],
-            [0, 0, 8,  9, 7, 0,  0, 5, 0],
-
-            [0, 0, 0,  8, 9, 0,  0, 0, 0],
-            [0, 5, 0,  0, 0, 0,  0, 2, 0],
-            [0, 0, 0,  0, 6, 1,  0, 0, 0],
-
-            [0, 1, 0,  0, 2, 5,  6, 0, 0],
-            [0, 0, 4,  0, 0, 0,  8, 0, 0],
-            [0, 9, 0,  0, 0, 7,  5, 0, 0]]
-elif puzzle == 4:
-    init = [[0, 1, 0,  0, 0, 0,  0, 0, 2],
-            [8, 7, 0,  0, 0, 0,  5, 0, 4],
-            [5, 0, 2,  0, 0, 0,  0, 9, 0],
-
-            [0, 5, 0,  4, 0, 9,  0, 0, 1],
-            [0, 0, 0,  7, 3, 2,  0, 0, 0],
-            [9, 0, 0,  5, 0, 1,  0, 4, 0],
-
-            [0, 2, 0,  0, 0, 0,  4, 0, 8],
-            [4, 0, 6,  0, 0, 0,  0, 1, 3],
-            [1, 0, 0,  0, 0, 0,  0, 2, 0]]
-elif puzzle == 5:
-    init = [[8, 9, 0,  2, 0, 0,  0, 7, 0],
-            [0, 0, 0,  0, 8, 0,  0, 0, 0],
-            [0, 4, 1,  0, 3, 0,  5, 0, 0],
-
-            [2, 5, 8,  0, 0, 0,  0, 0, 6],
-            [0, 0, 0,  0, 0, 0,  0, 0, 0],
-            [6, 0, 0,  0, 0, 0,  1, 4, 7],
-
-            [0, 0, 7,  0, 1, 0,  4, 3, 0],
-            [0, 0, 0,  0, 2, 0,  0, 0, 0],
-            [0, 2, 0,  0, 0, 7,  0, 5, 1]]
-elif puzzle == 6:
-    # "World's hardest sudoku":
-    # http://www.telegraph.co.uk/news/science/science-news/9359579/\
-    # Worlds-hardest-sudoku-can-you-crack-it.html
-    init = [[8, 0, 0,  0, 0, 0,  0, 0, 0],
-            [0, 0, 3,  6, 0, 0,  0, 0, 0],
-            [0, 7, 0,  0, 9, 0,  2, 0, 0],
-
-            [0, 5, 0,  0, 0, 7,  0, 0, 0],
-            [0, 0, 0,  0, 4, 5,  7, 0, 0],
-            [0, 0, 0,  1, 0, 0,  0, 3, 0],
-
-            [0, 0, 1,  0, 0, 0,  0, 6, 8],
-            [0, 0, 8,  5, 0, 0,  0, 1, 0],
-            [0, 9, 0,  0, 0, 0,  4, 0, 0]]
-else:
-    init = [[1, 0, 0,  4, 0, 0,  0, 0, 0],
-            [7, 0, 0,  5, 0, 0,  6, 0, 3],
-            [0, 0, 0,  0, 3, 0,  4, 2, 0],
-
-            [0, 0, 9,  0, 0, 0,  0, 3, 5],
-            [0, 0, 0,  3, 0, 5,  0, 0, 0],
-            [6, 3, 0,  0, 0, 0,  1, 0, 0],
-
-            [0, 2, 6,  0, 5, 0,  0, 0, 0],
-            [9, 0, 4,  0, 0, 6,  0, 0, 7],
-            [0, 0, 0,  0, 0, 8,  0, 0, 2]]
-
+init = PUZZLES[puzzle]
 # Dream problem - no input!
-# init = [[0 for x in range(9)] for y in range(9)]
-corr = init
+# init = sudoku.puzzles.EMPTY
 
 p.set_number_of_neurons_per_core(p.IF_curr_exp, 200)
 
 #
-# set up the 9x9 cell array populations
+# set up the 9x9 cell array populations, with a noise source to each cell,
+# the inhibition within and between cells, and the stimulation of the
+# initial numbers
 #
-cell_params_lif = {
-    'cm': 0.25,         # nF membrane capacitance
-    'i_offset': 0.5,    # nA    bias current
-    'tau_m': 20.0,      # ms    membrane time constant
-    'tau_refrac': 2.0,  # ms    refractory period
-    'tau_syn_E': 5.0,   # ms    excitatory synapse time constant
-    'tau_syn_I': 5.0,   # ms    inhibitory synapse time constant
-    'v_reset': -70.0,   # mV    reset membrane potential
-    'v_rest': -65.0,    # mV    rest membrane potential
-    'v_thresh': -50.0,  # mV    firing threshold voltage
-}
-
-print("Creating Populations...")
-cells = p.Population(n_total, p.IF_curr_exp, cell_params_lif, label="Cells",
-                     additional_parameters={"spikes_per_second": 200})
-cells.record("spikes")
+network = build_network(
+    p, [init], neurons_per_digit, weight_cell, weight_stim, weight_nois,
+    delay, n_stim)
+cells = network.cells
 ext.activate_live_output_for(cells, tag=1, port=17897)
 
-#
-# add a noise source to each cell
-#
-print("Creating Noise Sources...")
-noise = p.Population(
-    n_total, p.SpikeSourcePoisson,
-    {"rate": 20.0},
-    label="Noise")
-p.Projection(noise, cells, p.OneToOneConnector(),
-             synapse_type=p.StaticSynapse(weight=weight_nois))
-
-
-#
-# set up the cell internal inhibitory connections
-#
-print("Setting up cell inhibition...")
-connections = list()
-for x in range(9):
-    for y in range(9):
-        base = ((y * 9) + x) * n_cell
-
-        # full constant matrix of weight_cell apart from n_N squares on
-        # diagonal
-        connections_cell = [
-            (i + base, j + base,
-             0.0 if i // n_N == j // n_N else weight_cell, delay)
-            for i in range(n_cell) for j in range(n_cell)
-        ]
-        connections.extend(connections_cell)
-
-
-#
-# set up the inter-cell inhibitory connections
-#
-def interCell():
-    """ Inhibit same number: connections are n_N squares on diagonal of
-        weight_cell() from cell[x][y] to cell[r][c]
-    """
-    base_source = ((y * 9) + x) * n_cell
-    base_dest = ((c * 9) + r) * n_cell
-    connections_intC = [
-        (i + base_source, j + base_dest, weight_cell, delay)
-        for i in range(n_cell)
-        for j in range(n_N * (i // n_N), n_N * (i // n_N + 1))]
-
-    connections.extend(connections_intC)
-
-
-print("Setting up inhibition between cells...")
-for x in range(9):
-    for y in range(9):
-        for r in range(9):
-            if r != x:
-                interCell()  # by row...
-        for c in range(9):
-            if c != y:
-                interCell()  # by column...
-        for r in range(3 * (x // 3), 3 * (x // 3 + 1)):
-            for c in range(3 * (y // 3), 3 * (y // 3 + 1)):
-                if r != x and c != y:
-                    interCell()  # & by square
-conn_intC = p.FromListConnector(connections)
-p.Projection(cells, cells, conn_intC, receptor_type="inhibitory")
-
-#
-# set up & connect the initial (stimulation) conditions
-#
-print("Fixing initial numbers...")
-s = 0
-connections_stim = []
-for x in range(9):
-    for y in range(9):
-        if init[8 - y][x] != 0:
-            base_stim = ((y * 9) + x) * n_stim
-            base = ((y * 9) + x) * n_cell
-            for i in range(n_stim):
-
-                # one n_N square on diagonal
-                for j in range(
-                        n_N * (init[8 - y][x] - 1), n_N * init[8 - y][x]):
-                    connections_stim.append(
-                        (i + base_stim, j + base, weight_stim, delay))
-
-            s += 1
-
-if len(connections_stim) > 0:
-    stim = p.Population(
-        n_stim_total, p.SpikeSourcePoisson,
-        {"rate": 10.0}, label="Stim")
-    conn_stim = p.FromListConnector(connections_stim)
-    p.Projection(stim, cells, conn_stim, receptor_type="excitatory")
-#
-# initialise the network, run, and get results
-cells.initialize(v=RandomDistribution("uniform", [-65.0, -55.0]))
-
-running = True
-p.run(run_time)
+if stable_bins:
+    result = run_until_solved(
+        p, cells, n_N, init, run_time, chunk_time, ms_per_bin, stable_bins,
+        stop=visualiser_exited)
+    if result.solved:
+        print("Solved in {} ms".format(result.time_to_solution))
+    else:
+        print("Not solved in {} ms".format(result.run_time))
+    print(format_board(result.board))
+elif not visualiser_exited():
+    # One run, which closing the visualiser stops
+    p.run(run_time)
 
 # spikes = cells.getSpikes()
 # f, axarr = pylab.subplots(9, 9)
@@ -339,5 +181,10 @@ p.run(run_time)
 # pylab.show()
 # pylab.savefig("sudoku.png")
 
+run_ended.set()
 p.end()
-ended = True
+if visualiser is not None:
+    visualiser.stop()
+if not external_vis:
+    decoder.stop()
+    db_connection.close()
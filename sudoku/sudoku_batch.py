@@ -0,0 +1,60 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Solve many Sudoku puzzles side by side, as independent copies of the
+network packed into slices of the same populations, run in chunks of
+chunk_time until every puzzle is solved or max_time is reached
+"""
+import time
+import pyNN.spiNNaker as p
+from sudoku.convergence import run_batch_until_solved
+from sudoku.puzzles import PUZZLES
+from sudoku.sudoku_board import format_board
+from sudoku.sudoku_network import build_network
+
+max_time = 20000                        # maximum run time in milliseconds
+stable_bins = 10                        # solved bins to stop (0 = never)
+chunk_time = 1000                       # ms run between checks for solution
+ms_per_bin = 100
+neurons_per_digit = 5                   # number of neurons per digit
+n_copies = 2                            # number of copies of each puzzle
+
+inits = list(PUZZLES.values()) * n_copies
+
+start_time = time.perf_counter()
+p.setup(timestep=1.0)
+p.set_number_of_neurons_per_core(p.IF_curr_exp, 200)
+print("Creating Sudoku Network for {} puzzles...".format(len(inits)))
+network = build_network(p, inits, neurons_per_digit)
+
+results = run_batch_until_solved(
+    p, network.cells, network.n_N, inits, max_time, chunk_time, ms_per_bin,
+    stable_bins)
+
+p.end()
+wall_time = time.perf_counter() - start_time
+
+for i, result in enumerate(results):
+    if result.solved:
+        print("Puzzle {} solved in {} ms from {} spikes".format(
+            i, result.time_to_solution, result.n_spikes))
+    else:
+        print("Puzzle {} not solved from {} spikes".format(
+            i, result.n_spikes))
+    print(format_board(result.board))
+n_solved = sum(result.solved for result in results)
+print("{} of {} puzzles solved in {:.1f} s: {:.0f} puzzles per hour".format(
+    n_solved, len(results), wall_time, 3600.0 * n_solved / wall_time))
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark the Sudoku network on a corpus of puzzles against the exact
+solver, e.g.::
+
+    python -m sudoku.sudoku_benchmark puzzles.txt --output report.json
+
+The puzzle file has one puzzle per line in the 81 character format; without
+one the built in puzzles are used.
+"""
+
+import argparse
+import json
+import numpy
+import pyNN.spiNNaker as sim
+from spynnaker.pyNN.data import SpynnakerDataView
+from sudoku.convergence import run_batch_until_solved
+from sudoku.puzzles import PUZZLES, load_puzzles
+from sudoku.sudoku_network import build_network
+from sudoku.sudoku_solver import solve
+
+
+def _run_batch(inits, solutions, args):
+    sim.setup(timestep=1.0)
+    sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 200)
+    network = build_network(
+        sim, inits, args.neurons_per_digit, weight_cell=args.weight_cell,
+        weight_nois=args.weight_nois)
+    results = run_batch_until_solved(
+        sim, network.cells, network.n_N, inits, args.max_time,
+        args.chunk_time, args.ms_per_bin, args.stable_bins, solutions)
+    n_cores = SpynnakerDataView.get_n_placements()
+    sim.end()
+    return results, n_cores
+
+
+def summarise(records, n_difficulty_bins=4):
+    """ Summarise the per-puzzle records, overall and by difficulty (the
+        number of search nodes the exact solver needed)
+
+    :param list(dict) records: The record of each puzzle
+    :param int n_difficulty_bins: The number of difficulty quantiles
+    :rtype: dict
+    """
+    nodes = numpy.array([r["solver_nodes"] for r in records], dtype=float)
+    solved = numpy.array([r["solved"] for r in records])
+    accuracy = numpy.array([r["cell_accuracy"] for r in records])
+    core_seconds = sum(
+        r["n_cores"] * r["run_time"] / 1000.0 / r["batch_size"]
+        for r in records)
+    edges = numpy.unique(numpy.quantile(
+        nodes, numpy.linspace(0, 1, n_difficulty_bins + 1)))
+    levels = numpy.clip(
+        numpy.searchsorted(edges, nodes, side="right") - 1, 0,
+        max(len(edges) - 2, 0))
+    by_difficulty = list()
+    for level in numpy.unique(levels):
+        selected = levels == level
+        by_difficulty.append({
+            "min_solver_nodes": float(nodes[selected].min()),
+            "max_solver_nodes": float(nodes[selected].max()),
+            "n_puzzles": int(selected.sum()),
+            "solve_rate": float(solved[selected].mean()),
+            "mean_cell_accuracy": float(accuracy[selected].mean())})
+    return {
+        "n_puzzles": len(records),
+        "n_solved": int(solved.sum()),
+        "solve_rate": float(solved.mean()),
+        "mean_cell_accuracy": float(accuracy.mean()),
+        "solved_per_core_second": float(solved.sum() / core_seconds),
+        "by_difficulty": by_difficulty}
+
+
+def run_benchmark(puzzles, args):
+    """ Run the puzzles through the network in batches
+
+    :param list puzzles: The puzzles, each a 9x9 grid
+    :param args: The parsed command line arguments
+    :return: The record of each puzzle
+    :rtype: list(dict)
+    """
+    truths = [solve(init) for init in puzzles]
+    records = list()
+    for first in range(0, len(puzzles), args.batch_size):
+        inits = puzzles[first:first + args.batch_size]
+        batch_truths = truths[first:first + args.batch_size]
+        results, n_cores = _run_batch(
+            inits, [truth.solution for truth in batch_truths], args)
+        for init, truth, result in zip(inits, batch_truths, results):
+            accuracy = 0.0
+            if truth.solution is not None and result.board is not None:
+                accuracy = float(numpy.mean(result.board == truth.solution))
+            records.append({
+                "puzzle": "".join(str(v) for row in init for v in row),
+                "n_given": int(numpy.count_nonzero(init)),
+                "solver_nodes": truth.n_nodes,
+                "unique_solution": truth.n_solutions == 1,
+                "solved": bool(result.solved),
+                "time_to_first_correct": result.first_correct_time,
+                "time_to_stable": result.time_to_solution,
+                "cell_accuracy": accuracy,
+                "run_time": result.run_time,
+                "n_cores": n_cores,
+                "batch_size": len(inits)})
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("puzzle_file", nargs="?", help="puzzles to solve")
+    parser.add_argument("--neurons-per-digit", type=int, default=5)
+    parser.add_argument("--weight-cell", type=float, default=0.2)
+    parser.add_argument("--weight-nois", type=float, default=1.4)
+    parser.add_argument("--max-time", type=float, default=20000)
+    parser.add_argument("--chunk-time", type=float, default=1000)
+    parser.add_argument("--ms-per-bin", type=float, default=100)
+    parser.add_argument("--stable-bins", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="puzzles run side by side in one network")
+    parser.add_argument("--output", default="sudoku_benchmark.json")
+    args = parser.parse_args(argv)
+
+    if args.puzzle_file:
+        puzzles = load_puzzles(args.puzzle_file)
+    else:
+        puzzles = list(PUZZLES.values())
+    records = run_benchmark(puzzles, args)
+    summary = summarise(records)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"parameters": vars(args), "summary": summary,
+                   "puzzles": records}, f, indent=2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
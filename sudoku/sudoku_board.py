@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Decoding of the Sudoku board from the spikes of the Cells population.
+
+Boards are 9x9 arrays laid out like the puzzles, i.e. board[8 - y][x] is
+cell (x, y), with 0 for a cell with no spikes.
+"""
+
+import numpy
+
+
+def spike_counts(ids, n_N):
+    """ The number of spikes of each digit of each cell
+
+    :param ids: The ids of the neurons that spiked
+    :param int n_N: The number of neurons per digit in a cell
+    :return: An 81x9 array indexed by [cell, digit - 1]
+    :rtype: numpy.ndarray
+    """
+    digits = numpy.asarray(ids, dtype="int64") // n_N
+    return numpy.bincount(digits, minlength=81 * 9)[:81 * 9].reshape(81, 9)
+
+
+def binned_spike_counts(
+        ids, times, n_N, t_start, t_end, ms_per_bin, n_puzzles=1):
+    """ The number of spikes of each digit of each cell in each bin of
+        ms_per_bin from t_start to t_end
+
+    :param ids: The ids of the neurons that spiked
+    :param times: The times of the spikes
+    :param int n_N: The number of neurons per digit in a cell
+    :param float t_start: The start of the first bin
+    :param float t_end: The end of the last bin
+    :param float ms_per_bin: The length of each bin
+    :param int n_puzzles: The number of puzzles packed in the population
+    :return:
+        An array indexed by [bin, cell, digit - 1], where the cells of
+        puzzle k are 81 * k to 81 * k + 80
+    :rtype: numpy.ndarray
+    """
+    n_bins = int(numpy.ceil((t_end - t_start) / ms_per_bin))
+    n_digits = 81 * 9 * n_puzzles
+    times = numpy.asarray(times, dtype="float64")
+    bins = numpy.floor((times - t_start) / ms_per_bin).astype("int64")
+    in_range = (bins >= 0) & (bins < n_bins)
+    index = (bins[in_range] * n_digits +
+             numpy.asarray(ids, dtype="int64")[in_range] // n_N)
+    return numpy.bincount(index, minlength=n_bins * n_digits).reshape(
+        n_bins, 81 * n_puzzles, 9)
+
+
+def counts_to_board(counts):
+    """ The winning digit of each cell, i.e. the one with the most spikes
+
+    :param counts:
+        An array of spike counts indexed by [cell, digit - 1], optionally
+        with leading dimensions, e.g. for bins
+    :return: A board, or an array of boards for any leading dimensions
+    :rtype: numpy.ndarray
+    """
+    counts = numpy.asarray(counts)
+    values = numpy.where(
+        counts.max(axis=-1) > 0, counts.argmax(axis=-1) + 1, 0)
+    return numpy.flip(values.reshape(values.shape[:-1] + (9, 9)), axis=-2)
+
+
+def is_valid(board):
+    """ Whether the board is complete and every row, column and 3x3 square
+        contains each digit once
+
+    :param board: The board as a 9x9 grid
+    :rtype: bool
+    """
+    board = numpy.asarray(board)
+    squares = board.reshape(3, 3, 3, 3).transpose(0, 2, 1, 3).reshape(9, 9)
+    digits = numpy.arange(1, 10)
+    return bool(
+        numpy.all(numpy.sort(board, axis=1) == digits) and
+        numpy.all(numpy.sort(board.T, axis=1) == digits) and
+        numpy.all(numpy.sort(squares, axis=1) == digits))
+
+
+def is_consistent(board, init):
+    """ Whether the board has the digits given in the puzzle
+
+    :param board: The board as a 9x9 grid
+    :param init: The puzzle as a 9x9 grid, with 0 for cells not given
+    :rtype: bool
+    """
+    init = numpy.asarray(init)
+    given = init != 0
+    return bool(numpy.all(numpy.asarray(board)[given] == init[given]))
+
+
+def format_board(board):
+    """ The board as text, with . for undecided cells
+
+    :param board: The board as a 9x9 grid
+    :rtype: str
+    """
+    lines = list()
+    for row, values in enumerate(numpy.asarray(board)):
+        if row and row % 3 == 0:
+            lines.append("------+-------+------")
+        cells = ["." if value == 0 else str(value) for value in values]
+        lines.append(" | ".join(
+            " ".join(cells[i:i + 3]) for i in range(0, 9, 3)))
+    return "\n".join(lines)
@@ -0,0 +1,227 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Vectorised builders for the connections of the Sudoku network.
+
+Cell (x, y) of the puzzle is cell index ``y * 9 + x``; its neurons are
+``cell * n_cell`` to ``(cell + 1) * n_cell - 1`` and the neurons for digit
+``d`` (1 to 9) within the cell are the ``n_N`` neurons starting at
+``(d - 1) * n_N``.  The puzzle grids are given as ``init[8 - y][x]``.
+"""
+
+import numpy
+
+#: The dtype of the arrays returned by the builders
+CONNECTION_DTYPE = numpy.dtype([
+    ("pre", "uint32"), ("post", "uint32"),
+    ("weight", "float64"), ("delay", "float64")])
+
+
+def cell_values(init):
+    """ The given digit of each cell (0 if not given), indexed by cell
+
+    :param init: The puzzle as a 9x9 grid, used as init[8 - y][x]
+    :rtype: numpy.ndarray
+    """
+    return numpy.flipud(numpy.asarray(init, dtype="int32")).ravel()
+
+
+def constraint_adjacency():
+    """ Which cells constrain each other, i.e. are different cells in the
+        same row, column or 3x3 square
+
+    :return: An 81x81 boolean matrix indexed by [source cell, target cell]
+    :rtype: numpy.ndarray
+    """
+    cells = numpy.arange(81)
+    x = cells % 9
+    y = cells // 9
+    same_row = y[:, None] == y[None, :]
+    same_col = x[:, None] == x[None, :]
+    same_square = (
+        (x[:, None] // 3 == x[None, :] // 3) &
+        (y[:, None] // 3 == y[None, :] // 3))
+    return (same_row | same_col | same_square) & (cells[:, None] != cells)
+
+
+def _to_connections(pre, post, weight, delay):
+    pre, post, weight, delay = numpy.broadcast_arrays(
+        pre, post, weight, delay)
+    connections = numpy.empty(pre.size, dtype=CONNECTION_DTYPE)
+    connections["pre"] = pre.ravel()
+    connections["post"] = post.ravel()
+    connections["weight"] = weight.ravel()
+    connections["delay"] = delay.ravel()
+    return connections
+
+
+def intra_cell_connections(n_cell, n_N, weight, delay):
+    """ The inhibition within each cell: a full constant matrix of weight
+        apart from the n_N squares on the diagonal, which have weight 0
+
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :param float weight: The weight of the inhibition
+    :param float delay: The delay of the connections
+    :rtype: numpy.ndarray of CONNECTION_DTYPE
+    """
+    i = numpy.arange(n_cell)
+    same_digit = (i[:, None] // n_N) == (i[None, :] // n_N)
+    bases = numpy.arange(81)[:, None, None] * n_cell
+    return _to_connections(
+        bases + i[None, :, None], bases + i[None, None, :],
+        numpy.where(same_digit, 0.0, weight)[None, :, :], delay)
+
+
+def inter_cell_block(n_cell, n_N):
+    """ The (pre, post) offsets within a pair of cells that inhibit each
+        other, i.e. the n_N squares on the diagonal
+
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :return: Two arrays of shape (n_cell, n_N)
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+    """
+    i = numpy.arange(n_cell)
+    pre = numpy.repeat(i[:, None], n_N, axis=1)
+    post = (i // n_N * n_N)[:, None] + numpy.arange(n_N)[None, :]
+    return pre, post
+
+
+def inter_cell_connections(n_cell, n_N, weight, delay):
+    """ The inhibition of the same digit in cells that share a row, column
+        or 3x3 square
+
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :param float weight: The weight of the inhibition
+    :param float delay: The delay of the connections
+    :rtype: numpy.ndarray of CONNECTION_DTYPE
+    """
+    sources, targets = numpy.nonzero(constraint_adjacency())
+    block_pre, block_post = inter_cell_block(n_cell, n_N)
+    return _to_connections(
+        sources[:, None, None] * n_cell + block_pre[None, :, :],
+        targets[:, None, None] * n_cell + block_post[None, :, :],
+        weight, delay)
+
+
+def inhibition_to_slice(n_cell, n_N, lo_atom, hi_atom):
+    """ The (pre, post) pairs of the non-zero intra-cell and inter-cell
+        inhibition that target the neurons lo_atom to hi_atom inclusive,
+        expanded from the cell adjacency and the within-cell block pattern
+        without building the rest of the projection
+
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :param int lo_atom: The first target neuron
+    :param int hi_atom: The last target neuron
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+
+    .. note::
+        Neurons beyond the first 81 cells belong to further puzzles, each
+        of which only inhibits itself.
+    """
+    post = numpy.arange(lo_atom, hi_atom + 1)
+    cell = post // n_cell
+    puzzle_cell = cell % 81
+    digit_base = cell * n_cell + (post % n_cell) // n_N * n_N
+
+    # Other digits of the same cell
+    other = numpy.arange(n_cell - n_N)
+    skip = (digit_base - cell * n_cell)[:, None] <= other[None, :]
+    intra = cell[:, None] * n_cell + other[None, :] + skip * n_N
+
+    # Same digit of the cells in the same row, column or square; the
+    # adjacency is symmetric so the sources are the neighbours of the target
+    neighbours = numpy.nonzero(constraint_adjacency())[1].reshape(81, -1)
+    inter = (
+        (neighbours[puzzle_cell] - puzzle_cell[:, None])[:, :, None] *
+        n_cell +
+        digit_base[:, None, None] + numpy.arange(n_N)[None, None, :])
+
+    pre = numpy.concatenate(
+        [intra, inter.reshape(len(post), -1)], axis=1)
+    return pre.ravel(), numpy.repeat(post, pre.shape[1])
+
+
+def stim_connections(init, n_stim, n_cell, n_N, weight, delay):
+    """ The stimulation of the given digit in each cell of the puzzle that
+        has one: all the stimulation neurons of the cell to the n_N
+        neurons of the digit
+
+    :param init: The puzzle as a 9x9 grid, used as init[8 - y][x]
+    :param int n_stim: The number of stimulation neurons per cell
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :param float weight: The weight of the stimulation
+    :param float delay: The delay of the connections
+    :rtype: numpy.ndarray of CONNECTION_DTYPE
+    """
+    values = cell_values(init)
+    cells = numpy.nonzero(values)[0]
+    digit_bases = cells * n_cell + (values[cells] - 1) * n_N
+    return _to_connections(
+        cells[:, None, None] * n_stim + numpy.arange(n_stim)[None, :, None],
+        digit_bases[:, None, None] + numpy.arange(n_N)[None, None, :],
+        weight, delay)
+
+
+def offset_connections(connections, pre_offset, post_offset):
+    """ A copy of connections with offsets added to the pre and post ids,
+        e.g. to place them in a later puzzle of a batch
+
+    :param connections: The connections of CONNECTION_DTYPE
+    :param int pre_offset: The offset of the pre ids
+    :param int post_offset: The offset of the post ids
+    :rtype: numpy.ndarray of CONNECTION_DTYPE
+    """
+    connections = connections.copy()
+    connections["pre"] += pre_offset
+    connections["post"] += post_offset
+    return connections
+
+
+def packed_stim_connections(inits, n_stim, n_cell, n_N, weight, delay):
+    """ The stimulation of several puzzles packed one after the other, the
+        stimulation neurons and cells of puzzle k following those of k - 1
+
+    :param list inits: The puzzles, each a 9x9 grid used as init[8 - y][x]
+    :param int n_stim: The number of stimulation neurons per cell
+    :param int n_cell: The number of neurons in a cell
+    :param int n_N: The number of neurons per digit in a cell
+    :param float weight: The weight of the stimulation
+    :param float delay: The delay of the connections
+    :return: The connections, none if there are no puzzles
+    :rtype: numpy.ndarray of CONNECTION_DTYPE
+    """
+    return numpy.concatenate([numpy.empty(0, dtype=CONNECTION_DTYPE)] + [
+        offset_connections(
+            stim_connections(init, n_stim, n_cell, n_N, weight, delay),
+            puzzle * 81 * n_stim, puzzle * 81 * n_cell)
+        for puzzle, init in enumerate(inits)])
+
+
+def as_connection_list(connections):
+    """ Convert connections to the (n, 4) array of pre, post, weight, delay
+        expected by FromListConnector
+
+    :param connections: The connections of CONNECTION_DTYPE
+    :rtype: numpy.ndarray
+    """
+    return numpy.column_stack([
+        connections["pre"], connections["post"],
+        connections["weight"], connections["delay"]])
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector, AbstractGenerateConnectorOnHost)
+from sudoku.sudoku_connections import inhibition_to_slice
+
+
+class SudokuInhibitionConnector(
+        AbstractConnector, AbstractGenerateConnectorOnHost):
+    """ The inhibition of the Sudoku network from the cells onto
+        themselves, described as the cell adjacency (cells in the same row,
+        column or 3x3 square) crossed with the pattern within a cell, and
+        only expanded for the target slice being generated.
+
+        The zero weight squares of the within cell pattern are left out, so
+        every connection has the weight and delay of the synapse type.
+    """
+
+    __slots__ = ["__n_cell", "__n_N", "__n_puzzles"]
+
+    def __init__(self, n_cell, n_N, n_puzzles=1, safe=True, callback=None,
+                 verbose=False):
+        """
+        :param int n_cell: The number of neurons in a cell
+        :param int n_N: The number of neurons per digit in a cell
+        :param int n_puzzles:
+            The number of independent puzzles packed one after the other
+            in the population
+        """
+        super().__init__(safe, callback, verbose)
+        self.__n_cell = n_cell
+        self.__n_N = n_N
+        self.__n_puzzles = n_puzzles
+
+    @property
+    def _n_connections_per_neuron(self):
+        # All other digits in the cell, plus the same digit in 20 cells
+        return self.__n_cell - self.__n_N + 20 * self.__n_N
+
+    @property
+    def _n_connections(self):
+        return (self._n_connections_per_neuron * 81 * self.__n_cell *
+                self.__n_puzzles)
+
+    @overrides(AbstractConnector.get_delay_maximum)
+    def get_delay_maximum(self, synapse_info):
+        return self._get_delay_maximum(
+            synapse_info.delays, self._n_connections, synapse_info)
+
+    @overrides(AbstractConnector.get_delay_minimum)
+    def get_delay_minimum(self, synapse_info):
+        return self._get_delay_minimum(
+            synapse_info.delays, self._n_connections, synapse_info)
+
+    @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
+    def get_n_connections_from_pre_vertex_maximum(
+            self, n_post_atoms, synapse_info, min_delay=None,
+            max_delay=None):
+        n_connections = min(n_post_atoms, self._n_connections_per_neuron)
+        if min_delay is None or max_delay is None:
+            return n_connections
+        return self._get_n_connections_from_pre_vertex_with_delay_maximum(
+            synapse_info.delays, self._n_connections, n_connections,
+            min_delay, max_delay, synapse_info)
+
+    @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
+    def get_n_connections_to_post_vertex_maximum(self, synapse_info):
+        return self._n_connections_per_neuron
+
+    @overrides(AbstractConnector.get_weight_maximum)
+    def get_weight_maximum(self, synapse_info):
+        return self._get_weight_maximum(
+            synapse_info.weights, self._n_connections, synapse_info)
+
+    @overrides(AbstractGenerateConnectorOnHost.create_synaptic_block)
+    def create_synaptic_block(
+            self, post_slices, post_vertex_slice, synapse_type,
+            synapse_info):
+        sources, targets = inhibition_to_slice(
+            self.__n_cell, self.__n_N, post_vertex_slice.lo_atom,
+            post_vertex_slice.hi_atom)
+        n_connections = len(sources)
+        block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = sources
+        block["target"] = targets
+        block["weight"] = self._generate_weights(
+            block["source"], block["target"], n_connections,
+            post_vertex_slice, synapse_info)
+        block["delay"] = self._generate_delays(
+            block["source"], block["target"], n_connections,
+            post_vertex_slice, synapse_info)
+        block["synapse_type"] = synapse_type
+        return block
+
+    def __repr__(self):
+        return (
+            "SudokuInhibitionConnector(n_cell={}, n_N={}, n_puzzles={})"
+            .format(self.__n_cell, self.__n_N, self.__n_puzzles))
@@ -0,0 +1,104 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Construction of the Sudoku network for one or more puzzles.
+
+Each puzzle is an independent 9x9 network occupying consecutive slices of
+81 * n_cell neurons of the Cells and Noise populations and 81 * n_stim
+neurons of the Stim population.
+"""
+
+from collections import namedtuple
+from pyNN.random import RandomDistribution
+from sudoku.sudoku_connections import (
+    as_connection_list, packed_stim_connections)
+from sudoku.sudoku_connector import SudokuInhibitionConnector
+
+#: The parameters of the neurons of the cells
+CELL_PARAMS = {
+    'cm': 0.25,         # nF membrane capacitance
+    'i_offset': 0.5,    # nA    bias current
+    'tau_m': 20.0,      # ms    membrane time constant
+    'tau_refrac': 2.0,  # ms    refractory period
+    'tau_syn_E': 5.0,   # ms    excitatory synapse time constant
+    'tau_syn_I': 5.0,   # ms    inhibitory synapse time constant
+    'v_reset': -70.0,   # mV    reset membrane potential
+    'v_rest': -65.0,    # mV    rest membrane potential
+    'v_thresh': -50.0,  # mV    firing threshold voltage
+}
+
+#: The populations of a Sudoku network and their sizes
+SudokuNetwork = namedtuple("SudokuNetwork", [
+    "cells", "noise", "stim", "n_puzzles", "n_cell", "n_N", "n_stim"])
+
+
+def build_network(sim, inits, neurons_per_digit=5, weight_cell=0.2,
+                  weight_stim=1.0, weight_nois=1.4, delay=2.0, n_stim=30,
+                  spikes_per_second=200):
+    """ Create the populations and projections of a network solving each of
+        the given puzzles
+
+    :param sim: The simulator
+    :param list inits: The puzzles, each a 9x9 grid used as init[8-y][x]
+    :param int neurons_per_digit: The number of neurons per digit per cell
+    :param float weight_cell: The weight of the inhibition
+    :param float weight_stim: The weight of the stimulation of given digits
+    :param float weight_nois: The weight of the noise
+    :param float delay: The delay of the inhibition and stimulation
+    :param int n_stim: The number of stimulation neurons per cell
+    :param int spikes_per_second:
+        The expected maximum spike rate of the cells
+    :rtype: SudokuNetwork
+    """
+    n_puzzles = len(inits)
+    n_cell = 9 * neurons_per_digit   # total number of neurons in a cell
+    n_N = neurons_per_digit          # number of neurons per value in cell
+    n_total = n_cell * 81
+
+    print("Creating Populations...")
+    cells = sim.Population(
+        n_total * n_puzzles, sim.IF_curr_exp, CELL_PARAMS, label="Cells",
+        additional_parameters={"spikes_per_second": spikes_per_second})
+    cells.record("spikes")
+
+    print("Creating Noise Sources...")
+    noise = sim.Population(
+        n_total * n_puzzles, sim.SpikeSourcePoisson, {"rate": 20.0},
+        label="Noise")
+    sim.Projection(noise, cells, sim.OneToOneConnector(),
+                   synapse_type=sim.StaticSynapse(weight=weight_nois))
+
+    print("Setting up inhibition...")
+    sim.Projection(
+        cells, cells, SudokuInhibitionConnector(n_cell, n_N, n_puzzles),
+        synapse_type=sim.StaticSynapse(weight=weight_cell, delay=delay),
+        receptor_type="inhibitory")
+
+    print("Fixing initial numbers...")
+    connections_stim = packed_stim_connections(
+        inits, n_stim, n_cell, n_N, weight_stim, delay)
+    stim = None
+    if len(connections_stim) > 0:
+        stim = sim.Population(
+            n_stim * 81 * n_puzzles, sim.SpikeSourcePoisson, {"rate": 10.0},
+            label="Stim")
+        sim.Projection(
+            stim, cells,
+            sim.FromListConnector(as_connection_list(connections_stim)),
+            receptor_type="excitatory")
+
+    cells.initialize(v=RandomDistribution("uniform", [-65.0, -55.0]))
+    return SudokuNetwork(cells, noise, stim, n_puzzles, n_cell, n_N, n_stim)
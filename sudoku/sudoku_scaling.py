@@ -0,0 +1,187 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measure how the Sudoku network scales with the number of neurons per digit,
+e.g.::
+
+    python -m sudoku.sudoku_scaling --max-neurons-per-digit 20 --no-run
+
+For each size the inhibition is generated both as explicit lists and lazily
+per slice of the population, timing each and tracking its peak memory.
+Unless --no-run is given, the network is also built and run on the
+pyNN.spiNNaker backend, if there is one.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from sudoku.puzzles import PUZZLES
+from sudoku.sudoku_connections import (
+    as_connection_list, inhibition_to_slice, inter_cell_connections,
+    intra_cell_connections)
+
+
+def _measure(function, *args):
+    """ Time a function and track the peak memory it allocates
+
+    :return: The result, the time in seconds and the peak in bytes
+    :rtype: tuple
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def _explicit_lists(n_cell, n_N):
+    intra = intra_cell_connections(n_cell, n_N, 0.2, 2.0)
+    inter = inter_cell_connections(n_cell, n_N, 0.2, 2.0)
+    return as_connection_list(intra), as_connection_list(inter)
+
+
+def _lazy_slices(n_cell, n_N, neurons_per_core):
+    n_total = 81 * n_cell
+    n_connections = 0
+    for lo_atom in range(0, n_total, neurons_per_core):
+        hi_atom = min(lo_atom + neurons_per_core, n_total) - 1
+        pre, _post = inhibition_to_slice(n_cell, n_N, lo_atom, hi_atom)
+        n_connections += len(pre)
+    return n_connections
+
+
+def generation_metrics(neurons_per_digit, neurons_per_core=200):
+    """ Measure the generation of the inhibition of one puzzle
+
+    :param int neurons_per_digit: The number of neurons per digit
+    :param int neurons_per_core: The size of the slices generated lazily
+    :rtype: dict
+    """
+    n_cell = 9 * neurons_per_digit
+    n_N = neurons_per_digit
+    (intra, inter), explicit_time, explicit_peak = _measure(
+        _explicit_lists, n_cell, n_N)
+    n_lazy, lazy_time, lazy_peak = _measure(
+        _lazy_slices, n_cell, n_N, neurons_per_core)
+    return {
+        "neurons_per_digit": neurons_per_digit,
+        "n_cell": n_cell,
+        "n_N": n_N,
+        "n_total": 81 * n_cell,
+        "n_intra_cell": len(intra),
+        "n_inter_cell": len(inter),
+        "explicit_time": explicit_time,
+        "explicit_peak_bytes": explicit_peak,
+        "explicit_list_bytes": intra.nbytes + inter.nbytes,
+        "n_lazy": n_lazy,
+        "lazy_time": lazy_time,
+        "lazy_peak_bytes": lazy_peak}
+
+
+def run_metrics(neurons_per_digit, puzzle, run_time, chunk_time, ms_per_bin,
+                stable_bins):
+    """ Build and run the network of one puzzle on the backend
+
+    :param int neurons_per_digit: The number of neurons per digit
+    :param puzzle: The puzzle as a 9x9 grid
+    :param float run_time: The longest time to run for in ms
+    :param float chunk_time: The time run between checks for a solution
+    :param float ms_per_bin: The length of the bins used to decode the board
+    :param int stable_bins: The number of bins the board must be stable for
+    :rtype: dict
+    """
+    # The backend is optional, so only needed here
+    # pylint: disable=import-outside-toplevel
+    import pyNN.spiNNaker as sim
+    from spynnaker.pyNN.data import SpynnakerDataView
+    from sudoku.convergence import run_until_solved
+    from sudoku.sudoku_network import build_network
+
+    sim.setup(timestep=1.0)
+    try:
+        sim.set_number_of_neurons_per_core(sim.IF_curr_exp, 200)
+        start = time.perf_counter()
+        network = build_network(sim, [puzzle], neurons_per_digit)
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        result = run_until_solved(
+            sim, network.cells, network.n_N, puzzle, run_time, chunk_time,
+            ms_per_bin, stable_bins)
+        run_wall_time = time.perf_counter() - start
+        n_cores = SpynnakerDataView.get_n_placements()
+    finally:
+        sim.end()
+    return {
+        "network_build_time": build_time,
+        "run_wall_time": run_wall_time,
+        "n_cores": n_cores,
+        "solved": bool(result.solved),
+        "time_to_solution": result.time_to_solution,
+        "simulated_time": result.run_time}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--min-neurons-per-digit", type=int, default=1)
+    parser.add_argument("--max-neurons-per-digit", type=int, default=20)
+    parser.add_argument("--neurons-per-core", type=int, default=200)
+    parser.add_argument("--puzzle", type=int, default=6,
+                        choices=sorted(PUZZLES))
+    parser.add_argument("--max-time", type=float, default=20000)
+    parser.add_argument("--chunk-time", type=float, default=1000)
+    parser.add_argument("--ms-per-bin", type=float, default=100)
+    parser.add_argument("--stable-bins", type=int, default=10)
+    parser.add_argument("--no-run", action="store_true",
+                        help="only measure the generation of connections")
+    parser.add_argument("--output", default="sudoku_scaling.json")
+    args = parser.parse_args(argv)
+
+    results = list()
+    can_run = not args.no_run
+    for neurons_per_digit in range(
+            args.min_neurons_per_digit, args.max_neurons_per_digit + 1):
+        record = generation_metrics(neurons_per_digit, args.neurons_per_core)
+        record["run"] = None
+        if can_run:
+            try:
+                record["run"] = run_metrics(
+                    neurons_per_digit, PUZZLES[args.puzzle], args.max_time,
+                    args.chunk_time, args.ms_per_bin, args.stable_bins)
+            except ImportError as ex:
+                print("Not running: {}".format(ex))
+                can_run = False
+            except Exception as ex:  # pylint: disable=broad-except
+                # Kept with the point, so that the other sizes still run
+                record["run"] = {
+                    "error": "{}: {}".format(type(ex).__name__, ex)}
+                print("Run failed: {}".format(record["run"]["error"]))
+        results.append(record)
+        print("{neurons_per_digit:3d} neurons per digit: "
+              "{n_intra_cell} + {n_inter_cell} connections, "
+              "explicit {explicit_time:.3f} s / {explicit_peak_bytes} B, "
+              "lazy {lazy_time:.3f} s / {lazy_peak_bytes} B".format(**record))
+        # Written after every size, so that the sizes done are kept if a
+        # later one is interrupted
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"parameters": vars(args), "results": results}, f,
+                      indent=2)
+
+
+if __name__ == "__main__":
+    main()
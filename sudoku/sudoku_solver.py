@@ -0,0 +1,111 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+An exact Sudoku solver, used as the ground truth for the network.
+
+The puzzle is solved as an exact cover problem with Knuth's Algorithm X,
+using dictionaries of sets in place of the dancing links.  The number of
+search nodes visited is a measure of the difficulty of the puzzle.
+"""
+
+from collections import namedtuple
+import numpy
+
+#: The solution of a puzzle (None if there is none), the number of
+#: solutions found (at most 2) and the number of search nodes visited
+SolverResult = namedtuple(
+    "SolverResult", ["solution", "n_solutions", "n_nodes"])
+
+
+def _constraints(row, col, digit):
+    box = (row // 3) * 3 + col // 3
+    return [("cell", row, col), ("row", row, digit), ("col", col, digit),
+            ("box", box, digit)]
+
+
+def _select(columns, rows, choice):
+    removed = list()
+    for column in rows[choice]:
+        for other in columns[column]:
+            for other_column in rows[other]:
+                if other_column != column:
+                    columns[other_column].remove(other)
+        removed.append(columns.pop(column))
+    return removed
+
+
+def _deselect(columns, rows, choice, removed):
+    for column in reversed(rows[choice]):
+        columns[column] = removed.pop()
+        for other in columns[column]:
+            for other_column in rows[other]:
+                if other_column != column:
+                    columns[other_column].add(other)
+
+
+def _search(columns, rows, partial, solutions, max_solutions, n_nodes):
+    n_nodes[0] += 1
+    if not columns:
+        solutions.append(list(partial))
+        return
+    column = min(columns, key=lambda c: len(columns[c]))
+    for choice in list(columns[column]):
+        partial.append(choice)
+        removed = _select(columns, rows, choice)
+        _search(columns, rows, partial, solutions, max_solutions, n_nodes)
+        _deselect(columns, rows, choice, removed)
+        partial.pop()
+        if len(solutions) >= max_solutions:
+            return
+
+
+def solve(init, max_solutions=2):
+    """ Solve a puzzle exactly
+
+    :param init: The puzzle as a 9x9 grid, with 0 for cells not given
+    :param int max_solutions:
+        The number of solutions to stop at; 2 is enough to tell if the
+        solution is unique
+    :rtype: SolverResult
+    """
+    rows = {
+        (row, col, digit): _constraints(row, col, digit)
+        for row in range(9) for col in range(9) for digit in range(1, 10)}
+    columns = dict()
+    for choice, choice_columns in rows.items():
+        for column in choice_columns:
+            columns.setdefault(column, set()).add(choice)
+
+    givens = list()
+    for row, values in enumerate(init):
+        for col, digit in enumerate(values):
+            if digit:
+                choice = (row, col, int(digit))
+                if any(column not in columns for column in rows[choice]):
+                    # The given digits conflict with each other
+                    return SolverResult(None, 0, 0)
+                _select(columns, rows, choice)
+                givens.append(choice)
+
+    solutions = list()
+    n_nodes = [0]
+    _search(columns, rows, givens, solutions, max_solutions, n_nodes)
+    solution = None
+    if solutions:
+        solution = numpy.zeros((9, 9), dtype="int64")
+        for row, col, digit in solutions[0]:
+            solution[row, col] = digit
+    return SolverResult(solution, len(solutions), n_nodes[0])
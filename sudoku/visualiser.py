@@ -0,0 +1,141 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Supervision of an external visualiser process.
+"""
+
+from collections import deque
+import subprocess
+import threading
+
+#: The longest line read from the visualiser at once; longer lines are split
+MAX_LINE_LENGTH = 4096
+
+
+class VisualiserSupervisor(object):
+    """ Runs an external visualiser, draining its output in a background
+        thread into a bounded log so that it can never block on a full pipe,
+        and noting when it exits
+    """
+
+    __slots__ = [
+        "__args", "__log", "__n_lines", "__echo", "__on_exit", "__process",
+        "__thread", "__exited"]
+
+    def __init__(self, args, max_lines=1000, echo=False, on_exit=None):
+        """
+        :param list(str) args: The command line of the visualiser
+        :param int max_lines: The number of lines of output to keep
+        :param bool echo: Whether to print each line of output
+        :param callable(int) on_exit:
+            Called with the exit code from the background thread when the
+            visualiser exits
+        """
+        self.__args = list(args)
+        self.__log = deque(maxlen=max_lines)
+        self.__n_lines = 0
+        self.__echo = echo
+        self.__on_exit = on_exit
+        self.__process = None
+        self.__thread = None
+        self.__exited = threading.Event()
+
+    def start(self):
+        """ Start the visualiser
+
+        :return: self
+        :raises OSError: If the visualiser cannot be started
+        """
+        self.__process = subprocess.Popen(
+            args=self.__args, stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self.__thread = threading.Thread(
+            target=self.__pump, name="Visualiser output", daemon=True)
+        self.__thread.start()
+        return self
+
+    def __pump(self):
+        with self.__process.stdout as output:
+            for line in iter(
+                    lambda: output.readline(MAX_LINE_LENGTH), b""):
+                text = line.decode(errors="replace").rstrip("\r\n")
+                self.__log.append(text)
+                self.__n_lines += 1
+                if self.__echo:
+                    print(text)
+        returncode = self.__process.wait()
+        self.__exited.set()
+        if self.__on_exit is not None:
+            self.__on_exit(returncode)
+
+    @property
+    def log(self):
+        """ The last lines of output of the visualiser
+
+        :rtype: list(str)
+        """
+        return list(self.__log)
+
+    @property
+    def n_lines(self):
+        """ The number of lines of output read so far
+
+        :rtype: int
+        """
+        return self.__n_lines
+
+    @property
+    def exited(self):
+        """ Whether the visualiser has exited and all its output been read
+
+        :rtype: bool
+        """
+        return self.__exited.is_set()
+
+    @property
+    def returncode(self):
+        """ The exit code of the visualiser, or None if still running
+
+        :rtype: int or None
+        """
+        if not self.exited:
+            return None
+        return self.__process.returncode
+
+    def wait(self, timeout=None):
+        """ Wait for the visualiser to exit
+
+        :param float timeout: The longest time to wait in seconds
+        :return: Whether the visualiser has exited
+        :rtype: bool
+        """
+        return self.__exited.wait(timeout)
+
+    def stop(self, timeout=5.0):
+        """ Stop the visualiser if it is still running, killing it if it
+            does not exit within the timeout after being asked to
+
+        :param float timeout: The time to wait for it to exit in seconds
+        """
+        if self.__process is None:
+            return
+        if self.__process.poll() is None:
+            self.__process.terminate()
+            try:
+                self.__process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.__process.kill()
+        self.__thread.join(timeout)
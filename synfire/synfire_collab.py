@@ -18,7 +18,8 @@ Synfire chain example
 """
 import matplotlib.pyplot as plt
 import pyNN.spiNNaker as sim
-from spynnaker.pyNN.utilities import neo_convertor
+from spike_data.columns import SpikeColumns
+from spike_data.raster import show_raster
 
 # number of neurons in each population
 n_neurons = 100
@@ -51,12 +52,10 @@ sim.Projection(stimulus, chain_pops[0], sim.AllToAllConnector(),
                synapse_type=sim.StaticSynapse(weight=5.0))
 
 sim.run(simtime)
-# None PyNN method which is faster
-# spikes = [pop.spinnaker_get_data("spikes") for pop in chain_pops]
 
-# Pynn method and support method
-neos = [pop.get_data("spikes") for pop in chain_pops]
-spikes = map(neo_convertor.convert_spikes, neos)
+# Read the spikes straight into columns; pop.get_data("spikes") gives them
+# as Neo objects instead
+spikes = SpikeColumns.from_populations(chain_pops)
 
 sim.end()
 
@@ -66,15 +65,11 @@ try:
     plt.xlabel('Time (ms)')
     plt.ylabel('Neuron')
     plt.title('Spikes Sent By Chain')
-    offset = 0
-    for pop_spikes in spikes:
-        plt.plot(
-            [i[1] for i in pop_spikes],
-            [i[0] + offset for i in pop_spikes], "."
-        )
-        offset += n_neurons
+    # Each population in its own colour, drawn as one image however many
+    # spikes there are
+    show_raster(plt.gca(), spikes, t_stop=simtime)
     plt.show()
     # pylab.savefig("results.png")
 except Exception as ex:
-    print(spikes)
+    print(spikes.as_array())
     raise ex
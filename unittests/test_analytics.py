@@ -0,0 +1,59 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from balanced_random.analytics import phase_statistics, window_statistics
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def test_synchronous(self):
+        # Every neuron fires every 20 ms at the same time
+        times = numpy.tile(numpy.arange(0.0, 1000.0, 20.0), 10)
+        ids = numpy.repeat(numpy.arange(10), 50)
+        stats = window_statistics(ids, times, 10, 0, 1000)
+        numpy.testing.assert_allclose(stats.rates, 50.0)
+        numpy.testing.assert_allclose(stats.cv_isi, 0.0, atol=1e-9)
+        numpy.testing.assert_allclose(stats.fano_factor, 0.0, atol=1e-9)
+        self.assertAlmostEqual(stats.correlation, 1.0)
+        self.assertAlmostEqual(stats.synchrony, 1.0)
+
+    def test_poisson(self):
+        rng = numpy.random.RandomState(1)
+        n_neurons = 1000
+        ids = rng.randint(n_neurons, size=200000)
+        times = rng.uniform(0, 2000, size=len(ids))
+        first, second = phase_statistics(
+            numpy.column_stack((ids, times)), n_neurons, [(1000, 0.0),
+                                                          (1000, 5.0)])
+        self.assertEqual((second.start, second.end), (1000, 2000))
+        self.assertAlmostEqual(first.mean_rate, 100.0, delta=1.0)
+        self.assertAlmostEqual(numpy.nanmean(first.cv_isi), 1.0, delta=0.1)
+        self.assertAlmostEqual(
+            numpy.nanmean(first.fano_factor), 1.0, delta=0.15)
+        self.assertAlmostEqual(first.correlation, 0.0, delta=0.01)
+        self.assertLess(first.synchrony, 0.1)
+
+    def test_silent(self):
+        stats = window_statistics(
+            numpy.zeros(0), numpy.zeros(0), 5, 0, 1000)
+        self.assertEqual(stats.mean_rate, 0.0)
+        self.assertTrue(numpy.all(numpy.isnan(stats.cv_isi)))
+        self.assertTrue(numpy.isnan(stats.correlation))
+
+
+if __name__ == '__main__':
+    unittest.main()
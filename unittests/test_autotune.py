@@ -0,0 +1,107 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+from benchmarks.autotune import (
+    CostModel, NetworkProfile, PartitionConfig, autotune, candidate_configs,
+    evaluate, profile_network, search)
+
+
+def _profile(rate=10.0, max_delay_steps=1):
+    populations = [
+        {"label": "stim", "size": 200, "model": "SpikeSourcePoisson",
+         "splitter": None, "rate": 1000.0},
+        {"label": "exc", "size": 200, "model": "IF_curr_exp",
+         "splitter": None, "rate": rate}]
+    projections = [
+        {"pre": 0, "post": 1, "connector": "OneToOneConnector",
+         "n_connections": 200, "max_delay_steps": 1},
+        {"pre": 1, "post": 1, "connector": "FixedProbabilityConnector",
+         "n_connections": 4000, "max_delay_steps": max_delay_steps}]
+    return NetworkProfile(populations, projections, 0.1)
+
+
+def _builder(sim, splitters):
+    stim = sim.Population(20, sim.SpikeSourcePoisson(rate=100.0))
+    pop = sim.Population(20, sim.IF_curr_exp, label="pop")
+    sim.Projection(stim, pop, sim.OneToOneConnector(),
+                   sim.StaticSynapse(weight=5.0, delay=2.0))
+    return pop
+
+
+class TestAutotune(unittest.TestCase):
+
+    def test_more_neurons_per_core_fewer_cores(self):
+        profile = _profile()
+        small = evaluate(profile, PartitionConfig(32, 0, None, True))
+        large = evaluate(profile, PartitionConfig(128, 0, None, True))
+        self.assertEqual(small.n_cores, 7 + 7)
+        self.assertEqual(large.n_cores, 2 + 2)
+        self.assertGreater(large.max_load_us, small.max_load_us)
+
+    def test_overrun(self):
+        profile = _profile()
+        config = PartitionConfig(256, 0, None, True)
+        self.assertTrue(
+            evaluate(profile, config, time_scale_factor=10).feasible)
+        estimate = evaluate(profile, config, time_scale_factor=1)
+        self.assertFalse(estimate.feasible)
+        self.assertIn("overrun", estimate.reason)
+        self.assertFalse(evaluate(
+            profile, PartitionConfig(512, 0, None, True)).feasible)
+
+    def test_split_delegates_poisson(self):
+        profile = _profile()
+        estimate = evaluate(profile, PartitionConfig(100, 1, 16, False))
+        # Two slices of a neuron and a synapse core; the source is on them
+        self.assertEqual(estimate.n_cores, 4)
+
+    def test_delays(self):
+        profile = _profile(max_delay_steps=40)
+        self.assertFalse(evaluate(
+            profile, PartitionConfig(100, 1, 16, False)).feasible)
+        extended = evaluate(profile, PartitionConfig(100, 1, 16, True))
+        self.assertTrue(extended.feasible)
+        self.assertEqual(extended.n_cores, 4 + 2)
+        self.assertEqual(evaluate(
+            profile, PartitionConfig(100, 1, 64, False)).n_cores, 4)
+
+    def test_search(self):
+        estimates = search(_profile(), candidate_configs())
+        best = estimates[0]
+        self.assertTrue(best.feasible)
+        feasible = [e.n_cores for e in estimates if e.feasible]
+        self.assertEqual(best.n_cores, min(feasible))
+        self.assertFalse(estimates[-1].feasible)
+
+    def test_profile(self):
+        profile = profile_network(_builder, 1.0, calibration_time=1000)
+        stim, pop = profile.populations
+        self.assertAlmostEqual(stim["rate"], 100.0, delta=15.0)
+        self.assertGreater(pop["rate"], 0.0)
+        self.assertEqual(profile.projections[0]["n_connections"], 20)
+        self.assertEqual(profile.projections[0]["max_delay_steps"], 2)
+        assumed = profile_network(_builder, 1.0)
+        self.assertEqual(assumed.populations[0]["rate"], 100.0)
+        self.assertEqual(assumed.populations[1]["rate"], 10.0)
+
+    def test_autotune(self):
+        result = autotune(_builder, 1.0, cost=CostModel(input_buffer=64))
+        self.assertEqual(result.best, result.estimates[0].config)
+        self.assertEqual(result.calibrations, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
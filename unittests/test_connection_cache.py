@@ -0,0 +1,71 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import numpy
+from pyNN.random import NumpyRNG, RandomDistribution
+from balanced_random.connection_cache import ConnectionCache
+
+
+class TestConnectionCache(unittest.TestCase):
+
+    def _connections(self, cache, seed=0, p_connect=0.1):
+        rng = NumpyRNG(seed)
+        weights = RandomDistribution(
+            "normal_clipped", mu=0.1, sigma=0.1, low=0, high=numpy.inf,
+            rng=rng)
+        connections = cache.random_connections(
+            100, 80, p_connect, weights, 1.0, rng)
+        return connections, rng.next(3)
+
+    def test_hit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ConnectionCache(directory)
+            generated, after_generated = self._connections(cache)
+            found, after_found = self._connections(cache)
+            self.assertEqual((cache.n_misses, cache.n_hits), (1, 1))
+            self.assertIsInstance(found, numpy.memmap)
+            numpy.testing.assert_array_equal(generated, found)
+            # The RNG carries on as if the connections were generated
+            numpy.testing.assert_array_equal(after_generated, after_found)
+            self.assertTrue(numpy.all(found[:, 2] >= 0))
+            numpy.testing.assert_array_equal(found[:, 3], 1.0)
+
+    def test_miss(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ConnectionCache(directory)
+            self._connections(cache)
+            self._connections(cache, seed=1)
+            self._connections(cache, p_connect=0.2)
+            self.assertEqual((cache.n_misses, cache.n_hits), (3, 0))
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ConnectionCache(directory)
+            self._connections(cache)
+            self._connections(cache, seed=1)
+            names = sorted(os.listdir(directory))
+            # Every list has its state, and nothing is left half written
+            self.assertEqual(len(names), 4)
+            for name in names[::2]:
+                self.assertTrue(name.endswith(".npy"))
+            for lists, state in zip(names[::2], names[1::2]):
+                self.assertEqual(state, lists[:-4] + ".rng.npz")
+
+
+if __name__ == '__main__':
+    unittest.main()
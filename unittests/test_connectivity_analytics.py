@@ -0,0 +1,101 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from learning.connectivity_analytics import (
+    ConnectivityTracker, distance_multiplicity)
+from learning.struct_pl_offline import (
+    STRUCT_PL, simulate_rewiring, squared_distances)
+
+PARAMETERS = STRUCT_PL._replace(
+    s_max=8, sigma_form_forward=2.0, p_form_forward=1.0,
+    prob_elim_potentiated=0.05)
+
+
+class TestConnectivityAnalytics(unittest.TestCase):
+
+    def setUp(self):
+        self.result = simulate_rewiring(
+            PARAMETERS, 100, 100, 5000.0, connections=[[0, 1], [2, 3]],
+            seed=5)
+
+    def _check_state(self, tracker):
+        pre, post = self.result.connections[:, :2].T.astype("int64")
+        fan_in = numpy.bincount(post, minlength=100)
+        numpy.testing.assert_array_equal(tracker.fan_in, fan_in)
+        numpy.testing.assert_array_equal(
+            tracker.fan_in_counts, numpy.bincount(fan_in, minlength=9))
+        squared = squared_distances(pre, post, (10, 10))
+        numpy.testing.assert_array_equal(
+            tracker.distance_counts,
+            numpy.bincount(squared, minlength=len(tracker.distance_counts)))
+        state = tracker.history[-1]
+        self.assertEqual(state.n_connections, len(pre))
+        self.assertAlmostEqual(state.fraction_full, numpy.mean(fan_in == 8))
+        self.assertAlmostEqual(state.mean_distance,
+                               numpy.sqrt(squared).mean())
+
+    def test_events(self):
+        tracker = ConnectivityTracker(
+            PARAMETERS, 100, interval=500.0, connections=[[0, 1], [2, 3]])
+        events = self.result.events
+        for first in range(0, len(events.times), 37):
+            batch = slice(first, first + 37)
+            tracker.apply(events.times[batch], events.pre[batch],
+                          events.post[batch], events.formed[batch])
+        self._check_state(tracker)
+        starts, formed, eliminated = tracker.intervals()
+        numpy.testing.assert_array_equal(starts, numpy.arange(10) * 500.0)
+        self.assertEqual(formed.sum(), events.formed.sum())
+        self.assertEqual(eliminated.sum(), (~events.formed).sum())
+        self.assertGreater(eliminated.sum(), 0)
+        self.assertEqual(
+            tracker.formed_distance_counts.sum(), events.formed.sum())
+
+    def test_snapshots(self):
+        tracker = ConnectivityTracker(PARAMETERS, 100, interval=1000.0)
+        tracker.update_connections(0.0, [0, 2], [1, 3], count=False)
+        events = self.result.events
+        connected = {(0, 1), (2, 3)}
+        for end in range(1000, 6000, 1000):
+            selected = (events.times >= end - 1000) & (events.times < end)
+            for p, q, formed in zip(events.pre[selected],
+                                    events.post[selected],
+                                    events.formed[selected]):
+                if formed:
+                    connected.add((p, q))
+                else:
+                    connected.discard((p, q))
+            pre, post = numpy.array(sorted(connected)).T
+            tracker.update_connections(end, pre, post)
+        self._check_state(tracker)
+        self.assertEqual(len(tracker.history), 6)
+
+    def test_fitted_sigma(self):
+        parameters = PARAMETERS._replace(
+            s_max=64, prob_elim_potentiated=0.0)
+        result = simulate_rewiring(parameters, 400, 400, 20000.0, seed=0)
+        tracker = ConnectivityTracker(parameters, 400)
+        events = result.events
+        tracker.apply(events.times, events.pre, events.post, events.formed)
+        self.assertAlmostEqual(tracker.fitted_sigma(), 2.0, delta=0.3)
+        expected = tracker.expected_formed_distances(1.0, 2.0)
+        self.assertAlmostEqual(expected.sum(), 1.0)
+        self.assertEqual(len(expected), len(distance_multiplicity((20, 20))))
+
+
+if __name__ == '__main__':
+    unittest.main()
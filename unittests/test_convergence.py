@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+import local_engine.spinnaker as sim
+from sudoku.convergence import ConvergenceMonitor, run_until_solved
+from sudoku.puzzles import PUZZLES
+from sudoku.sudoku_board import binned_spike_counts, counts_to_board
+from sudoku.sudoku_connections import cell_values
+from sudoku.sudoku_solver import solve
+
+INIT = PUZZLES[1]
+SOLUTION = solve(INIT).solution
+
+
+def _winners(board, n_N):
+    """ The first neuron of the digit of each cell of a board
+    """
+    return numpy.arange(81) * 9 * n_N + (cell_values(board) - 1) * n_N
+
+
+class TestConvergence(unittest.TestCase):
+
+    def test_decode_bins(self):
+        n_N = 3
+        other = SOLUTION.copy()
+        other[0, 0], other[0, 1] = other[0, 1], other[0, 0]
+        # The solution in the first bin and the other board in the second
+        ids = numpy.concatenate((
+            _winners(SOLUTION, n_N), _winners(other, n_N) + 1))
+        times = numpy.repeat([50.0, 150.0], 81)
+        counts = binned_spike_counts(ids, times, n_N, 0.0, 300.0, 100.0)
+        self.assertEqual(counts.shape, (3, 81, 9))
+        self.assertEqual(counts.sum(), 162)
+        boards = counts_to_board(counts)
+        numpy.testing.assert_array_equal(boards[0], SOLUTION)
+        numpy.testing.assert_array_equal(boards[1], other)
+        numpy.testing.assert_array_equal(boards[2], numpy.zeros((9, 9)))
+
+    def test_stable_bins(self):
+        monitor = ConvergenceMonitor(INIT, 3, SOLUTION)
+        blank = numpy.zeros((9, 9), dtype=int)
+        self.assertFalse(monitor.add_board(100.0, SOLUTION))
+        self.assertFalse(monitor.add_board(200.0, SOLUTION))
+        # An invalid board resets the count
+        self.assertFalse(monitor.add_board(300.0, blank))
+        self.assertFalse(monitor.add_board(400.0, SOLUTION))
+        self.assertFalse(monitor.add_board(500.0, SOLUTION))
+        self.assertIsNone(monitor.time_to_solution)
+        self.assertTrue(monitor.add_board(600.0, SOLUTION))
+        self.assertEqual(monitor.time_to_solution, 400.0)
+        self.assertEqual(monitor.first_valid_time, 100.0)
+        self.assertEqual(monitor.first_correct_time, 100.0)
+
+    def test_inconsistent(self):
+        # A valid board with other digits than those given is not a solution
+        relabelled = SOLUTION % 9 + 1
+        monitor = ConvergenceMonitor(INIT, 1)
+        self.assertFalse(monitor.add_board(100.0, relabelled))
+        self.assertIsNone(monitor.first_valid_time)
+        self.assertTrue(monitor.add_board(200.0, SOLUTION))
+        self.assertEqual(monitor.time_to_solution, 200.0)
+
+    def test_run_until_solved(self):
+        n_N = 2
+        spike_times = [[] for _ in range(81 * 9 * n_N)]
+        # Digit 1 everywhere until 300 ms, then the solution
+        for neuron in numpy.arange(81) * 9 * n_N:
+            spike_times[neuron] = list(numpy.arange(5.0, 300.0, 10.0))
+        for neuron in _winners(SOLUTION, n_N):
+            spike_times[neuron] = spike_times[neuron] + list(
+                numpy.arange(305.0, 2000.0, 10.0))
+        sim.setup(timestep=1.0)
+        cells = sim.Population(
+            len(spike_times), sim.SpikeSourceArray(spike_times=spike_times))
+        cells.record("spikes")
+        result = run_until_solved(
+            sim, cells, n_N, INIT, 2000.0, chunk_time=200.0,
+            ms_per_bin=100.0, stable_bins=4)
+        # Every chunk is cleared once it is read, the last one included
+        remaining = cells.spinnaker_get_data("spikes")
+        sim.end()
+        self.assertTrue(result.solved)
+        self.assertEqual(result.time_to_solution, 400.0)
+        self.assertEqual(result.run_time, 800.0)
+        numpy.testing.assert_array_equal(result.board, SOLUTION)
+        self.assertEqual(result.n_spikes, 81 * 30 + 81 * 50)
+        self.assertEqual(len(remaining), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
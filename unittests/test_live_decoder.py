@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import time
+import unittest
+import numpy
+from sudoku.live_decoder import (
+    LiveSudokuDecoder, parse_spike_packet, replay_spikes, spike_packets)
+from sudoku.sudoku_connections import cell_values
+
+SOLUTION = [[8, 1, 2,  7, 5, 3,  6, 4, 9],
+            [9, 4, 3,  6, 8, 2,  1, 7, 5],
+            [6, 7, 5,  4, 9, 1,  2, 8, 3],
+
+            [1, 5, 4,  2, 3, 7,  8, 9, 6],
+            [3, 6, 9,  8, 4, 5,  7, 2, 1],
+            [2, 8, 7,  1, 6, 9,  5, 3, 4],
+
+            [5, 2, 1,  9, 7, 4,  3, 6, 8],
+            [4, 3, 8,  5, 2, 6,  9, 1, 7],
+            [7, 9, 6,  3, 1, 8,  4, 5, 2]]
+
+
+def _synthetic_spikes(board, n_N, run_time, rate, rng):
+    """ Spikes where the neurons of the digit of the board in each cell fire
+        at rate Hz and the other neurons fire at a tenth of that
+    """
+    n_cell = 9 * n_N
+    ids = numpy.arange(81 * n_cell)
+    digits = (ids % n_cell) // n_N + 1
+    winner = digits == cell_values(board)[ids // n_cell]
+    rates = numpy.where(winner, rate, rate / 10.0)
+    spiking = rng.random((run_time, len(ids))) < rates / 1000.0
+    times, spike_ids = numpy.nonzero(spiking)
+    return times, spike_ids
+
+
+class TestLiveDecoder(unittest.TestCase):
+
+    def test_packet_round_trip(self):
+        times = numpy.array([5, 5, 7, 7, 7])
+        keys = numpy.array([1, 2, 3, 0x10000, 4])
+        parsed = [parse_spike_packet(data)
+                  for _, data in spike_packets(times, keys)]
+        self.assertEqual(len(parsed), 2)
+        numpy.testing.assert_array_equal(
+            numpy.concatenate([t for t, _ in parsed]), times)
+        numpy.testing.assert_array_equal(
+            numpy.concatenate([k for _, k in parsed]), keys)
+
+    def test_payload_packet(self):
+        # KEY_PAYLOAD_16 with an upper half-word prefix
+        data = bytes([2, 0x80 | 0x40 | 0x10 | (1 << 2)]) + (
+            numpy.array([0x11], dtype="<u2").tobytes() +
+            numpy.array([4, 10, 5, 11], dtype="<u2").tobytes())
+        times, keys = parse_spike_packet(data)
+        numpy.testing.assert_array_equal(times, [10, 11])
+        numpy.testing.assert_array_equal(keys, [0x110004, 0x110005])
+
+    def test_key_map(self):
+        boards = list()
+        decoder = LiveSudokuDecoder(
+            9, ms_per_bin=10, on_board=lambda t, b: boards.append(b))
+        decoder.set_key_map({0x8000 + i: i for i in range(81 * 9)})
+        decoder.add_spikes(
+            numpy.zeros(81, dtype="uint32"),
+            0x8000 + numpy.arange(81) * 9 + cell_values(SOLUTION) - 1)
+        decoder.add_spikes(numpy.array([1]), numpy.array([12]))
+        decoder.finish()
+        numpy.testing.assert_array_equal(boards[0], SOLUTION)
+        self.assertEqual(decoder.spikes.n_written, 81)
+
+    def test_replay(self):
+        n_N = 5
+        run_time = 1000
+        rng = numpy.random.default_rng(0)
+        times, ids = _synthetic_spikes(SOLUTION, n_N, run_time, 200.0, rng)
+        boards = dict()
+        decoder = LiveSudokuDecoder(
+            9 * n_N, ms_per_bin=100,
+            on_board=lambda t, b: boards.__setitem__(t, b.copy()))
+        port = decoder.start(0, "127.0.0.1")
+        try:
+            asyncio.run(replay_spikes(times, ids, port, time_scale=1.0))
+            timeout = time.time() + 5.0
+            while (decoder.spikes.n_written < len(times) and
+                    time.time() < timeout):
+                time.sleep(0.01)
+        finally:
+            decoder.stop()
+        self.assertEqual(decoder.spikes.n_written, len(times))
+        self.assertEqual(decoder.n_bad_packets, 0)
+        self.assertEqual(sorted(boards), list(range(100, run_time, 100)))
+        for board in boards.values():
+            numpy.testing.assert_array_equal(board, SOLUTION)
+
+    def test_start_error(self):
+        decoder = LiveSudokuDecoder(45, ms_per_bin=100)
+        port = decoder.start(0, "127.0.0.1")
+        try:
+            # The port is taken, so the second decoder cannot listen on it
+            with self.assertRaises(OSError):
+                LiveSudokuDecoder(45, ms_per_bin=100).start(port, "127.0.0.1")
+        finally:
+            decoder.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
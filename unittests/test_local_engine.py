@@ -0,0 +1,158 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from pyNN.random import NumpyRNG
+import local_engine.spinnaker as sim
+from balanced_random.balanced_network import (
+    build_network, rate_schedule, run_phases)
+
+
+class TestLocalEngine(unittest.TestCase):
+
+    def setUp(self):
+        sim.setup(timestep=1.0)
+
+    def tearDown(self):
+        sim.end()
+
+    def _first_input(self, delays, run_times):
+        source = sim.Population(1, sim.SpikeSourceArray(spike_times=[0]))
+        target = sim.Population(len(delays), sim.IF_curr_exp(tau_syn_E=1.0))
+        sim.Projection(source, target, sim.FromListConnector(
+            [(0, i, 0.1, delay) for i, delay in enumerate(delays)]))
+        target.record("v")
+        for run_time in run_times:
+            sim.run(run_time)
+            target.set(i_offset=0.0)
+        v = target.get_data("v").segments[0].filter(name="v")[0]
+        return numpy.argmax(v.magnitude > -65.0, axis=0)
+
+    def test_delays(self):
+        numpy.testing.assert_array_equal(
+            self._first_input([1, 4, 17], [30]), [2, 5, 18])
+
+    def test_input_kept_between_runs(self):
+        numpy.testing.assert_array_equal(
+            self._first_input([1, 4, 17], [3, 7, 20]), [2, 5, 18])
+
+    def test_constant_current(self):
+        pop = sim.Population(1, sim.IF_curr_exp, {
+            "i_offset": 1.0, "tau_refrac": 0.0})
+        pop.record("spikes")
+        sim.run(100)
+        spikes = pop.spinnaker_get_data("spikes")
+        # v reaches threshold when 1 - exp(-t / tau_m) = 15 / 20
+        period = 20.0 * numpy.log(4.0)
+        self.assertAlmostEqual(
+            numpy.diff(spikes[:, 1]).mean(), period, delta=1.0)
+
+    def test_fixed_number_pre(self):
+        pop = sim.Population(50, sim.IF_curr_exp)
+        projection = sim.Projection(
+            pop, pop, sim.FixedNumberPreConnector(
+                10, allow_self_connections=False, rng=NumpyRNG(1)),
+            sim.StaticSynapse(weight=0.1, delay=2.0))
+        pre, post, _weight, delay = numpy.array(
+            projection.get(["weight", "delay"], "list")).T
+        numpy.testing.assert_array_equal(
+            numpy.bincount(post.astype(int)), numpy.full(50, 10))
+        self.assertFalse(numpy.any(pre == post))
+        self.assertEqual(len(set(zip(pre, post))), 500)
+        numpy.testing.assert_array_equal(delay, 2.0)
+        # Most of the sources chosen
+        projection = sim.Projection(
+            pop, pop, sim.FixedNumberPreConnector(
+                40, allow_self_connections=False, rng=NumpyRNG(1)))
+        pre, post = numpy.array(projection.get([], "list")).T
+        self.assertFalse(numpy.any(pre == post))
+        self.assertEqual(len(set(zip(pre, post))), 2000)
+
+    def test_poisson_rate(self):
+        pop = sim.Population(
+            100, sim.SpikeSourcePoisson(rate=20.0),
+            additional_parameters={"seed": 1})
+        pop.record("spikes")
+        sim.run(1000)
+        pop.set(rate=0.0)
+        sim.run(1000)
+        times = pop.spinnaker_get_data("spikes")[:, 1]
+        self.assertAlmostEqual(len(times) / 100.0, 20.0, delta=2.0)
+        self.assertLess(times.max(), 1000)
+
+    def test_seed_added_after_run(self):
+        spikes = list()
+        for seed in (2, 2, 3):
+            sim.setup(timestep=1.0)
+            first = sim.Population(
+                50, sim.SpikeSourcePoisson(rate=50.0),
+                additional_parameters={"seed": 1})
+            sim.run(100)
+            pop = sim.Population(
+                50, sim.SpikeSourcePoisson(rate=50.0),
+                additional_parameters={"seed": seed})
+            pop.record("spikes")
+            first.record("spikes")
+            sim.run(500)
+            spikes.append(pop.spinnaker_get_data("spikes"))
+            sim.end()
+        # The seed of a population added after a run is used
+        numpy.testing.assert_array_equal(spikes[0], spikes[1])
+        self.assertFalse(numpy.array_equal(spikes[0], spikes[2]))
+
+    def test_poisson_schedule(self):
+        pop = sim.Population(2, sim.SpikeSourcePoisson(
+            rates=[[100.0, 0.0, 200.0], [0.0, 300.0]],
+            starts=[[0.0, 1000.0, 2000.0], [0.0, 1000.0]],
+            durations=[[1000.0, 1000.0, 1000.0], [1000.0, 2000.0]]),
+            additional_parameters={"seed": 2})
+        pop.record("spikes")
+        sim.run(3000)
+        spikes = pop.spinnaker_get_data("spikes")
+        counts = numpy.histogram2d(
+            spikes[:, 0], spikes[:, 1], bins=[2, 3],
+            range=[[-0.5, 1.5], [0, 3000]])[0]
+        self.assertEqual(counts[0, 1], 0)
+        self.assertEqual(counts[1, 0], 0)
+        for count, rate in [(counts[0, 0], 100), (counts[0, 2], 200),
+                            (counts[1, 1], 300), (counts[1, 2], 300)]:
+            self.assertAlmostEqual(count, rate, delta=4 * numpy.sqrt(rate))
+        with self.assertRaises(ValueError):
+            pop.set(rate=10.0)
+
+    def test_schedule_matches_phases(self):
+        phases = ((200, 0.0), (200, 50.0), (200, 10.0))
+        spikes = list()
+        for input_phases in (None, phases):
+            sim.setup(timestep=0.1)
+            network = build_network(
+                sim, n_neurons=100, seed=3, input_phases=input_phases)
+            network.pop_exc.record("spikes")
+            if input_phases is None:
+                run_phases(sim, network, phases)
+            else:
+                sim.run(600)
+            spikes.append(network.pop_exc.spinnaker_get_data("spikes"))
+            sim.end()
+        self.assertGreater(len(spikes[0]), 0)
+        numpy.testing.assert_array_equal(spikes[0], spikes[1])
+        self.assertEqual(rate_schedule(phases), {
+            "rates": [0.0, 50.0, 10.0], "starts": [0.0, 200.0, 400.0],
+            "durations": [200.0, 200.0, 200.0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
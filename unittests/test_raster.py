@@ -0,0 +1,68 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+import numpy
+from spike_data.columns import SpikeColumns
+from spike_data.raster import raster_image, save_raster
+
+
+class TestRaster(unittest.TestCase):
+
+    def setUp(self):
+        # Neuron 0 of "a" at 0 ms and neuron 1 of "b" at 75 ms
+        self.spikes = SpikeColumns(
+            [0, 3], [0.0, 75.0], [2, 2], ["a", "b"], [1, 1], t_stop=100.0)
+
+    def test_image(self):
+        image = raster_image(self.spikes, width=4, height=4,
+                             colours=["#ff0000", (0.0, 0.0, 1.0)])
+        self.assertEqual(image.shape, (4, 4, 3))
+        # The first neuron is at the bottom, the last at the top
+        numpy.testing.assert_array_equal(image[3, 0], [255, 0, 0])
+        numpy.testing.assert_array_equal(image[0, 3], [0, 0, 255])
+        self.assertEqual(numpy.count_nonzero(image.min(axis=2) < 255), 2)
+
+    def test_many_spikes(self):
+        # A million spikes only make the pixels they fall in saturate
+        spikes = SpikeColumns(numpy.zeros(10 ** 6), numpy.full(10 ** 6, 1.0),
+                              [10], t_stop=10.0)
+        image = raster_image(spikes, width=10, height=10, saturation=2)
+        numpy.testing.assert_array_equal(image[9, 1], [0x1f, 0x77, 0xb4])
+
+    def test_png(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "raster.png")
+            save_raster(self.spikes, filename, width=5, height=3)
+            with open(filename, "rb") as f:
+                data = f.read()
+        self.assertEqual(data[:8], b"\x89PNG\r\n\x1a\n")
+        width, height = struct.unpack(">II", data[16:24])
+        self.assertEqual((width, height), (5, 3))
+        length = struct.unpack(">I", data[33:37])[0]
+        self.assertEqual(data[37:41], b"IDAT")
+        rows = numpy.frombuffer(
+            zlib.decompress(data[41:41 + length]), dtype="uint8")
+        expected = raster_image(self.spikes, width=5, height=3)
+        numpy.testing.assert_array_equal(
+            rows.reshape(3, 16)[:, 1:], expected.reshape(3, 15))
+
+
+if __name__ == '__main__':
+    unittest.main()
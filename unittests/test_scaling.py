@@ -0,0 +1,70 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import local_engine.spinnaker as sim
+from balanced_random.balanced_network import build_network
+from balanced_random.scaling import compare, connection_count, measure_size
+
+
+class TestScaling(unittest.TestCase):
+
+    def test_connection_count(self):
+        sim.setup(timestep=0.1)
+        projections = list()
+        projection = sim.Projection
+
+        def recording(*args, **kwargs):
+            projections.append(projection(*args, **kwargs))
+            return projections[-1]
+        sim.Projection = recording
+        try:
+            build_network(sim, n_neurons=300, in_degree=50)
+        finally:
+            sim.Projection = projection
+        sim.end()
+        self.assertEqual(sum(len(p) for p in projections),
+                         connection_count(300, 50))
+        # Degrees larger than the populations are limited by them
+        self.assertEqual(connection_count(10, 100),
+                         8 * (8 + 2 + 100) + 2 * (8 + 2) + 10)
+
+    def test_measure_size(self):
+        record = measure_size(200, in_degree=20, run_time=100.0)
+        self.assertEqual(record["n_connections"], connection_count(200, 20))
+        self.assertGreater(record["n_spikes"], 0)
+        self.assertGreater(record["connections_per_second"], 0)
+
+    def test_compare(self):
+        baseline = [{"n_neurons": 10, "build_time": 2.0,
+                     "connections_per_second": 10.0,
+                     "peak_rss_bytes": 100, "real_time_factor": 1.0,
+                     "spikes_per_second": 5.0},
+                    {"n_neurons": 100, "error": "MemoryError"}]
+        records = [{"n_neurons": 10, "build_time": 1.0,
+                    "connections_per_second": 20.0,
+                    "peak_rss_bytes": 200, "real_time_factor": 2.0,
+                    "spikes_per_second": None},
+                   {"n_neurons": 100, "build_time": 1.0}]
+        row, = compare(records, baseline)
+        self.assertEqual(row["build_time"], 2.0)
+        self.assertEqual(row["connections_per_second"], 2.0)
+        self.assertEqual(row["peak_rss_bytes"], 0.5)
+        self.assertEqual(row["real_time_factor"], 0.5)
+        self.assertIsNone(row["spikes_per_second"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import numpy
+import local_engine.spinnaker as sim
+from learning.sparse_weights import (
+    SparseWeights, SparseWeightsFile, save_sparse)
+
+
+class _Listed(object):
+    """ A projection without get_columns, whose get returns either a list
+        of tuples or, as sPyNNaker's ConnectionHolder, a structured array
+    """
+
+    def __init__(self, projection, structured):
+        self.pre = projection.pre
+        self.post = projection.post
+        self.__projection = projection
+        self.__structured = structured
+
+    def get(self, attribute_names,
+            format):  # pylint: disable=redefined-builtin
+        connections = self.__projection.get(attribute_names, format)
+        if not self.__structured:
+            return connections
+        return numpy.array(connections, dtype=[
+            ("source", "uint32"), ("target", "uint32"),
+            ("weight", "float64"), ("delay", "float64")])
+
+
+class TestSparseWeights(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.RandomState(4)
+        self.dense = numpy.where(
+            rng.uniform(size=(30, 20)) < 0.2, rng.uniform(size=(30, 20)),
+            numpy.nan)
+        self.delays = numpy.where(
+            numpy.isnan(self.dense), numpy.nan,
+            rng.randint(1, 10, size=(30, 20)))
+
+    def _check(self, matrix, first, last):
+        pre, post, weights, delays = matrix.coo()
+        expected = numpy.full(self.dense.shape, numpy.nan)
+        if matrix.by == "pre":
+            expected[first:last] = self.dense[first:last]
+        else:
+            expected[:, first:last] = self.dense[:, first:last]
+        found = numpy.full(self.dense.shape, numpy.nan)
+        found[pre, post] = weights
+        numpy.testing.assert_array_equal(found, expected)
+        numpy.testing.assert_array_equal(delays, self.delays[pre, post])
+
+    def test_orders(self):
+        matrix = SparseWeights.from_array(self.dense, self.delays)
+        self.assertEqual(len(matrix), numpy.count_nonzero(
+            ~numpy.isnan(self.dense)))
+        self._check(matrix, 0, 30)
+        self._check(matrix.reorder("post"), 0, 20)
+        self._check(matrix.slice(5, 12), 5, 12)
+        self._check(matrix.reorder("post").slice(3, 4), 3, 4)
+        posts, weights = matrix.slice(5, 12).row(7)
+        numpy.testing.assert_array_equal(
+            posts, numpy.flatnonzero(~numpy.isnan(self.dense[7])))
+        numpy.testing.assert_array_equal(weights, self.dense[7, posts])
+
+    def test_file(self):
+        matrix = SparseWeights.from_array(self.dense, self.delays)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matrix")
+            save_sparse(path, matrix)
+            stored = SparseWeightsFile(path)
+            self.assertEqual(stored.shape, (30, 20))
+            by_pre = stored.by_pre(10, 25)
+            self.assertIsInstance(by_pre.weights.base, numpy.memmap)
+            self._check(by_pre, 10, 25)
+            self._check(stored.by_post(15), 15, 20)
+            self._check(stored.by_post(), 0, 20)
+
+    def test_projection(self):
+        sim.setup(timestep=1.0)
+        pre = sim.Population(30, sim.SpikeSourceArray(spike_times=[]))
+        post = sim.Population(20, sim.IF_curr_exp())
+        rows, columns = numpy.nonzero(~numpy.isnan(self.dense))
+        projection = sim.Projection(pre, post, sim.FromListConnector(
+            numpy.column_stack((rows, columns, self.dense[rows, columns],
+                                self.delays[rows, columns]))))
+        matrix = SparseWeights.from_projection(projection, by="post")
+        listed = SparseWeights.from_projection(_Listed(projection, False))
+        held = SparseWeights.from_projection(_Listed(projection, True))
+        sim.end()
+        self.assertEqual(matrix.shape, (30, 20))
+        self._check(matrix, 0, 20)
+        self._check(listed, 0, 30)
+        self._check(held, 0, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
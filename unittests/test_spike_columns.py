@@ -0,0 +1,76 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import neo
+import numpy
+from spike_data.columns import SpikeColumns
+
+
+class _Recorded(object):
+    """ Something with recorded spikes, like a Population
+    """
+
+    def __init__(self, label, size, spikes):
+        self.label = label
+        self.size = size
+        self.__spikes = numpy.array(spikes, dtype=float).reshape(-1, 2)
+
+    def spinnaker_get_data(self, variable):
+        assert variable == "spikes"
+        return self.__spikes
+
+
+class TestSpikeColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.spikes = SpikeColumns.from_populations([
+            _Recorded("a", 3, [[0, 1.0], [2, 1.5], [0, 4.0]]),
+            _Recorded("b", 2, []),
+            _Recorded("c", 4, [[3, 2.0], [1, 0.5]])], t_stop=10.0)
+
+    def test_columns(self):
+        self.assertEqual(len(self.spikes), 5)
+        self.assertEqual(self.spikes.n_neurons, 9)
+        self.assertEqual(self.spikes.ids.dtype, numpy.int32)
+        numpy.testing.assert_array_equal(self.spikes.ids, [0, 2, 0, 8, 6])
+        numpy.testing.assert_array_equal(
+            self.spikes.local_ids(), [0, 2, 0, 3, 1])
+        self.assertEqual(self.spikes.nbytes, 5 * 4 + 5 * 8)
+
+    def test_population(self):
+        c = self.spikes.population("c")
+        self.assertTrue(numpy.shares_memory(c.times, self.spikes.times))
+        numpy.testing.assert_array_equal(c.ids, [8, 6])
+        numpy.testing.assert_array_equal(c.local_ids(), [3, 1])
+        self.assertEqual(c.n_neurons, 4)
+        self.assertEqual(len(self.spikes.population(1)), 0)
+
+    def test_neo(self):
+        trains = self.spikes.population("a").to_spiketrains()
+        self.assertEqual(len(trains), 3)
+        numpy.testing.assert_array_equal(trains[0].magnitude, [1.0, 4.0])
+        self.assertEqual(trains[2].annotations["source_index"], 2)
+        block = neo.Block()
+        block.segments.append(neo.Segment())
+        block.segments[0].spiketrains.extend(trains)
+        back = SpikeColumns.from_neo(block, "a")
+        numpy.testing.assert_array_equal(
+            numpy.sort(back.times), [1.0, 1.5, 4.0])
+        self.assertEqual(back.t_stop, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import difflib
+import os
+import unittest
+from benchmarks.instrument import ROOT, estimate_cores
+from benchmarks.split_matrix import PAIRS, format_table, summarise
+
+SPLIT = ("SplitterAbstractPopulationVertexNeuronsSynapses", [1, 128, False])
+DELEGATE = ("SplitterPoissonDelegate", [])
+
+
+def _population(size, model, splitter=None):
+    return {"size": size, "model": model, "splitter": splitter}
+
+
+class TestSplitMatrix(unittest.TestCase):
+
+    def test_cores_plain(self):
+        populations = [_population(500, "IF_curr_exp"),
+                       _population(100, "SpikeSourcePoisson")]
+        projections = [
+            {"pre": 1, "post": 0, "connector": "AllToAllConnector"}]
+        self.assertEqual(estimate_cores(populations, projections, {}), 3)
+        self.assertEqual(estimate_cores(
+            populations, projections, {"IF_curr_exp": 64}), 9)
+
+    def test_cores_split(self):
+        populations = [_population(192, "IF_curr_exp", SPLIT),
+                       _population(192, "SpikeSourcePoisson", DELEGATE),
+                       _population(192, "SpikeSourcePoisson", DELEGATE)]
+        projections = [
+            {"pre": 1, "post": 0, "connector": "OneToOneConnector"},
+            {"pre": 2, "post": 0, "connector": "AllToAllConnector"}]
+        limits = {"IF_curr_exp": 64, "SpikeSourcePoisson": 64}
+        # 3 slices of neuron and synapse cores, and only the one to one
+        # source is delegated to the synapse cores
+        self.assertEqual(
+            estimate_cores(populations, projections, limits), 6 + 3)
+
+    def test_summary(self):
+        records = [
+            {"pair": "a", "variant": "plain", "run_time": 2.0, "n_cores": 4,
+             "error": None},
+            {"pair": "a", "variant": "plain", "run_time": 4.0, "n_cores": 4,
+             "error": None},
+            {"pair": "a", "variant": "split", "run_time": 1.5, "n_cores": 6,
+             "error": None},
+            {"pair": "a", "variant": "split", "error": "failed"}]
+        plain, split, ratio = summarise(records)
+        self.assertEqual(plain["run_time"], 3.0)
+        self.assertEqual(plain["n_ok"], 2)
+        self.assertEqual(split["run_time"], 1.5)
+        self.assertEqual(split["error"], "failed")
+        self.assertEqual(ratio["run_time"], 0.5)
+        self.assertEqual(ratio["n_cores"], 1.5)
+        self.assertIsNone(ratio["mapping_time"])
+        table = format_table([plain, split, ratio])
+        self.assertEqual(len(table.splitlines()), 4)
+        self.assertIn("failed", table)
+
+    def test_pairs_differ_in_splitting(self):
+        for name, script, split_script in PAIRS:
+            with open(os.path.join(ROOT, script), encoding="utf-8") as f:
+                plain = f.read().splitlines()
+            with open(os.path.join(ROOT, split_script),
+                      encoding="utf-8") as f:
+                split = f.read().splitlines()
+            # Every change is to lines that add or pass on a splitter
+            matcher = difflib.SequenceMatcher(None, plain, split)
+            for tag, _i1, _i2, j1, j2 in matcher.get_opcodes():
+                if tag == "equal":
+                    continue
+                self.assertTrue(
+                    any("plitter" in line for line in split[j1:j2]),
+                    "{}: {}".format(name, split[j1:j2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import unittest
+import numpy
+from learning.stdp_offline import STDPParameters, weight_trajectories
+
+PARAMETERS = STDPParameters(
+    tau_plus=20.0, tau_minus=15.0, A_plus=0.1, A_minus=0.12, w_min=0.0,
+    w_max=5.0)
+
+
+def _traces(steps, tau):
+    traces = list()
+    for k, step in enumerate(steps):
+        decayed = traces[-1] * math.exp(-(step - steps[k - 1]) / tau) \
+            if k else 0.0
+        traces.append(decayed + 1.0)
+    return traces
+
+
+def _reference(pre_spikes, post_spikes, pre_id, post_id, delay, weight, p,
+               flush):
+    """ The weights after each update of one synapse, spike by spike
+    """
+    pre = sorted(t for i, t in pre_spikes if i == pre_id)
+    post = sorted(t + delay for i, t in post_spikes if i == post_id)
+    pre_traces = _traces(pre, p.tau_plus)
+    post_traces = _traces(post, p.tau_minus)
+    weights = list()
+    last_pre = last_post = None
+    j = 0
+    for k, t in enumerate(pre + ([None] if flush else [])):
+        delta = 0.0
+        while j < len(post) and (t is None or post[j] <= t):
+            if last_pre is not None and post[j] > pre[last_pre]:
+                delta += p.A_plus * p.w_max * pre_traces[last_pre] * \
+                    math.exp(-(post[j] - pre[last_pre]) / p.tau_plus)
+            last_post = j
+            j += 1
+        if t is not None:
+            if last_post is not None and t > post[last_post]:
+                delta -= p.A_minus * p.w_max * post_traces[last_post] * \
+                    math.exp(-(t - post[last_post]) / p.tau_minus)
+            last_pre = k
+        weight = min(p.w_max, max(p.w_min, weight + delta))
+        weights.append(weight)
+    return weights
+
+
+def _spikes(rng, n_neurons, rate, run_time):
+    ids = list()
+    times = list()
+    for i in range(n_neurons):
+        steps = numpy.unique(rng.randint(
+            run_time, size=rng.poisson(rate * run_time / 1000.0)))
+        ids.extend([i] * len(steps))
+        times.extend(steps.astype(float))
+    return numpy.column_stack((ids, times))
+
+
+class TestSTDPOffline(unittest.TestCase):
+
+    def test_matches_reference(self):
+        rng = numpy.random.RandomState(0)
+        pre = _spikes(rng, 10, 20.0, 2000)
+        post = _spikes(rng, 10, 20.0, 2000)
+        pre_ids = rng.randint(10, size=30)
+        post_ids = rng.randint(10, size=30)
+        delays = rng.randint(1, 8, size=30).astype(float)
+        initial = rng.uniform(0.0, 5.0, size=30)
+        for flush in (False, True):
+            trajectories = weight_trajectories(
+                pre, post, pre_ids, post_ids, delays, initial, PARAMETERS,
+                n_pre=10, n_post=10, flush=flush)
+            for s in range(30):
+                _times, weights = trajectories.synapse(s)
+                numpy.testing.assert_allclose(weights, _reference(
+                    pre, post, pre_ids[s], post_ids[s], delays[s],
+                    initial[s], PARAMETERS, flush))
+
+    def test_pair(self):
+        # A post spike 5 ms after a pre spike, seen at the next pre spike
+        pre = [[0, 10.0], [0, 50.0]]
+        post = [[0, 14.0]]
+        trajectories = weight_trajectories(
+            pre, post, [0], [0], 1.0, 1.0, PARAMETERS)
+        times, weights = trajectories.synapse(0)
+        numpy.testing.assert_array_equal(times, [10.0, 50.0])
+        potentiation = 0.5 * math.exp(-5.0 / 20.0)
+        depression = 0.6 * math.exp(-35.0 / 15.0)
+        numpy.testing.assert_allclose(
+            weights, [1.0, 1.0 + potentiation - depression])
+        self.assertAlmostEqual(trajectories.at(49.0)[0], 1.0)
+        numpy.testing.assert_allclose(trajectories.final, weights[-1:])
+
+    def test_no_spikes(self):
+        trajectories = weight_trajectories(
+            numpy.zeros((0, 2)), [[1, 5.0]], [0, 1], [1, 0], 1.0, [2.0, 3.0],
+            PARAMETERS, n_pre=2, n_post=2)
+        numpy.testing.assert_array_equal(trajectories.final, [2.0, 3.0])
+        self.assertEqual(len(trajectories.weights), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import types
+import unittest
+from balanced_random.sweep import grid
+from learning.stdp_sweep import (
+    DEFAULTS, blocks, build_network, summarise_blocks)
+
+
+class _View(object):
+    """ A slice of a population, as population[first:last]
+    """
+
+    def __init__(self, parent, first, last):
+        self.parent = parent
+        self.first = first
+        self.last = last
+
+
+class _Population(object):
+    """ Records how a population was made
+    """
+
+    def __init__(self, size, celltype, label=None):
+        self.size = size
+        self.celltype = celltype
+        self.label = label
+        self.recorded = list()
+
+    def record(self, variables):
+        self.recorded.append(variables)
+
+    def __getitem__(self, index):
+        return _View(self, index.start, index.stop)
+
+
+def _stub_sim():
+    """ A simulator that only records the objects made, each model and
+        synapse type as a namespace of its name and parameters
+    """
+    sim = types.SimpleNamespace(projections=list())
+
+    def model(name):
+        return lambda **kwargs: types.SimpleNamespace(name=name, **kwargs)
+    for name in ("IF_curr_exp", "SpikeSourcePoisson", "OneToOneConnector",
+                 "StaticSynapse", "STDPMechanism", "SpikePairRule",
+                 "AdditiveWeightDependence"):
+        setattr(sim, name, model(name))
+    sim.Population = _Population
+
+    def projection(pre, post, connector, synapse_type):
+        sim.projections.append(types.SimpleNamespace(
+            pre=pre, post=post, connector=connector,
+            synapse_type=synapse_type))
+        return sim.projections[-1]
+    sim.Projection = projection
+    return sim
+
+
+class TestSTDPSweep(unittest.TestCase):
+
+    def test_blocks(self):
+        self.assertEqual(blocks(3, 4), [(0, 4), (4, 8), (8, 12)])
+
+    def test_summary(self):
+        points = grid(tau_plus=[10.0, 20.0], w_max=[1.0, 5.0])
+        weights = [[0.0, 1.0], [1.0, 1.0], [0.25, 0.75], [5.0, 5.0]]
+        records = summarise_blocks(points, weights)
+        self.assertEqual(len(records), 4)
+        for record, point in zip(records, points):
+            for name, value in DEFAULTS.items():
+                self.assertEqual(record[name], point.get(name, value))
+        self.assertEqual(
+            [r["fraction_at_w_max"] for r in records], [0.5, 0.0, 0.0, 1.0])
+        self.assertEqual(records[2]["mean_weight"], 0.5)
+        self.assertEqual(records[2]["std_weight"], 0.25)
+
+    def test_build_network(self):
+        sim = _stub_sim()
+        points = grid(tau_plus=[10.0, 40.0], w_max=[2.0])
+        pre_pop, post_pops, projections = build_network(sim, points, 3)
+        self.assertEqual(pre_pop.size, 6)
+        self.assertEqual([pop.size for pop in post_pops], [3, 3])
+        self.assertEqual([pop.label for pop in post_pops],
+                         ["Post_0", "Post_1"])
+        by_label = dict()
+        for projection in sim.projections:
+            pre = projection.pre
+            source = pre.parent if isinstance(pre, _View) else pre
+            by_label.setdefault(projection.post.label, list()).append(
+                (source.label, pre, projection))
+        for i, (first, last) in enumerate([(0, 3), (3, 6)]):
+            into_post = by_label["Post_{}".format(i)]
+            # Each block takes its own slice of the shared sources
+            self.assertEqual(
+                sorted((label, pre.first, pre.last)
+                       for label, pre, _ in into_post),
+                [("Noise_Post", first, last), ("Pre", first, last),
+                 ("Training", first, last)])
+            stdp, = [p.synapse_type for label, _, p in into_post
+                     if label == "Pre"]
+            self.assertEqual(stdp.name, "STDPMechanism")
+            timing = stdp.timing_dependence
+            self.assertEqual(
+                (timing.tau_plus, timing.tau_minus, timing.A_plus,
+                 timing.A_minus),
+                (points[i]["tau_plus"], DEFAULTS["tau_minus"],
+                 DEFAULTS["A_plus"], DEFAULTS["A_minus"]))
+            self.assertEqual(stdp.weight_dependence.w_max, 2.0)
+            self.assertIs(projections[i].synapse_type, stdp)
+        # The pre-population is fed whole, and only it and the
+        # post-populations record
+        self.assertEqual(
+            sorted(label for label, pre, _ in by_label["Pre"]),
+            ["Noise_Pre", "Training"])
+        self.assertEqual(pre_pop.recorded, ["spikes"])
+        self.assertTrue(all(pop.recorded == ["spikes"] for pop in post_pops))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import types
+import unittest
+import numpy
+import local_engine.spinnaker as sim
+from learning.stdp_offline import STDPParameters, weight_trajectories
+from learning.stdp_trials import (
+    TrialProtocol, format_trials, run_time, run_trials, training_schedule,
+    trial_results)
+from learning.weight_snapshots import snapshots_from_trajectories
+
+
+def _static_stdp():
+    """ The local engine with STDP standing in as a static synapse of its
+        initial weight, so that the weights read never change
+    """
+    stub = types.SimpleNamespace(**{
+        name: getattr(sim, name) for name in dir(sim)
+        if not name.startswith("_")})
+    stub.SpikePairRule = types.SimpleNamespace
+    stub.AdditiveWeightDependence = types.SimpleNamespace
+
+    def stdp_mechanism(timing_dependence, weight_dependence, weight, delay):
+        return sim.StaticSynapse(weight=weight, delay=delay)
+    stub.STDPMechanism = stdp_mechanism
+    return stub
+
+
+class TestSTDPTrials(unittest.TestCase):
+
+    def test_schedule(self):
+        protocol = TrialProtocol(n_trials=3, trial_length=1000.0,
+                                 start=200.0, duration=300.0, rate=100.0)
+        self.assertEqual(run_time(protocol), 3000.0)
+        sim.setup(timestep=1.0)
+        training = sim.Population(
+            20, sim.SpikeSourcePoisson(**training_schedule(protocol)))
+        training.record("spikes")
+        sim.run(run_time(protocol))
+        times = training.spinnaker_get_data("spikes")[:, 1]
+        sim.end()
+        in_trial = times % 1000.0
+        self.assertTrue(numpy.all((in_trial >= 200.0) & (in_trial < 500.0)))
+        counts = numpy.bincount((times // 1000).astype(int))
+        self.assertEqual(len(counts), 3)
+        self.assertTrue(numpy.all(counts > 400))
+        with self.assertRaises(ValueError):
+            training_schedule(protocol._replace(duration=900.0))
+
+    def test_results(self):
+        protocol = TrialProtocol(n_trials=4, trial_length=500.0)
+        rng = numpy.random.RandomState(6)
+        pre = numpy.column_stack((
+            rng.randint(10, size=300), rng.randint(2000, size=300)))
+        post = numpy.column_stack((
+            rng.randint(10, size=300), rng.randint(2000, size=300)))
+        trajectories = weight_trajectories(
+            pre, post, numpy.arange(10), numpy.arange(10), 5.0, 0.0,
+            STDPParameters(20.0, 20.0, 0.5, 0.5, 0.0, 5.0), n_pre=10,
+            n_post=10)
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = snapshots_from_trajectories(
+                trajectories, run_time(protocol), protocol.trial_length,
+                os.path.join(directory, "trials.snap"), dtype="float64")
+            results = trial_results(snapshots, protocol)
+        numpy.testing.assert_array_equal(
+            results.boundaries, [0.0, 500.0, 1000.0, 1500.0, 2000.0])
+        for i, boundary in enumerate(results.boundaries):
+            numpy.testing.assert_array_equal(
+                results.weights[i], trajectories.at(boundary))
+        numpy.testing.assert_allclose(
+            results.changes.sum(axis=0), trajectories.at(2000.0))
+        self.assertEqual(len(format_trials(results).splitlines()), 5)
+
+    def test_offline_difference(self):
+        protocol = TrialProtocol(n_trials=2, trial_length=1000.0,
+                                 start=200.0, duration=300.0, rate=50.0)
+        with tempfile.TemporaryDirectory() as directory:
+            results = run_trials(
+                _static_stdp(), protocol,
+                os.path.join(directory, "trials.snap"), n_neurons=10)
+        # The weights read stay at 0, so differ from the offline weights
+        # by the largest of those
+        self.assertGreater(results.offline_difference, 0.0)
+        self.assertAlmostEqual(results.offline_difference,
+                               numpy.abs(results.weights[-1]).max())
+        self.assertIn("Largest difference", format_trials(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from learning.struct_pl_offline import (
+    STRUCT_PL, RewiringParameters, _rewire_batch, formation_table,
+    simulate_rewiring, squared_distances)
+
+
+def _rewire_in_order(slots, weights, post, slot, pre, chance, table, shape,
+                     parameters):
+    for p, s, q, c in zip(post, slot, pre, chance):
+        if slots[p, s] >= 0:
+            limit = (parameters.prob_elim_potentiated
+                     if weights[p, s] > parameters.threshold
+                     else parameters.prob_elim_depressed)
+            if c < limit:
+                slots[p, s] = -1
+        elif q >= 0 and q not in slots[p]:
+            distance = squared_distances(q, p, shape)
+            if distance < len(table) and c < table[distance]:
+                slots[p, s] = q
+                weights[p, s] = parameters.initial_weight
+
+
+class TestStructPlOffline(unittest.TestCase):
+
+    def test_distances(self):
+        # On a 4 by 4 grid, neuron 0 is next to 3 and 12 around the edges
+        self.assertEqual(squared_distances(0, 3, (4, 4)), 1)
+        self.assertEqual(squared_distances(0, 12, (4, 4)), 1)
+        self.assertEqual(squared_distances(0, 10, (4, 4)), 8)
+        table = formation_table(0.5, 1.0, (4, 4))
+        self.assertEqual(len(table), 9)
+        self.assertAlmostEqual(table[0], 0.5)
+        self.assertAlmostEqual(table[2], 0.5 * numpy.exp(-1.0), places=4)
+
+    def test_batch_matches_sequential(self):
+        rng = numpy.random.RandomState(3)
+        parameters = RewiringParameters(
+            s_max=4, sigma_form_forward=2.0, p_form_forward=0.8,
+            prob_elim_depressed=0.3, prob_elim_potentiated=0.1,
+            threshold=0.5, initial_weight=1.0)
+        shape = (5, 5)
+        table = numpy.append(formation_table(0.8, 2.0, shape), 0.0)
+        n = 2000
+        post = rng.randint(25, size=n)
+        slot = rng.randint(4, size=n)
+        pre = rng.randint(-1, 25, size=n)
+        chance = rng.uniform(size=n)
+        slots = numpy.full((25, 4), -1, dtype="int64")
+        slots[:, 0] = rng.randint(25, size=25)
+        weights = rng.uniform(size=(25, 4))
+        expected = slots.copy()
+        _rewire_in_order(expected, weights.copy(), post, slot, pre, chance,
+                         table, shape, parameters)
+        events = _rewire_batch(slots, weights, numpy.arange(n), post, slot,
+                               pre, chance, table, shape, parameters)
+        numpy.testing.assert_array_equal(slots, expected)
+        self.assertGreater(sum(len(e[0]) for e in events), 0)
+
+    def test_simulate(self):
+        result = simulate_rewiring(
+            STRUCT_PL._replace(sigma_form_forward=2.0), 100, 100, 5000.0,
+            connections=[[0, 0], [1, 0], [5, 7]], seed=1)
+        pre, post = result.connections[:, :2].T.astype("int64")
+        self.assertEqual(result.n_attempts, 50000)
+        self.assertLessEqual(numpy.bincount(post).max(), STRUCT_PL.s_max)
+        self.assertEqual(len(set(zip(pre, post))), len(pre))
+        numpy.testing.assert_array_equal(result.connections[:, 2], 5.0)
+        # Replaying the events gives the connections at the end
+        connected = {(0, 0), (1, 0), (5, 7)}
+        for p, q, formed in zip(result.events.pre, result.events.post,
+                                result.events.formed):
+            if formed:
+                connected.add((p, q))
+            else:
+                connected.remove((p, q))
+        self.assertEqual(connected, set(zip(pre, post)))
+        self.assertTrue(numpy.all(numpy.diff(result.events.times) >= 0))
+
+    def test_attempts_per_core(self):
+        parameters = STRUCT_PL._replace(
+            f_rew=1000, sigma_form_forward=100.0, p_form_forward=1.0)
+        for n_post, neurons_per_core in ((300, 64), (300, 300), (64, 64)):
+            result = simulate_rewiring(
+                parameters, n_post, n_post, 100.0, seed=2,
+                neurons_per_core=neurons_per_core)
+            n_slices = -(-n_post // neurons_per_core)
+            self.assertEqual(result.n_attempts, 100 * n_slices)
+            # Each slice makes its own attempts, however small it is
+            formed = numpy.bincount(
+                result.events.post[result.events.formed] //
+                neurons_per_core, minlength=n_slices)
+            self.assertEqual(len(formed), n_slices)
+            self.assertTrue(numpy.all(formed > 80), formed)
+            self.assertTrue(numpy.all(formed <= 100), formed)
+
+    def test_last_neuron(self):
+        parameters = STRUCT_PL._replace(
+            partner_selection="last_neuron", sigma_form_forward=100.0,
+            p_form_forward=1.0)
+        # Only neuron 3 ever spikes
+        spikes = [[3, t] for t in range(0, 1000, 2)]
+        result = simulate_rewiring(
+            parameters, 10, 10, 1000.0, spikes=spikes, seed=0)
+        numpy.testing.assert_array_equal(result.connections[:, 0], 3)
+        self.assertEqual(len(result.connections), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from sudoku.sudoku_connections import (
+    CONNECTION_DTYPE, as_connection_list, inhibition_to_slice,
+    inter_cell_connections, intra_cell_connections, packed_stim_connections,
+    stim_connections)
+
+INIT = [[8, 0, 0,  0, 0, 0,  0, 0, 0],
+        [0, 0, 3,  6, 0, 0,  0, 0, 0],
+        [0, 7, 0,  0, 9, 0,  2, 0, 0],
+
+        [0, 5, 0,  0, 0, 7,  0, 0, 0],
+        [0, 0, 0,  0, 4, 5,  7, 0, 0],
+        [0, 0, 0,  1, 0, 0,  0, 3, 0],
+
+        [0, 0, 1,  0, 0, 0,  0, 6, 8],
+        [0, 0, 8,  5, 0, 0,  0, 1, 0],
+        [0, 9, 0,  0, 0, 0,  4, 0, 0]]
+
+
+def _loop_connections(n_cell, n_N, weight, delay):
+    """ The connections as built by the original loops of sudoku.py
+    """
+    connections = list()
+    for x in range(9):
+        for y in range(9):
+            base = ((y * 9) + x) * n_cell
+            connections.extend([
+                (i + base, j + base,
+                 0.0 if i // n_N == j // n_N else weight, delay)
+                for i in range(n_cell) for j in range(n_cell)])
+
+    def inter_cell(x, y, r, c):
+        base_source = ((y * 9) + x) * n_cell
+        base_dest = ((c * 9) + r) * n_cell
+        connections.extend([
+            (i + base_source, j + base_dest, weight, delay)
+            for i in range(n_cell)
+            for j in range(n_N * (i // n_N), n_N * (i // n_N + 1))])
+
+    for x in range(9):
+        for y in range(9):
+            for r in range(9):
+                if r != x:
+                    inter_cell(x, y, r, y)
+            for c in range(9):
+                if c != y:
+                    inter_cell(x, y, x, c)
+            for r in range(3 * (x // 3), 3 * (x // 3 + 1)):
+                for c in range(3 * (y // 3), 3 * (y // 3 + 1)):
+                    if r != x and c != y:
+                        inter_cell(x, y, r, c)
+    return connections
+
+
+def _loop_stim_connections(init, n_stim, n_cell, n_N, weight, delay):
+    """ The stimulation connections as built by the original loops
+    """
+    connections = list()
+    for x in range(9):
+        for y in range(9):
+            if init[8 - y][x] != 0:
+                base_stim = ((y * 9) + x) * n_stim
+                base = ((y * 9) + x) * n_cell
+                for i in range(n_stim):
+                    for j in range(
+                            n_N * (init[8 - y][x] - 1), n_N * init[8 - y][x]):
+                        connections.append(
+                            (i + base_stim, j + base, weight, delay))
+    return connections
+
+
+def _sorted_rows(connections):
+    connections = numpy.asarray(connections, dtype="float64")
+    order = numpy.lexsort(connections.T[::-1])
+    return connections[order]
+
+
+class TestSudokuConnections(unittest.TestCase):
+
+    def test_matches_loops(self):
+        for neurons_per_digit in (1, 2, 3):
+            n_cell = 9 * neurons_per_digit
+            connections = numpy.concatenate([
+                intra_cell_connections(n_cell, neurons_per_digit, 0.2, 2.0),
+                inter_cell_connections(n_cell, neurons_per_digit, 0.2, 2.0)])
+            expected = _loop_connections(n_cell, neurons_per_digit, 0.2, 2.0)
+            self.assertEqual(len(connections), len(expected))
+            numpy.testing.assert_array_equal(
+                _sorted_rows(as_connection_list(connections)),
+                _sorted_rows(expected))
+
+    def test_stim_matches_loops(self):
+        connections = stim_connections(INIT, 30, 18, 2, 1, 2.0)
+        expected = _loop_stim_connections(INIT, 30, 18, 2, 1, 2.0)
+        numpy.testing.assert_array_equal(
+            _sorted_rows(as_connection_list(connections)),
+            _sorted_rows(expected))
+
+    def test_slices_match_builders(self):
+        n_cell, n_N = 27, 3
+        connections = numpy.concatenate([
+            intra_cell_connections(n_cell, n_N, 0.2, 2.0),
+            inter_cell_connections(n_cell, n_N, 0.2, 2.0)])
+        connections = connections[connections["weight"] != 0]
+        expected = numpy.column_stack(
+            [connections["pre"], connections["post"]])
+        pairs = list()
+        for lo_atom in range(0, 81 * n_cell, 200):
+            hi_atom = min(lo_atom + 199, 81 * n_cell - 1)
+            pre, post = inhibition_to_slice(n_cell, n_N, lo_atom, hi_atom)
+            self.assertTrue(numpy.all((post >= lo_atom) & (post <= hi_atom)))
+            pairs.append(numpy.column_stack([pre, post]))
+        numpy.testing.assert_array_equal(
+            _sorted_rows(numpy.concatenate(pairs)), _sorted_rows(expected))
+
+    def test_no_given_digits(self):
+        empty = [[0] * 9 for _ in range(9)]
+        self.assertEqual(len(stim_connections(empty, 30, 45, 5, 1, 2.0)), 0)
+
+    def test_packed_inhibition(self):
+        n_cell, n_N, n_puzzles = 18, 2, 3
+        n_total = 81 * n_cell
+        single = inhibition_to_slice(n_cell, n_N, 0, n_total - 1)
+        single = _sorted_rows(numpy.column_stack(single))
+        pairs = list()
+        # Slices deliberately straddle the boundaries between puzzles
+        for lo_atom in range(0, n_puzzles * n_total, 250):
+            hi_atom = min(lo_atom + 249, n_puzzles * n_total - 1)
+            pre, post = inhibition_to_slice(n_cell, n_N, lo_atom, hi_atom)
+            numpy.testing.assert_array_equal(
+                pre // n_total, post // n_total)
+            pairs.append(numpy.column_stack([pre, post]))
+        pairs = numpy.concatenate(pairs)
+        for puzzle in range(n_puzzles):
+            local = pairs[pairs[:, 1] // n_total == puzzle] - puzzle * n_total
+            numpy.testing.assert_array_equal(_sorted_rows(local), single)
+
+    def test_packed_stim(self):
+        n_stim, n_cell, n_N = 30, 18, 2
+        other = [row[::-1] for row in INIT]
+        empty = [[0] * 9 for _ in range(9)]
+        inits = [INIT, empty, other]
+        connections = packed_stim_connections(
+            inits, n_stim, n_cell, n_N, 1, 2.0)
+        puzzles = connections["post"] // (81 * n_cell)
+        numpy.testing.assert_array_equal(
+            connections["pre"] // (81 * n_stim), puzzles)
+        for puzzle, init in enumerate(inits):
+            local = connections[puzzles == puzzle]
+            expected = stim_connections(init, n_stim, n_cell, n_N, 1, 2.0)
+            numpy.testing.assert_array_equal(
+                local["pre"] - puzzle * 81 * n_stim, expected["pre"])
+            numpy.testing.assert_array_equal(
+                local["post"] - puzzle * 81 * n_cell, expected["post"])
+
+    def test_packed_no_puzzles(self):
+        connections = packed_stim_connections([], 30, 18, 2, 1, 2.0)
+        self.assertEqual(len(connections), 0)
+        self.assertEqual(connections.dtype, CONNECTION_DTYPE)
+
+
+if __name__ == '__main__':
+    unittest.main()
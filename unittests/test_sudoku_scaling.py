@@ -0,0 +1,62 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import tempfile
+import unittest
+from sudoku.sudoku_scaling import generation_metrics, main
+
+
+class TestSudokuScaling(unittest.TestCase):
+
+    def test_generation_metrics(self):
+        for neurons_per_digit in (1, 2):
+            record = generation_metrics(neurons_per_digit, 100)
+            n_cell = 9 * neurons_per_digit
+            self.assertEqual(record["n_cell"], n_cell)
+            self.assertEqual(record["n_total"], 81 * n_cell)
+            self.assertEqual(record["n_intra_cell"], 81 * n_cell * n_cell)
+            # Each neuron is connected to the 20 cells of its row, column
+            # and box that are not its own, in its own digit
+            self.assertEqual(record["n_inter_cell"],
+                             81 * n_cell * 20 * neurons_per_digit)
+            # The lazy slices leave out the zero weights of each neuron to
+            # its own digit in its own cell
+            self.assertEqual(
+                record["n_lazy"],
+                record["n_intra_cell"] + record["n_inter_cell"] -
+                81 * n_cell * neurons_per_digit)
+            self.assertEqual(record["explicit_list_bytes"],
+                             (record["n_intra_cell"] +
+                              record["n_inter_cell"]) * 4 * 8)
+            self.assertGreater(record["explicit_peak_bytes"], 0)
+            self.assertGreater(record["lazy_peak_bytes"], 0)
+
+    def test_main_no_run(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "scaling.json")
+            main(["--max-neurons-per-digit", "2", "--neurons-per-core",
+                  "300", "--no-run", "--output", output])
+            with open(output, encoding="utf-8") as f:
+                written = json.load(f)
+        self.assertTrue(written["parameters"]["no_run"])
+        self.assertEqual(
+            [r["neurons_per_digit"] for r in written["results"]], [1, 2])
+        self.assertTrue(all(r["run"] is None for r in written["results"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from sudoku.puzzles import EMPTY, PUZZLES, parse_puzzle
+from sudoku.sudoku_board import is_consistent, is_valid
+from sudoku.sudoku_solver import solve
+
+
+class TestSudokuSolver(unittest.TestCase):
+
+    def test_puzzles(self):
+        for init in PUZZLES.values():
+            result = solve(init)
+            self.assertEqual(result.n_solutions, 1)
+            self.assertTrue(is_valid(result.solution))
+            self.assertTrue(is_consistent(result.solution, init))
+
+    def test_not_unique(self):
+        result = solve(EMPTY)
+        self.assertEqual(result.n_solutions, 2)
+        self.assertTrue(is_valid(result.solution))
+
+    def test_conflicting_givens(self):
+        result = solve(parse_puzzle("11" + "." * 79))
+        self.assertIsNone(result.solution)
+        self.assertEqual(result.n_solutions, 0)
+
+    def test_parse(self):
+        line = "".join(str(v) for row in PUZZLES[6] for v in row)
+        numpy.testing.assert_array_equal(
+            parse_puzzle(line.replace("0", ".")), PUZZLES[6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from balanced_random.sweep import grid, random_search, summarise_spikes
+
+
+class TestSweep(unittest.TestCase):
+
+    def test_grid(self):
+        points = grid(b=[1, 2], a=[3])
+        self.assertEqual(points, [{"a": 3, "b": 1}, {"a": 3, "b": 2}])
+
+    def test_random_search(self):
+        points = random_search(5, 1, x=(1.0, 2.0))
+        self.assertEqual(points, random_search(5, 1, x=(1.0, 2.0)))
+        self.assertTrue(all(1.0 <= point["x"] < 2.0 for point in points))
+
+    def test_summarise_spikes(self):
+        # Neuron 0 fires regularly every 10 ms, neuron 1 twice, 2 never
+        times = numpy.arange(0.0, 1000.0, 10.0)
+        spikes = numpy.concatenate([
+            numpy.column_stack((numpy.zeros(100), times)),
+            [[1, 5.0], [1, 1500.0]]])
+        summary = summarise_spikes(spikes, 3, ((1000, 0.0), (1000, 5.0)))
+        self.assertEqual(summary["n_spikes"], 102)
+        self.assertAlmostEqual(summary["rate_0_0Hz"], 101 / 3.0)
+        self.assertAlmostEqual(summary["rate_1_5Hz"], 1 / 3.0)
+        self.assertAlmostEqual(summary["silent_fraction"], 1 / 3.0)
+        self.assertAlmostEqual(summary["mean_cv_isi"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+import unittest
+from sudoku.visualiser import VisualiserSupervisor
+
+# Writes far more than a pipe buffer holds before exiting
+_CHATTY = (
+    "import sys\n"
+    "for i in range(200000):\n"
+    "    print('line {} '.format(i) + 'x' * 64)\n"
+    "sys.exit(3)\n")
+
+_FOREVER = (
+    "import time\n"
+    "while True:\n"
+    "    print('still here', flush=True)\n"
+    "    time.sleep(0.01)\n")
+
+
+class TestVisualiserSupervisor(unittest.TestCase):
+
+    def test_chatty_child(self):
+        exit_codes = list()
+        supervisor = VisualiserSupervisor(
+            [sys.executable, "-c", _CHATTY], max_lines=100,
+            on_exit=exit_codes.append).start()
+        self.assertTrue(supervisor.wait(60))
+        self.assertEqual(supervisor.returncode, 3)
+        self.assertEqual(exit_codes, [3])
+        self.assertEqual(supervisor.n_lines, 200000)
+        log = supervisor.log
+        self.assertEqual(len(log), 100)
+        self.assertTrue(log[-1].startswith("line 199999 "))
+        supervisor.stop()
+
+    def test_stop(self):
+        supervisor = VisualiserSupervisor(
+            [sys.executable, "-c", _FOREVER]).start()
+        start = time.time()
+        while not supervisor.n_lines and time.time() - start < 30:
+            time.sleep(0.01)
+        self.assertFalse(supervisor.exited)
+        self.assertIsNone(supervisor.returncode)
+        supervisor.stop()
+        self.assertTrue(supervisor.wait(10))
+        self.assertEqual(supervisor.log[0], "still here")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import numpy
+from learning.stdp_offline import STDPParameters, weight_trajectories
+from learning.weight_snapshots import (
+    WeightSnapshots, WeightSnapshotWriter, snapshots_from_trajectories)
+
+
+class TestWeightSnapshots(unittest.TestCase):
+
+    def test_random_access(self):
+        rng = numpy.random.RandomState(1)
+        weights = rng.uniform(0.0, 5.0, 1000)
+        expected = list()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.snap")
+            with WeightSnapshotWriter(path, 1000, dtype="float64",
+                                      keyframe_interval=4) as writer:
+                for k in range(10):
+                    changed = rng.choice(1000, 50, replace=False)
+                    weights[changed] = rng.uniform(0.0, 5.0, 50)
+                    writer.append(k * 10.0, weights)
+                    expected.append(weights.copy())
+            # Appending to the file carries on from the last snapshot
+            with WeightSnapshotWriter(path, 1000, dtype="float64") as writer:
+                weights[:700] = 1.0
+                writer.append(100.0, weights)
+                expected.append(weights.copy())
+            snapshots = WeightSnapshots(path)
+            self.assertEqual(len(snapshots), 11)
+            numpy.testing.assert_array_equal(
+                snapshots.full.nonzero()[0], [0, 5, 10])
+            for k in [7, 2, 10, 3, 0, 9]:
+                numpy.testing.assert_array_equal(snapshots[k], expected[k])
+            numpy.testing.assert_array_equal(snapshots.at(45.0), expected[4])
+            indices, values = snapshots.changes(1)
+            self.assertEqual(len(indices), 50)
+            numpy.testing.assert_array_equal(values, expected[1][indices])
+
+            # A snapshot cut short is left out, then overwritten
+            with open(path, "ab") as f:
+                f.write(b"\xff" * 30)
+            self.assertEqual(len(WeightSnapshots(path)), 11)
+            with WeightSnapshotWriter(path, 1000, dtype="float64") as writer:
+                writer.append(110.0, weights)
+            self.assertEqual(len(WeightSnapshots(path)), 12)
+            self.assertEqual(os.path.getsize(path), snapshots.end + 17)
+
+    def test_from_trajectories(self):
+        rng = numpy.random.RandomState(2)
+        pre = numpy.column_stack((
+            rng.randint(20, size=400), rng.randint(1000, size=400)))
+        post = numpy.column_stack((
+            rng.randint(20, size=400), rng.randint(1000, size=400)))
+        trajectories = weight_trajectories(
+            pre, post, numpy.arange(20), rng.permutation(20), 2.0, 2.5,
+            STDPParameters(20.0, 20.0, 0.05, 0.05, 0.0, 5.0), n_pre=20,
+            n_post=20)
+        with tempfile.TemporaryDirectory() as directory:
+            snapshots = snapshots_from_trajectories(
+                trajectories, 1000.0, 75.0,
+                os.path.join(directory, "weights.snap"), dtype="float64")
+            self.assertEqual(len(snapshots), 15)
+            self.assertEqual(snapshots.times[-1], 1000.0)
+            for k, time in enumerate(snapshots.times):
+                numpy.testing.assert_array_equal(
+                    snapshots[k], trajectories.at(time))
+
+
+if __name__ == '__main__':
+    unittest.main()